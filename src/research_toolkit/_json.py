@@ -0,0 +1,33 @@
+"""JSON encode/decode shared by every layer, via orjson when the "fast" extra is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+
+try:  # optional "fast" extra
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse JSON; raises ValueError (both decoders' error types subclass it)."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Compact (or 2-space indented) UTF-8 JSON; *default* converts unsupported objects."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=default).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=default).encode()
+
+
+def dumps_line(obj: Any) -> bytes:
+    """One compact UTF-8 JSON line, newline included (for JSONL files)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return dumps(obj) + b"\n"
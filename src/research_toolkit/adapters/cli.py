@@ -2,65 +2,75 @@
 
 from __future__ import annotations
 
-import argparse
-import json
+import functools
 import sys
-import textwrap
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, NoReturn
 
-from research_toolkit.adapters.command_spec import COMMAND_SPEC
 from research_toolkit.adapters import presenters
+from research_toolkit.application.ports import SearchProvider
+
+if TYPE_CHECKING:
+    import argparse
+
+    from research_toolkit.domain.entities import SearchResult
 
 
 # ---------------------------------------------------------------------------
 # Help text
 # ---------------------------------------------------------------------------
-HELP_TEXT = textwrap.dedent("""\
-    Research Toolkit – search, store, summarize, query with citations.
-    Uses Ollama (local LLM) by default; falls back to Gemini or OpenAI.
-
-    Usage:
-      tool <command> [options]
-
-    Commands:
-      help [cmd]      Show help (or help for a specific command)
-      spec            Output machine-readable command spec (JSON)
-      doctor          Validate environment, storage, connectivity
-      models          List available Ollama models
-      search          Search the web and store results
-      ingest          Ingest a local file or URL
-      summarize       Summarize a stored resource
-      query           Answer a question from the local library
-      show            Show details / content for a resource
-      list            List all stored resources
-      reindex         Rebuild index & fix titles
-      review          Review an artifact (image/PDF/text) with Gemini
-
-    Examples:
-      tool doctor
-      tool models
-      tool search "quantum computing breakthroughs" --max 5
-      tool search "AI safety" --recency 7d
-      tool ingest https://example.com/article
-      tool list
-      tool show abc123def456
-      tool summarize abc123def456
-      tool query "What are the risks of AGI?" --topk 3
-      tool query "latest news" --live
-      tool review screenshot.png --rubric rubrics/ui.json --json
-      tool review report.pdf --format md
-
-    LLM provider (set LLM_PROVIDER in .env or pass --provider):
-      auto   → prefer Ollama if running, then Gemini, then OpenAI  (default)
-      ollama → local only (requires Ollama daemon)
-      gemini → Google Gemini cloud (requires GEMINI_API_KEY)
-      openai → OpenAI cloud (requires OPENAI_API_KEY)
-
-    For detailed help:  tool help <command>
-""")
+HELP_TEXT = """\
+Research Toolkit – search, store, summarize, query with citations.
+Uses Ollama (local LLM) by default; falls back to Gemini or OpenAI.
+
+Usage:
+  tool <command> [options]
+
+Commands:
+  help [cmd]      Show help (or help for a specific command)
+  spec [cmd]      Output machine-readable command spec (JSON)
+  doctor          Validate environment, storage, connectivity
+  models          List available Ollama models
+  search          Search the web and store results
+  ingest          Ingest a local file or URL
+  summarize       Summarize a stored resource
+  query           Answer a question from the local library
+  show            Show details / content for a resource
+  list            List all stored resources
+  reindex         Rebuild index & fix titles
+  review          Review an artifact (image/PDF/text) with Gemini
+
+Examples:
+  tool doctor
+  tool models
+  tool search "quantum computing breakthroughs" --max 5
+  tool search "AI safety" --recency 7d
+  tool ingest https://example.com/article
+  tool list
+  tool show abc123def456
+  tool summarize abc123def456
+  tool query "What are the risks of AGI?" --topk 3
+  tool query "latest news" --live
+  tool review screenshot.png --rubric rubrics/ui.json --json
+  tool review report.pdf --format md
+
+LLM provider (set LLM_PROVIDER in .env or pass --provider):
+  auto   → prefer Ollama if running, then Gemini, then OpenAI  (default)
+  ollama → local only (requires Ollama daemon)
+  gemini → Google Gemini cloud (requires GEMINI_API_KEY)
+  openai → OpenAI cloud (requires OPENAI_API_KEY)
+
+For detailed help:  tool help <command>
+"""
 
 COMMAND_HELP: dict[str, str] = {
     "help": "Usage: tool help [<command>]\n\nShow general help or help for a specific command.",
-    "spec": "Usage: tool spec\n\nOutputs the full machine-readable command spec as JSON.\nUseful for agent onboarding.",
+    "spec": (
+        "Usage: tool spec [<command>]\n\n"
+        "Outputs the full machine-readable command spec as JSON.\n"
+        "Useful for agent onboarding.\n"
+        "  command   Only output the spec for this command"
+    ),
     "doctor": (
         "Usage: tool doctor [--json]\n\n"
         "Runs diagnostic checks:\n"
@@ -89,10 +99,11 @@ COMMAND_HELP: dict[str, str] = {
         "  --json       Output as JSON"
     ),
     "summarize": (
-        "Usage: tool summarize <resource_id> [--format md|json] [--json]\n\n"
+        "Usage: tool summarize <resource_id> [--format md|json] [--no-cache] [--json]\n\n"
         "Generate a summary with citations for a stored resource.\n"
         "  resource_id  The ID of the resource (shown by 'tool list')\n"
         "  --format     Output format: md (default) or json\n"
+        "  --no-cache   Always call the model, even if the content is unchanged\n"
         "  --json       Raw JSON output"
     ),
     "query": (
@@ -121,7 +132,7 @@ COMMAND_HELP: dict[str, str] = {
     ),
     "review": (
         "Usage: tool review <path> [--rubric rubric.json] [--format json|md] "
-        "[--model MODEL] [--thinking high|low] [--json]\n\n"
+        "[--model MODEL] [--thinking high|low] [--no-cache] [--json]\n\n"
         "Review an artifact file using Gemini multimodal AI.\n"
         "Supported formats: PNG, JPG, PDF, Markdown, text, JSON, CSV, HTML.\n\n"
         "  path       Path to the artifact file\n"
@@ -129,14 +140,35 @@ COMMAND_HELP: dict[str, str] = {
         "  --format   Output format: json (default) or md\n"
         "  --model    Gemini model to use (default: gemini-2.0-flash)\n"
         "  --thinking Thinking budget: high or low (optional)\n"
+        "  --no-cache Always call the model, even for an identical earlier review\n"
         "  --json     Raw JSON output to stdout"
     ),
 }
 
 
+# ---------------------------------------------------------------------------
+# JSON output (orjson when installed, stdlib otherwise)
+# ---------------------------------------------------------------------------
+def _dump_json(obj: Any, *, indent: bool = True) -> str:
+    return presenters.encode_json(obj, indent=indent).decode()
+
+
+# ---------------------------------------------------------------------------
+# stderr helpers (look up sys.stderr per call so redirection keeps working)
+# ---------------------------------------------------------------------------
+def _err(*values: Any) -> None:
+    print(*values, file=sys.stderr)
+
+
+def _fatal(msg: str, code: int = 1) -> NoReturn:
+    _err(msg)
+    sys.exit(code)
+
+
 # ---------------------------------------------------------------------------
 # Parse recency string like "7d" -> int days
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=16)
 def _parse_recency(value: str | None) -> int | None:
     if value is None:
         return None
@@ -147,100 +179,228 @@ def _parse_recency(value: str | None) -> int | None:
 
 
 # ---------------------------------------------------------------------------
-# Build container (lazy import to avoid circular deps)
+# Dependency builders (lazy import so each command only pays for what it uses)
 # ---------------------------------------------------------------------------
-def _build_container(provider_override: str | None = None) -> dict:
-    """Build the dependency container from config.
+# Set per invocation by run_cli: --json runs keep stderr free of info lines.
+_quiet_logs = False
 
-    *provider_override* can be ``"ollama"``, ``"openai"``, or ``None``
-    (which respects the ``LLM_PROVIDER`` env-var / ``auto`` default).
-    """
+
+@functools.lru_cache(maxsize=None)
+def _build_core() -> dict:
+    """Config, logger and clock – needed by almost every command."""
     from research_toolkit.infrastructure.config import load_config
     from research_toolkit.infrastructure.logger import ConsoleLogger
     from research_toolkit.infrastructure.clock import WallClock
+
+    return {
+        "config": load_config(),
+        "logger": ConsoleLogger(quiet=_quiet_logs),
+        "clock": WallClock(),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _build_store():
     from research_toolkit.infrastructure.filesystem_store import FilesystemStore
-    from research_toolkit.infrastructure.jsonl_indexer import JsonlIndexer
-    from research_toolkit.infrastructure.html_snapshotter import HtmlSnapshotter
 
-    config = load_config()
-    logger = ConsoleLogger()
-    clock = WallClock()
     store = FilesystemStore("research")
     store.ensure_dirs()
-    indexer = JsonlIndexer("research/library.jsonl")
-    snapshotter = HtmlSnapshotter()
+    return store
+
+
+@functools.lru_cache(maxsize=None)
+def _build_indexer():
+    from research_toolkit.infrastructure.jsonl_indexer import JsonlIndexer
+
+    return JsonlIndexer("research/library.jsonl")
+
+
+@functools.lru_cache(maxsize=None)
+def _build_snapshotter():
+    from research_toolkit.infrastructure.html_snapshotter import HtmlSnapshotter
 
-    # Search provider (pick first available)
-    search_provider = None
+    return HtmlSnapshotter()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_search_provider(cached: bool = True):
+    """Return the first configured search provider, or ``None``.
+
+    With *cached*, identical searches within a day are answered from
+    ``research/cache/searches`` (recency-bounded ones always go out).
+    """
+    config = _build_core()["config"]
+    provider = None
     if config.get("BRAVE_API_KEY"):
         from research_toolkit.infrastructure.web_search_provider import BraveSearchProvider
-        search_provider = BraveSearchProvider(config["BRAVE_API_KEY"])  # type: ignore[arg-type]
+        provider = BraveSearchProvider(config["BRAVE_API_KEY"])  # type: ignore[arg-type]
     elif config.get("GOOGLE_API_KEY") and config.get("GOOGLE_CX"):
         from research_toolkit.infrastructure.web_search_provider import GoogleSearchProvider
-        search_provider = GoogleSearchProvider(config["GOOGLE_API_KEY"], config["GOOGLE_CX"])  # type: ignore[arg-type]
+        provider = GoogleSearchProvider(config["GOOGLE_API_KEY"], config["GOOGLE_CX"])  # type: ignore[arg-type]
     elif config.get("SERPAPI_KEY"):
         from research_toolkit.infrastructure.web_search_provider import SerpAPISearchProvider
-        search_provider = SerpAPISearchProvider(config["SERPAPI_KEY"])  # type: ignore[arg-type]
+        provider = SerpAPISearchProvider(config["SERPAPI_KEY"])  # type: ignore[arg-type]
+    if provider is None or not cached:
+        return provider
+    from research_toolkit.infrastructure.search_cache import CachedSearchProvider
+
+    return CachedSearchProvider(provider, "research")
+
+
+def _try_ollama(config: dict, preference: str, logger: Any) -> tuple | None:
+    from research_toolkit.infrastructure.ollama_provider import OllamaProvider
+
+    ollama_host = config.get("OLLAMA_HOST") or OllamaProvider.DEFAULT_HOST
+    # An explicit "ollama" preference always re-probes; "auto" may reuse
+    # a recent probe result.
+    if OllamaProvider.is_available(ollama_host, use_cache=preference == "auto"):
+        model = config.get("OLLAMA_MODEL") or "qwen2.5:3b"
+        logger.info(f"LLM: Ollama → {model}")
+        return OllamaProvider(model=model, host=ollama_host), f"ollama ({model})"
+    if preference == "ollama":
+        logger.error("Ollama requested but daemon not reachable at " + str(ollama_host))
+    return None
+
 
-    # ── LLM provider (Ollama-first, Gemini, then OpenAI fallback) ────
+def _try_gemini(config: dict, preference: str, logger: Any) -> tuple | None:
+    gemini_key = config.get("GEMINI_API_KEY")
+    if gemini_key:
+        from research_toolkit.infrastructure.gemini_provider import GeminiProvider
+
+        gemini_model = config.get("GEMINI_MODEL") or "gemini-2.0-flash"
+        logger.info(f"LLM: Gemini → {gemini_model}")
+        return GeminiProvider(api_key=gemini_key, model=gemini_model), f"gemini ({gemini_model})"
+    if preference == "gemini":
+        logger.error("Gemini requested but GEMINI_API_KEY not set in .env")
+    return None
+
+
+def _try_openai(config: dict, preference: str, logger: Any) -> tuple | None:
+    if config.get("OPENAI_API_KEY"):
+        from research_toolkit.infrastructure.openai_provider import OpenAIProvider
+
+        model = config.get("OPENAI_MODEL") or "gpt-4o-mini"
+        logger.info(f"LLM: OpenAI → {model}")
+        return OpenAIProvider(api_key=config["OPENAI_API_KEY"], model=model), f"openai ({model})"
+    return None
+
+
+# Tried in order under "auto"; an explicit preference tries only its own entry.
+_LLM_CANDIDATES: tuple[tuple[str, Callable[[dict, str, Any], tuple | None]], ...] = (
+    ("ollama", _try_ollama),
+    ("gemini", _try_gemini),
+    ("openai", _try_openai),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_llm_provider(provider_override: str | None = None) -> tuple:
+    """Resolve the LLM provider (Ollama-first, Gemini, then OpenAI fallback).
+
+    *provider_override* can be ``"ollama"``, ``"gemini"``, ``"openai"``, or
+    ``None`` (which respects the ``LLM_PROVIDER`` env-var / ``auto`` default).
+    Returns ``(provider, display_name)``; provider is ``None`` if unavailable.
+    """
+    core = _build_core()
+    config = core["config"]
     preference = provider_override or config.get("LLM_PROVIDER", "auto")
-    llm_provider = None
-    llm_provider_name = "none"
-
-    if preference in ("ollama", "auto"):
-        from research_toolkit.infrastructure.ollama_provider import OllamaProvider
-
-        ollama_host = config.get("OLLAMA_HOST") or OllamaProvider.DEFAULT_HOST
-        if OllamaProvider.is_available(ollama_host):
-            model = config.get("OLLAMA_MODEL") or "qwen2.5:3b"
-            llm_provider = OllamaProvider(
-                model=model,  # type: ignore[arg-type]
-                host=ollama_host,  # type: ignore[arg-type]
-            )
-            llm_provider_name = f"ollama ({model})"
-            logger.info(f"LLM: Ollama → {model}")
-        elif preference == "ollama":
-            logger.error("Ollama requested but daemon not reachable at " + str(ollama_host))
-
-    if llm_provider is None and preference in ("gemini", "auto"):
-        gemini_key = config.get("GEMINI_API_KEY")
-        if gemini_key:
-            from research_toolkit.infrastructure.gemini_provider import GeminiProvider
-
-            gemini_model = config.get("GEMINI_MODEL") or "gemini-2.0-flash"
-            llm_provider = GeminiProvider(
-                api_key=gemini_key,
-                model=gemini_model,
-            )
-            llm_provider_name = f"gemini ({gemini_model})"
-            logger.info(f"LLM: Gemini → {gemini_model}")
-        elif preference == "gemini":
-            logger.error("Gemini requested but GEMINI_API_KEY not set in .env")
-
-    if llm_provider is None and preference in ("openai", "auto"):
-        if config.get("OPENAI_API_KEY"):
-            from research_toolkit.infrastructure.openai_provider import OpenAIProvider
-
-            llm_provider = OpenAIProvider(
-                api_key=config["OPENAI_API_KEY"],  # type: ignore[arg-type]
-                model=config.get("OPENAI_MODEL") or "gpt-4o-mini",  # type: ignore[arg-type]
-            )
-            llm_provider_name = f"openai ({config.get('OPENAI_MODEL', 'gpt-4o-mini')})"
-            logger.info(f"LLM: OpenAI → {config.get('OPENAI_MODEL', 'gpt-4o-mini')}")
+    for name, try_provider in _LLM_CANDIDATES:
+        if preference not in (name, "auto"):
+            continue
+        resolved = try_provider(config, preference, core["logger"])
+        if resolved is not None:
+            return resolved
+    return None, "none"
+
+
+@functools.lru_cache(maxsize=None)
+def _build_llm_multimodal_provider(model: str | None = None) -> tuple:
+    """Resolve the Gemini multimodal provider used by ``review``.
+
+    Returns ``(provider, model)``; provider is ``None`` without a Gemini key.
+    """
+    config = _build_core()["config"]
+    model = model or config.get("GEMINI_MODEL") or "gemini-2.0-flash"
+    gemini_key = config.get("GEMINI_API_KEY")
+    if not gemini_key:
+        return None, model
+
+    from research_toolkit.infrastructure.gemini_multimodal_provider import GeminiMultimodalProvider
+
+    return GeminiMultimodalProvider(api_key=gemini_key, model=model), model
+
 
+_BUILDERS = (
+    _build_core,
+    _build_store,
+    _build_indexer,
+    _build_snapshotter,
+    _build_search_provider,
+    _build_llm_provider,
+    _build_llm_multimodal_provider,
+)
+
+
+def _reset_builders() -> None:
+    """Drop cached dependencies so each CLI invocation starts fresh."""
+    for builder in _BUILDERS:
+        builder.cache_clear()
+
+
+def _build_container(
+    provider_override: str | None = None,
+    *,
+    need_store: bool = True,
+    need_index: bool = True,
+    need_search: bool = True,
+    need_llm: bool = True,
+    need_llm_multimodal: bool = False,
+    multimodal_model: str | None = None,
+) -> dict:
+    """Build the dependency container from config.
+
+    The ``need_*`` flags skip dependencies a command won't use; skipped
+    entries are ``None`` so the container always has the same keys.
+    """
+    llm_provider, llm_provider_name = (
+        _build_llm_provider(provider_override) if need_llm else (None, "none")
+    )
+    llm_multimodal_provider, llm_multimodal_model = (
+        _build_llm_multimodal_provider(multimodal_model) if need_llm_multimodal else (None, None)
+    )
     return {
-        "config": config,
-        "logger": logger,
-        "clock": clock,
-        "store": store,
-        "indexer": indexer,
-        "snapshotter": snapshotter,
-        "search_provider": search_provider,
+        **_build_core(),
+        "store": _build_store() if need_store else None,
+        "indexer": _build_indexer() if need_index else None,
+        "snapshotter": _build_snapshotter() if need_search else None,
+        "search_provider": _build_search_provider() if need_search else None,
         "llm_provider": llm_provider,
         "llm_provider_name": llm_provider_name,
+        "llm_multimodal_provider": llm_multimodal_provider,
+        "llm_multimodal_model": llm_multimodal_model,
     }
 
 
+def _require_llm(provider_override: str | None = None):
+    """Return the resolved LLM provider or exit with setup instructions."""
+    llm_provider, _ = _build_llm_provider(provider_override)
+    if llm_provider is None:
+        _fatal(
+            "ERROR: No LLM provider available.\n"
+            "  • Start Ollama (ollama serve) for local inference, OR\n"
+            "  • Set OPENAI_API_KEY in .env for cloud inference."
+        )
+    return llm_provider
+
+
+def _require_search():
+    """Return the configured search provider or exit."""
+    search_provider = _build_search_provider()
+    if search_provider is None:
+        _fatal("ERROR: No search provider configured. Set a search API key in .env")
+    return search_provider
+
+
 # ---------------------------------------------------------------------------
 # Command handlers
 # ---------------------------------------------------------------------------
@@ -256,12 +416,22 @@ def cmd_help(args: argparse.Namespace) -> None:
         print(HELP_TEXT)
 
 
-def cmd_spec(_args: argparse.Namespace) -> None:
-    print(json.dumps(COMMAND_SPEC, indent=2))
+def cmd_spec(args: argparse.Namespace) -> None:
+    if args.command:
+        from research_toolkit.adapters.command_spec import COMMAND_SUMMARY, get_command_spec
+
+        if args.command not in COMMAND_SUMMARY:
+            _fatal(f"Unknown command: {args.command}")
+        presenters.write_stdout(presenters.encode_json(get_command_spec(args.command)) + b"\n")
+        return
+
+    from research_toolkit.adapters.command_spec import COMMAND_SPEC_JSON
+
+    presenters.write_stdout(COMMAND_SPEC_JSON + b"\n")
 
 
 def cmd_doctor(args: argparse.Namespace) -> None:
-    c = _build_container(getattr(args, "provider", None))
+    c = _build_container(args.provider)
     from research_toolkit.application.use_cases.doctor_checks import DoctorChecks
 
     uc = DoctorChecks(
@@ -272,24 +442,22 @@ def cmd_doctor(args: argparse.Namespace) -> None:
         logger=c["logger"],
     )
     resp = uc.execute()
-    presenters.present_doctor(resp, as_json=getattr(args, "json", False))
+    presenters.present_doctor(resp, as_json=args.json)
 
 
 def cmd_search(args: argparse.Namespace) -> None:
-    c = _build_container(getattr(args, "provider", None))
-    if c["search_provider"] is None:
-        print("ERROR: No search provider configured. Set a search API key in .env", file=sys.stderr)
-        sys.exit(1)
+    search_provider = _require_search()
 
     from research_toolkit.application.use_cases.run_search import RunSearch, RunSearchRequest
 
+    core = _build_core()
     uc = RunSearch(
-        search_provider=c["search_provider"],
-        snapshotter=c["snapshotter"],
-        store=c["store"],
-        indexer=c["indexer"],
-        clock=c["clock"],
-        logger=c["logger"],
+        search_provider=search_provider,
+        snapshotter=_build_snapshotter(),
+        store=_build_store(),
+        indexer=_build_indexer(),
+        clock=core["clock"],
+        logger=core["logger"],
     )
     req = RunSearchRequest(
         query=args.query,
@@ -301,61 +469,49 @@ def cmd_search(args: argparse.Namespace) -> None:
 
 
 def cmd_ingest(args: argparse.Namespace) -> None:
-    c = _build_container(getattr(args, "provider", None))
     from research_toolkit.application.use_cases.ingest_resource import IngestResource, IngestRequest
 
+    core = _build_core()
     uc = IngestResource(
-        snapshotter=c["snapshotter"],
-        store=c["store"],
-        indexer=c["indexer"],
-        clock=c["clock"],
-        logger=c["logger"],
+        snapshotter=_build_snapshotter(),
+        store=_build_store(),
+        indexer=_build_indexer(),
+        clock=core["clock"],
+        logger=core["logger"],
     )
     resp = uc.execute(IngestRequest(path_or_url=args.path_or_url))
     presenters.present_ingest(resp.resource, resp.already_existed, as_json=args.json)
 
 
 def cmd_summarize(args: argparse.Namespace) -> None:
-    c = _build_container(getattr(args, "provider", None))
-    if c["llm_provider"] is None:
-        print(
-            "ERROR: No LLM provider available.\n"
-            "  • Start Ollama (ollama serve) for local inference, OR\n"
-            "  • Set OPENAI_API_KEY in .env for cloud inference.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+    llm_provider = _require_llm(args.provider)
 
     from research_toolkit.application.use_cases.summarize_resource import SummarizeResource, SummarizeRequest
 
     uc = SummarizeResource(
-        store=c["store"],
-        indexer=c["indexer"],
-        llm=c["llm_provider"],
-        logger=c["logger"],
+        store=_build_store(),
+        indexer=_build_indexer(),
+        llm=llm_provider,
+        logger=_build_core()["logger"],
+    )
+    resp = uc.execute(
+        SummarizeRequest(resource_id=args.resource_id, format=args.format, use_cache=not args.no_cache)
     )
-    resp = uc.execute(SummarizeRequest(resource_id=args.resource_id, format=args.format))
     presenters.present_summarize(resp, as_json=args.json)
 
 
 def cmd_query(args: argparse.Namespace) -> None:
-    c = _build_container(getattr(args, "provider", None))
-    if c["llm_provider"] is None:
-        print(
-            "ERROR: No LLM provider available.\n"
-            "  • Start Ollama (ollama serve) for local inference, OR\n"
-            "  • Set OPENAI_API_KEY in .env for cloud inference.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+    llm_provider = _require_llm(args.provider)
+    c = _build_container(args.provider)
 
     from research_toolkit.application.use_cases.query_library import QueryLibrary, QueryRequest
 
     uc = QueryLibrary(
         store=c["store"],
         indexer=c["indexer"],
-        llm=c["llm_provider"],
-        search_provider=c["search_provider"] or _null_search_provider(),
+        llm=llm_provider,
+        # --live wants fresh results, not a day-old cached search
+        search_provider=(_build_search_provider(cached=False) if args.live else None) or _null_search_provider(),
         snapshotter=c["snapshotter"],
         clock=c["clock"],
         logger=c["logger"],
@@ -366,92 +522,88 @@ def cmd_query(args: argparse.Namespace) -> None:
 
 
 def cmd_list(args: argparse.Namespace) -> None:
-    c = _build_container(getattr(args, "provider", None))
     from research_toolkit.application.use_cases.list_resources import ListResources
 
-    uc = ListResources(indexer=c["indexer"], logger=c["logger"])
+    uc = ListResources(indexer=_build_indexer(), logger=_build_core()["logger"])
     resp = uc.execute()
     presenters.present_list(resp, as_json=args.json)
 
 
 def cmd_reindex(args: argparse.Namespace) -> None:
     """Rebuild library index and fix titles (e.g. after frontmatter fix)."""
-    c = _build_container(getattr(args, "provider", None))
     from research_toolkit.application.use_cases.reindex import Reindex
 
-    uc = Reindex(store=c["store"], indexer=c["indexer"], logger=c["logger"])
+    uc = Reindex(store=_build_store(), indexer=_build_indexer(), logger=_build_core()["logger"])
     result = uc.execute()
 
-    if getattr(args, "json", False):
-        print(json.dumps({
+    if args.json:
+        print(_dump_json({
             "total": result.total,
             "titles_fixed": result.titles_fixed,
             "errors": result.errors,
-        }, indent=2))
+        }))
     else:
         print(f"Reindexed {result.total} resources. Titles fixed: {result.titles_fixed}.")
         if result.errors:
             for e in result.errors:
-                print(f"  ERROR: {e}", file=sys.stderr)
+                _err(f"  ERROR: {e}")
 
 
 def cmd_review(args: argparse.Namespace) -> None:
     """Review an artifact file with Gemini multimodal AI."""
-    from research_toolkit.infrastructure.config import load_config
-    from research_toolkit.infrastructure.gemini_multimodal_provider import GeminiMultimodalProvider
-    from research_toolkit.infrastructure.logger import ConsoleLogger
-    from research_toolkit.infrastructure.clock import WallClock
-    from research_toolkit.infrastructure.filesystem_store import FilesystemStore
-    from research_toolkit.application.use_cases.review_artifact import ReviewArtifact, ReviewRequest
-
-    config = load_config()
-    gemini_key = config.get("GEMINI_API_KEY")
-    if not gemini_key:
-        print(
+    c = _build_container(
+        need_index=False,
+        need_search=False,
+        need_llm=False,
+        need_llm_multimodal=True,
+        multimodal_model=args.model,
+    )
+    llm = c["llm_multimodal_provider"]
+    if llm is None:
+        _fatal(
             "ERROR: GEMINI_API_KEY not set.\n"
             "  The review command requires a Gemini API key.\n"
-            "  Add GEMINI_API_KEY=... to your .env file.",
-            file=sys.stderr,
+            "  Add GEMINI_API_KEY=... to your .env file."
         )
-        sys.exit(1)
 
-    model = getattr(args, "model", None) or config.get("GEMINI_MODEL") or "gemini-2.0-flash"
-    logger = ConsoleLogger()
-    clock = WallClock()
-    store = FilesystemStore("research")
-    store.ensure_dirs()
-
-    llm = GeminiMultimodalProvider(api_key=gemini_key, model=model)
+    from research_toolkit.application.use_cases.review_artifact import ReviewArtifact, ReviewRequest
+    from research_toolkit.infrastructure.review_cache import FilesystemReviewCache
 
-    uc = ReviewArtifact(llm=llm, store=store, clock=clock, logger=logger)
+    model = c["llm_multimodal_model"]
+    store = c["store"]
+    uc = ReviewArtifact(
+        llm=llm,
+        store=store,
+        clock=c["clock"],
+        logger=c["logger"],
+        cache=FilesystemReviewCache(store.base_path()),
+    )
     req = ReviewRequest(
         artifact_path=args.path,
-        rubric_path=getattr(args, "rubric", None),
-        output_format=getattr(args, "format", "json"),
+        rubric_path=args.rubric,
+        output_format=args.format,
         model=model,
-        thinking=getattr(args, "thinking", None),
+        thinking=args.thinking,
+        use_cache=not args.no_cache,
     )
 
     resp = uc.execute(req)
-    as_md = getattr(args, "format", "json") == "md" and not getattr(args, "json", False)
-    presenters.present_review(resp, as_json=getattr(args, "json", False), as_md=as_md)
+    as_md = args.format == "md" and not args.json
+    presenters.present_review(resp, as_json=args.json, as_md=as_md)
 
 
 def cmd_models(args: argparse.Namespace) -> None:
     """List models available on the local Ollama instance."""
     from research_toolkit.infrastructure.ollama_provider import OllamaProvider
-    from research_toolkit.infrastructure.config import load_config
 
-    config = load_config()
-    host = config.get("OLLAMA_HOST") or OllamaProvider.DEFAULT_HOST
+    host = _build_core()["config"].get("OLLAMA_HOST") or OllamaProvider.DEFAULT_HOST
 
     if not OllamaProvider.is_available(host):
-        print(f"ERROR: Ollama is not reachable at {host}. Is the daemon running?", file=sys.stderr)
-        sys.exit(1)
+        _fatal(f"ERROR: Ollama is not reachable at {host}. Is the daemon running?")
 
     models = OllamaProvider.list_models(host)
-    if getattr(args, "json", False):
-        print(json.dumps({"models": models, "host": host}, indent=2))
+    if args.json:
+        print(_dump_json({"models": models, "host": host}))
         return
 
     from rich.console import Console
@@ -472,38 +624,38 @@ def cmd_models(args: argparse.Namespace) -> None:
 
 def cmd_show(args: argparse.Namespace) -> None:
     """Show metadata, content, or snippets for a stored resource."""
-    c = _build_container(getattr(args, "provider", None))
     from research_toolkit.domain.value_objects import ResourceId
 
     rid = ResourceId(args.resource_id)
-    store = c["store"]
-    resource = store.load_resource(rid)
-    if resource is None:
-        print(f"ERROR: Resource {args.resource_id} not found.", file=sys.stderr)
-        sys.exit(1)
+    store = _build_store()
+    field = args.field
+    as_json = args.json
 
-    field = getattr(args, "field", "meta")
-    as_json = getattr(args, "json", False)
+    # Only meta needs the parsed Resource; content/snippets just need to know
+    # the resource exists.
+    resource = store.load_resource(rid) if field == "meta" else None
+    if resource is None and (field == "meta" or not store.resource_exists(rid)):
+        _fatal(f"ERROR: Resource {args.resource_id} not found.")
 
     if field == "content":
         content = store.load_content(rid) or ""
         if as_json:
-            print(json.dumps({"resource_id": str(rid), "content": content}))
+            print(_dump_json({"resource_id": str(rid), "content": content}, indent=False))
         else:
             print(content)
     elif field == "snippets":
         snippets = store.load_snippets(rid)
         if as_json:
-            print(json.dumps({"resource_id": str(rid), "snippets": snippets}, indent=2))
+            print(_dump_json({"resource_id": str(rid), "snippets": snippets}))
         else:
             if not snippets:
                 print("No snippets stored for this resource.")
             for i, s in enumerate(snippets, 1):
                 print(f"[{i}] {s}")
     else:
-        data = resource.to_dict()
+        data = resource.to_dict()  # type: ignore[union-attr]
         if as_json:
-            print(json.dumps(data, indent=2))
+            print(_dump_json(data))
         else:
             from rich.console import Console
             console = Console()
@@ -514,124 +666,241 @@ def cmd_show(args: argparse.Namespace) -> None:
 # ---------------------------------------------------------------------------
 # Null search provider (for --live when no provider is set)
 # ---------------------------------------------------------------------------
-def _null_search_provider():
-    from research_toolkit.application.ports import SearchProvider
-    from research_toolkit.domain.entities import SearchResult
+class _NullSearch:
+    def search(self, query: str, *, max_results: int = 10, recency_days: int | None = None) -> list[SearchResult]:
+        return []
+
 
-    class NullSearch(SearchProvider):
-        def search(self, query: str, *, max_results: int = 10, recency_days: int | None = None) -> list[SearchResult]:
-            return []
+_NULL_SEARCH = _NullSearch()
 
-    return NullSearch()
+
+def _null_search_provider() -> SearchProvider:
+    return _NULL_SEARCH
 
 
 # ---------------------------------------------------------------------------
 # Argument parser
 # ---------------------------------------------------------------------------
-def build_parser() -> argparse.ArgumentParser:
+_PROVIDER_CHOICES = ("ollama", "gemini", "openai", "auto")
+
+# Per-command argument layout shared by the argparse builders and the fast
+# path.  Positionals are ``(dest, required)``; options map a flag to
+# ``(type, default, choices)`` where a ``None`` type means ``store_true``.
+_ARG_SPECS: dict[str, tuple[tuple[tuple[str, bool], ...], dict[str, tuple[Any, Any, Any]]]] = {
+    "help": ((("command", False),), {}),
+    "spec": ((("command", False),), {}),
+    "doctor": ((), {
+        "--json": (None, False, None),
+        "--provider": (str, None, _PROVIDER_CHOICES),
+    }),
+    "models": ((), {
+        "--json": (None, False, None),
+    }),
+    "search": ((("query", True),), {
+        "--recency": (str, None, None),
+        "--max": (int, 10, None),
+        "--json": (None, False, None),
+    }),
+    "ingest": ((("path_or_url", True),), {
+        "--json": (None, False, None),
+    }),
+    "summarize": ((("resource_id", True),), {
+        "--format": (str, "md", ("md", "json")),
+        "--no-cache": (None, False, None),
+        "--json": (None, False, None),
+        "--provider": (str, None, _PROVIDER_CHOICES),
+    }),
+    "query": ((("question", True),), {
+        "--topk": (int, 5, None),
+        "--live": (None, False, None),
+        "--json": (None, False, None),
+        "--provider": (str, None, _PROVIDER_CHOICES),
+    }),
+    "show": ((("resource_id", True),), {
+        "--field": (str, "meta", ("meta", "content", "snippets")),
+        "--json": (None, False, None),
+    }),
+    "list": ((), {
+        "--json": (None, False, None),
+    }),
+    "reindex": ((), {
+        "--json": (None, False, None),
+    }),
+    "review": ((("path", True),), {
+        "--rubric": (str, None, None),
+        "--format": (str, "json", ("json", "md")),
+        "--model": (str, None, None),
+        "--thinking": (str, None, ("high", "low")),
+        "--no-cache": (None, False, None),
+        "--json": (None, False, None),
+    }),
+}
+
+_HANDLERS: dict[str, Callable[[Any], None]] = {
+    "help": cmd_help,
+    "spec": cmd_spec,
+    "doctor": cmd_doctor,
+    "models": cmd_models,
+    "search": cmd_search,
+    "ingest": cmd_ingest,
+    "summarize": cmd_summarize,
+    "query": cmd_query,
+    "show": cmd_show,
+    "list": cmd_list,
+    "reindex": cmd_reindex,
+    "review": cmd_review,
+}
+
+
+def _add_subparser(sub, command: str) -> None:
+    positionals, options = _ARG_SPECS[command]
+    p_cmd = sub.add_parser(command, add_help=False)
+    for dest, required in positionals:
+        if required:
+            p_cmd.add_argument(dest, type=str)
+        else:
+            p_cmd.add_argument(dest, nargs="?", default=None)
+    for flag, (type_, default, choices) in options.items():
+        if type_ is None:
+            p_cmd.add_argument(flag, action="store_true", default=default)
+        else:
+            p_cmd.add_argument(flag, type=type_, default=default, choices=choices)
+    p_cmd.set_defaults(func=_HANDLERS[command])
+
+
+def _dest(flag: str) -> str:
+    """argparse's attribute name for *flag* (``--no-cache`` -> ``no_cache``)."""
+    return flag[2:].replace("-", "_")
+
+
+def _fast_parse(argv: list[str]) -> tuple[str, dict[str, Any]] | None:
+    """Scan *argv* against ``_ARG_SPECS`` without importing argparse.
+
+    Returns ``(command, values)`` for the common, well-formed case and
+    ``None`` for anything unusual (unknown or abbreviated flags, bad values,
+    ``--``, wrong positional count) so argparse can handle it – including
+    producing the error message.  Subcommands intentionally have no
+    ``--help`` flag (users run ``tool help <cmd>``), so the fast path never
+    needs to render usage text.
+    """
+    command, rest = argv[0], argv[1:]
+    spec = _ARG_SPECS.get(command)
+    if spec is None:
+        return None
+    positionals, options = spec
+
+    values: dict[str, Any] = {_dest(flag): default for flag, (_, default, _) in options.items()}
+    found: list[str] = []
+    i = 0
+    while i < len(rest):
+        token = rest[i]
+        if token.startswith("-"):
+            flag, eq, inline = token.partition("=")
+            opt = options.get(flag)
+            if opt is None:
+                return None
+            type_, _, choices = opt
+            if type_ is None:
+                if eq:
+                    return None
+                values[_dest(flag)] = True
+            else:
+                if eq:
+                    raw = inline
+                else:
+                    i += 1
+                    if i >= len(rest) or rest[i].startswith("-"):
+                        return None
+                    raw = rest[i]
+                try:
+                    value = type_(raw)
+                except ValueError:
+                    return None
+                if choices is not None and value not in choices:
+                    return None
+                values[_dest(flag)] = value
+        else:
+            found.append(token)
+        i += 1
+
+    if len(found) > len(positionals):
+        return None
+    for idx, (dest, required) in enumerate(positionals):
+        if idx < len(found):
+            values[dest] = found[idx]
+        elif required:
+            return None
+        else:
+            values[dest] = None
+    return command, values
+
+
+def build_parser_for(command: str | None) -> argparse.ArgumentParser:
+    """Build the top-level parser with only *command*'s subparser attached.
+
+    Pass ``None`` to attach every subparser (see :func:`build_parser`).
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="tool",
         description="Research Toolkit CLI",
         add_help=False,
     )
+    # Shared defaults so handlers can read ``args.provider`` / ``args.json``
+    # even on subcommands that don't declare those flags.
+    parser.set_defaults(provider=None, json=False)
     sub = parser.add_subparsers(dest="command")
+    if command is None:
+        for name in _ARG_SPECS:
+            _add_subparser(sub, name)
+    elif command in _ARG_SPECS:
+        _add_subparser(sub, command)
+    return parser
 
-    # help
-    p_help = sub.add_parser("help", add_help=False)
-    p_help.add_argument("command", nargs="?", default=None)
-    p_help.set_defaults(func=cmd_help)
-
-    # spec
-    p_spec = sub.add_parser("spec", add_help=False)
-    p_spec.set_defaults(func=cmd_spec)
-
-    # doctor
-    p_doctor = sub.add_parser("doctor", add_help=False)
-    p_doctor.add_argument("--json", action="store_true", default=False)
-    p_doctor.add_argument("--provider", type=str, default=None, choices=["ollama", "gemini", "openai", "auto"])
-    p_doctor.set_defaults(func=cmd_doctor)
-
-    # models
-    p_models = sub.add_parser("models", add_help=False)
-    p_models.add_argument("--json", action="store_true", default=False)
-    p_models.set_defaults(func=cmd_models)
-
-    # search
-    p_search = sub.add_parser("search", add_help=False)
-    p_search.add_argument("query", type=str)
-    p_search.add_argument("--recency", type=str, default=None)
-    p_search.add_argument("--max", type=int, default=10)
-    p_search.add_argument("--json", action="store_true", default=False)
-    p_search.set_defaults(func=cmd_search)
-
-    # ingest
-    p_ingest = sub.add_parser("ingest", add_help=False)
-    p_ingest.add_argument("path_or_url", type=str)
-    p_ingest.add_argument("--json", action="store_true", default=False)
-    p_ingest.set_defaults(func=cmd_ingest)
-
-    # summarize
-    p_summarize = sub.add_parser("summarize", add_help=False)
-    p_summarize.add_argument("resource_id", type=str)
-    p_summarize.add_argument("--format", type=str, default="md", choices=["md", "json"])
-    p_summarize.add_argument("--json", action="store_true", default=False)
-    p_summarize.add_argument("--provider", type=str, default=None, choices=["ollama", "gemini", "openai", "auto"])
-    p_summarize.set_defaults(func=cmd_summarize)
-
-    # query
-    p_query = sub.add_parser("query", add_help=False)
-    p_query.add_argument("question", type=str)
-    p_query.add_argument("--topk", type=int, default=5)
-    p_query.add_argument("--live", action="store_true", default=False)
-    p_query.add_argument("--json", action="store_true", default=False)
-    p_query.add_argument("--provider", type=str, default=None, choices=["ollama", "gemini", "openai", "auto"])
-    p_query.set_defaults(func=cmd_query)
-
-    # show
-    p_show = sub.add_parser("show", add_help=False)
-    p_show.add_argument("resource_id", type=str)
-    p_show.add_argument("--field", type=str, default="meta", choices=["meta", "content", "snippets"])
-    p_show.add_argument("--json", action="store_true", default=False)
-    p_show.set_defaults(func=cmd_show)
-
-    # list
-    p_list = sub.add_parser("list", add_help=False)
-    p_list.add_argument("--json", action="store_true", default=False)
-    p_list.set_defaults(func=cmd_list)
-
-    # reindex
-    p_reindex = sub.add_parser("reindex", add_help=False)
-    p_reindex.add_argument("--json", action="store_true", default=False)
-    p_reindex.set_defaults(func=cmd_reindex)
-
-    # review
-    p_review = sub.add_parser("review", add_help=False)
-    p_review.add_argument("path", type=str)
-    p_review.add_argument("--rubric", type=str, default=None)
-    p_review.add_argument("--format", type=str, default="json", choices=["json", "md"])
-    p_review.add_argument("--model", type=str, default=None)
-    p_review.add_argument("--thinking", type=str, default=None, choices=["high", "low"])
-    p_review.add_argument("--json", action="store_true", default=False)
-    p_review.set_defaults(func=cmd_review)
 
-    return parser
+def build_parser() -> argparse.ArgumentParser:
+    """Build the full parser with every subcommand registered."""
+    return build_parser_for(None)
+
+
+def _parse_args(argv: list[str]) -> Any:
+    """Parse *argv* (first item a known command) via the fast path or argparse.
+
+    Both paths produce a namespace with the same attributes.
+    """
+    parsed = _fast_parse(argv)
+    if parsed is None:
+        return build_parser_for(argv[0]).parse_args(argv)
+    command, values = parsed
+    return SimpleNamespace(
+        func=_HANDLERS[command], **{"command": command, "provider": None, "json": False, **values}
+    )
 
 
 def run_cli(argv: list[str] | None = None) -> None:
     """Parse args and dispatch to the appropriate command handler."""
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    global _quiet_logs
+    if argv is None:
+        argv = sys.argv[1:]
 
-    if not args.command:
+    if not argv:
         print(HELP_TEXT)
         return
 
-    if hasattr(args, "func"):
-        try:
-            args.func(args)
-        except Exception as exc:
-            from research_toolkit.infrastructure.config import redact_secrets
-            print(f"ERROR: {redact_secrets(str(exc))}", file=sys.stderr)
-            sys.exit(1)
-    else:
+    command = argv[0]
+    if command not in _ARG_SPECS:
+        _err(f"Unknown command: {command}")
         print(HELP_TEXT)
+        sys.exit(2)
+
+    args = _parse_args(argv)
+
+    _quiet_logs = args.json
+    _reset_builders()
+
+    try:
+        args.func(args)
+    except Exception as exc:
+        from research_toolkit.infrastructure.config import redact_secrets
+        _fatal(f"ERROR: {redact_secrets(str(exc))}")
@@ -2,25 +2,76 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import sys
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.table import Table
+from research_toolkit import _json
 
-from research_toolkit.application.use_cases.doctor_checks import DoctorResponse
-from research_toolkit.application.use_cases.list_resources import ListResponse
-from research_toolkit.application.use_cases.query_library import QueryResponse
-from research_toolkit.application.use_cases.review_artifact import ReviewResponse
-from research_toolkit.application.use_cases.run_search import RunSearchResponse
-from research_toolkit.application.use_cases.summarize_resource import SummarizeResponse
-from research_toolkit.domain.entities import Resource
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+    from research_toolkit.application.use_cases.doctor_checks import DoctorResponse
+    from research_toolkit.application.use_cases.list_resources import ListResponse
+    from research_toolkit.application.use_cases.query_library import QueryResponse
+    from research_toolkit.application.use_cases.review_artifact import ReviewResponse
+    from research_toolkit.application.use_cases.run_search import RunSearchResponse
+    from research_toolkit.application.use_cases.summarize_resource import SummarizeResponse
+    from research_toolkit.domain.entities import Resource
+
+_console: Console | None = None
+
+_check_fields = attrgetter("name", "passed", "message")
+
+# Rich style per review issue severity
+_SEV_COLORS = {
+    "critical": "red bold",
+    "major": "yellow",
+    "minor": "cyan",
+    "suggestion": "dim",
+}
+
+
+def _get_console() -> Console:
+    """Create the Rich console on first use so JSON-only runs never import Rich."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def _add_plain_rows(table: Any, rows: list[tuple[str, ...]]) -> None:
+    """Append rows of plain text, skipping Rich's per-cell markup parsing.
+
+    Titles and URLs come from the web and may contain ``[...]`` sequences
+    that Rich would otherwise try to interpret as markup.
+    """
+    from rich.text import Text
+
+    for row in rows:
+        table.add_row(*map(Text, row))
+
+
+def encode_json(data: Any, *, indent: bool = True) -> bytes:
+    """Serialize *data* to UTF-8 JSON, via orjson when it is installed."""
+    return _json.dumps(data, indent=indent, default=str)
+
+
+def write_stdout(payload: bytes) -> None:
+    """Write already-encoded UTF-8 bytes to stdout without re-encoding."""
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:  # e.g. a StringIO swapped in by tests
+        out.write(payload.decode())
+        return
+    out.flush()  # keep ordering with anything already printed
+    buffer.write(payload)
 
 
 def _json_out(data: Any) -> None:
-    print(json.dumps(data, indent=2, default=str))
+    write_stdout(encode_json(data) + b"\n")
 
 
 # ---------------------------------------------------------------------------
@@ -28,9 +79,16 @@ def _json_out(data: Any) -> None:
 # ---------------------------------------------------------------------------
 def present_doctor(resp: DoctorResponse, *, as_json: bool = False) -> None:
     if as_json:
-        _json_out({"checks": [{"name": c.name, "passed": c.passed, "message": c.message} for c in resp.checks]})
+        _json_out({
+            "checks": [
+                {"name": n, "passed": p, "message": m} for n, p, m in map(_check_fields, resp.checks)
+            ]
+        })
         return
 
+    from rich.table import Table
+
+    console = _get_console()
     table = Table(title="Doctor Checks", show_lines=True)
     table.add_column("Check", style="bold")
     table.add_column("Status")
@@ -57,16 +115,19 @@ def present_search(resp: RunSearchResponse, *, as_json: bool = False) -> None:
         })
         return
 
+    console = _get_console()
     console.print(f"\n[bold]Session:[/bold] {resp.session.session_id}")
     console.print(f"[bold]Resources stored:[/bold] {len(resp.resources)}  |  Skipped: {resp.skipped}\n")
 
     if resp.resources:
+        from rich.table import Table
+
         table = Table(show_lines=True)
         table.add_column("ID", style="cyan")
         table.add_column("Title")
         table.add_column("URL", style="dim")
-        for r in resp.resources:
-            table.add_row(str(r.id), r.title[:60], str(r.url)[:80])
+        rows = [(str(r.id), r.title[:60], str(r.url)[:80]) for r in resp.resources]
+        _add_plain_rows(table, rows)
         console.print(table)
 
 
@@ -78,6 +139,7 @@ def present_ingest(resource: Resource, already_existed: bool, *, as_json: bool =
         _json_out({"resource": resource.to_dict(), "already_existed": already_existed})
         return
 
+    console = _get_console()
     if already_existed:
         console.print(f"[yellow]Already exists:[/yellow] [{resource.id}] {resource.title}")
     else:
@@ -97,6 +159,7 @@ def present_summarize(resp: SummarizeResponse, *, as_json: bool = False) -> None
         })
         return
 
+    console = _get_console()
     console.print(f"\n[bold]Summary of [{resp.resource.id}]: {resp.resource.title}[/bold]\n")
     console.print(resp.summary.text)
     console.print("\n[bold]Citations:[/bold]")
@@ -118,6 +181,7 @@ def present_query(resp: QueryResponse, *, as_json: bool = False) -> None:
         })
         return
 
+    console = _get_console()
     console.print("\n[bold]Answer:[/bold]\n")
     console.print(resp.answer.text)
     if resp.answer.citations:
@@ -135,18 +199,21 @@ def present_list(resp: ListResponse, *, as_json: bool = False) -> None:
         _json_out({"resources": [r.to_dict() for r in resp.resources], "total": resp.total})
         return
 
+    console = _get_console()
     console.print(f"\n[bold]Library: {resp.total} resources[/bold]\n")
     if not resp.resources:
         console.print("[dim]No resources stored yet. Use 'tool search' or 'tool ingest' to add some.[/dim]")
         return
 
+    from rich.table import Table
+
     table = Table(show_lines=True)
     table.add_column("ID", style="cyan")
     table.add_column("Title")
     table.add_column("URL", style="dim")
     table.add_column("Captured", style="dim")
-    for r in resp.resources:
-        table.add_row(str(r.id), r.title[:50], str(r.url)[:60], str(r.captured_at)[:19])
+    rows = [(str(r.id), r.title[:50], str(r.url)[:60], str(r.captured_at)[:19]) for r in resp.resources]
+    _add_plain_rows(table, rows)
     console.print(table)
 
 
@@ -165,6 +232,7 @@ def present_review(resp: ReviewResponse, *, as_json: bool = False, as_md: bool =
         return
 
     # Rich table view (default)
+    console = _get_console()
     status = "[green bold]PASS[/green bold]" if report.passed else "[red bold]FAIL[/red bold]"
     console.print(f"\n[bold]Artifact Review[/bold]  Score: {report.overall_score}/100  {status}")
     if report.artifact:
@@ -173,6 +241,8 @@ def present_review(resp: ReviewResponse, *, as_json: bool = False, as_md: bool =
     console.print(f"\n[bold]Summary:[/bold] {report.summary}\n")
 
     if report.issues:
+        from rich.table import Table
+
         table = Table(title="Issues", show_lines=True)
         table.add_column("#", style="dim", width=3)
         table.add_column("Severity", width=10)
@@ -180,12 +250,7 @@ def present_review(resp: ReviewResponse, *, as_json: bool = False, as_md: bool =
         table.add_column("Location", style="dim")
         table.add_column("Fix")
         for i, issue in enumerate(report.issues, 1):
-            sev_color = {
-                "critical": "red bold",
-                "major": "yellow",
-                "minor": "cyan",
-                "suggestion": "dim",
-            }.get(issue.severity.value, "white")
+            sev_color = _SEV_COLORS.get(issue.severity.value, "white")
             table.add_row(
                 str(i),
                 f"[{sev_color}]{issue.severity.value.upper()}[/{sev_color}]",
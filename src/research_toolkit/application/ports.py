@@ -1,4 +1,4 @@
-"""Application ports – abstract interfaces that infrastructure must implement.
+"""Application ports – structural interfaces that infrastructure must implement.
 
 These are the boundaries of the application layer. Domain and application code
 depend only on these abstractions, never on concrete infrastructure.
@@ -6,9 +6,9 @@ depend only on these abstractions, never on concrete infrastructure.
 
 from __future__ import annotations
 
-import abc
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable, Protocol
 
 from research_toolkit.domain.entities import Resource, SearchResult
 from research_toolkit.domain.value_objects import ResourceId, Timestamp
@@ -17,10 +17,9 @@ from research_toolkit.domain.value_objects import ResourceId, Timestamp
 # ---------------------------------------------------------------------------
 # Search
 # ---------------------------------------------------------------------------
-class SearchProvider(abc.ABC):
+class SearchProvider(Protocol):
     """Port: web search engine."""
 
-    @abc.abstractmethod
     def search(
         self, query: str, *, max_results: int = 10, recency_days: int | None = None
     ) -> list[SearchResult]:
@@ -30,21 +29,46 @@ class SearchProvider(abc.ABC):
 # ---------------------------------------------------------------------------
 # LLM
 # ---------------------------------------------------------------------------
-class LLMProvider(abc.ABC):
-    """Port: large-language-model completions."""
+@dataclass(frozen=True)
+class LLMUsage:
+    """Token counts the provider reported for its most recent call."""
+
+    prompt_tokens: int = 0
+    cached_tokens: int = 0  # part of prompt_tokens served from the provider's prompt cache
+    completion_tokens: int = 0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        return self.cached_tokens / max(1, self.prompt_tokens)
+
+    def describe(self) -> str:
+        return (
+            f"tokens: prompt={self.prompt_tokens} cached={self.cached_tokens} "
+            f"({self.cache_hit_ratio:.0%} hit) completion={self.completion_tokens}"
+        )
+
+
+class LLMProvider(Protocol):
+    """Port: large-language-model completions.
+
+    Providers that can report token usage set ``last_usage`` (an
+    ``LLMUsage``) after each call, and most expose their configured
+    ``model`` name; callers read both with ``getattr`` since not every
+    implementation does.
+    """
 
-    @abc.abstractmethod
     def complete(self, prompt: str, *, system: str = "", max_tokens: int = 2048) -> str:
         ...
 
 
-class MultimodalLLMProvider(abc.ABC):
+class MultimodalLLMProvider(Protocol):
     """Port: multimodal LLM that accepts text + file attachments.
 
-    Attachments are a list of dicts: ``{"mime_type": str, "data": bytes}``.
+    Attachments are a list of dicts: ``{"mime_type": str, "data": bytes}``;
+    ``data`` may be any bytes-like object (e.g. a read-only ``mmap``).
+    Like ``LLMProvider``, implementations may expose ``last_usage``.
     """
 
-    @abc.abstractmethod
     def complete_multimodal(
         self,
         prompt: str,
@@ -60,57 +84,76 @@ class MultimodalLLMProvider(abc.ABC):
 # ---------------------------------------------------------------------------
 # Store (file I/O)
 # ---------------------------------------------------------------------------
-class Store(abc.ABC):
+class Store(Protocol):
     """Port: persistent resource storage."""
 
-    @abc.abstractmethod
     def save_resource(self, resource: Resource, content_md: str, raw_html: str | None = None) -> None:
         ...
 
-    @abc.abstractmethod
     def load_resource(self, resource_id: ResourceId) -> Resource | None:
+        """Return the stored resource, or None if it does not exist."""
         ...
 
-    @abc.abstractmethod
-    def load_content(self, resource_id: ResourceId) -> str | None:
+    def load_content(self, resource_id: ResourceId, max_chars: int | None = None) -> str | None:
+        """Return stored content, or only its first *max_chars* characters."""
         ...
 
-    @abc.abstractmethod
     def resource_exists(self, resource_id: ResourceId) -> bool:
         ...
 
-    @abc.abstractmethod
+    def resources_exist(self, resource_ids: Iterable[ResourceId]) -> set[ResourceId]:
+        """Return the subset of *resource_ids* that are stored, in one call."""
+        ...
+
     def save_snippets(self, resource_id: ResourceId, snippets: list[dict[str, Any]]) -> None:
         ...
 
-    @abc.abstractmethod
     def load_snippets(self, resource_id: ResourceId) -> list[dict[str, Any]]:
         ...
 
-    @abc.abstractmethod
+    def load_cached_summary(self, key: str) -> dict[str, Any] | None:
+        """Return a summary saved under *key*, or None on a miss."""
+        ...
+
+    def save_cached_summary(self, key: str, data: dict[str, Any]) -> None:
+        ...
+
     def save_session(self, session_dir: str, data: dict[str, Any]) -> None:
         ...
 
-    @abc.abstractmethod
     def save_session_output(self, session_dir: str, filename: str, content: str) -> None:
         ...
 
-    @abc.abstractmethod
+    def rewrite_library(self, resources: Iterable[Resource]) -> None:
+        """Replace the library listing with *resources*, swapped in atomically."""
+        ...
+
     def ensure_dirs(self) -> None:
         ...
 
-    @abc.abstractmethod
     def base_path(self) -> str:
         ...
 
 
+# ---------------------------------------------------------------------------
+# Review cache
+# ---------------------------------------------------------------------------
+class ReviewCache(Protocol):
+    """Port: reuse review reports for byte-identical LLM inputs."""
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        ...
+
+    def put(self, key: str, report: dict[str, Any]) -> None:
+        ...
+
+
 # ---------------------------------------------------------------------------
 # Snapshotter (HTML/PDF capture)
 # ---------------------------------------------------------------------------
-class Snapshotter(abc.ABC):
+class Snapshotter(Protocol):
     """Port: capture raw page snapshots."""
 
-    @abc.abstractmethod
     def capture(self, url: str) -> tuple[str | None, str | None]:
         """Return (extracted_text, raw_html). Either may be None on failure."""
         ...
@@ -119,37 +162,43 @@ class Snapshotter(abc.ABC):
 # ---------------------------------------------------------------------------
 # Indexer (search over local library)
 # ---------------------------------------------------------------------------
-class Indexer(abc.ABC):
+class Indexer(Protocol):
     """Port: index & search the local resource library."""
 
-    @abc.abstractmethod
     def index_resource(self, resource: Resource, content: str) -> None:
         ...
 
-    @abc.abstractmethod
+    def index_many(self, items: Iterable[tuple[Resource, str]]) -> None:
+        """Index several (resource, content) pairs in one call."""
+        ...
+
     def search_local(self, query: str, top_k: int = 5) -> list[ResourceId]:
         ...
 
-    @abc.abstractmethod
     def list_all(self) -> list[Resource]:
         ...
 
-    @abc.abstractmethod
     def remove(self, resource_id: ResourceId) -> None:
         ...
 
-    @abc.abstractmethod
+    def clear(self) -> None:
+        """Drop every indexed resource, ahead of a full rebuild."""
+        ...
+
     def healthy(self) -> bool:
         ...
 
+    def indexed_chars(self) -> int:
+        """How many leading characters of each resource's content are indexed."""
+        ...
+
 
 # ---------------------------------------------------------------------------
 # Clock
 # ---------------------------------------------------------------------------
-class Clock(abc.ABC):
+class Clock(Protocol):
     """Port: provides current time (makes testing deterministic)."""
 
-    @abc.abstractmethod
     def now(self) -> Timestamp:
         ...
 
@@ -157,21 +206,17 @@ class Clock(abc.ABC):
 # ---------------------------------------------------------------------------
 # Logger
 # ---------------------------------------------------------------------------
-class Logger(abc.ABC):
+class Logger(Protocol):
     """Port: structured logging with secret redaction."""
 
-    @abc.abstractmethod
     def info(self, msg: str, **kw: Any) -> None:
         ...
 
-    @abc.abstractmethod
     def warn(self, msg: str, **kw: Any) -> None:
         ...
 
-    @abc.abstractmethod
     def error(self, msg: str, **kw: Any) -> None:
         ...
 
-    @abc.abstractmethod
     def debug(self, msg: str, **kw: Any) -> None:
         ...
@@ -2,26 +2,76 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Mapping
+from urllib.parse import urlsplit
 
+from research_toolkit import _json
 from research_toolkit.application.ports import Indexer, LLMProvider, Logger, SearchProvider, Store
 
+if TYPE_CHECKING:
+    import httpx
 
-@dataclass
+# Environment variables the doctor checks read
+_ENV_KEYS = (
+    "BRAVE_API_KEY",
+    "GOOGLE_API_KEY",
+    "SERPAPI_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "LLM_PROVIDER",
+    "OLLAMA_HOST",
+)
+
+_OLLAMA_CLIENT: httpx.Client | None = None
+
+
+def _ollama_client() -> httpx.Client:
+    """Return a shared HTTP client for the Ollama probe (created lazily)."""
+    global _OLLAMA_CLIENT
+    if _OLLAMA_CLIENT is None:
+        import httpx
+
+        _OLLAMA_CLIENT = httpx.Client(timeout=3)
+    return _OLLAMA_CLIENT
+
+
+def _port_refused(url: str, timeout: float = 0.1) -> bool:
+    """Return True when a TCP connect to *url* is actively refused.
+
+    A stopped local daemon refuses in microseconds, letting the Ollama check
+    fail fast instead of waiting out the HTTP timeout.  A slow connect is
+    not treated as a refusal; the HTTP probe gets to decide.
+    """
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    port = parts.port or {"http": 80, "https": 443}.get(parts.scheme, 11434)
+    try:
+        with socket.create_connection((parts.hostname or "localhost", port), timeout=timeout):
+            return False
+    except ConnectionRefusedError:
+        return True
+    except OSError:
+        return False
+
+
+@dataclass(slots=True, frozen=True)
 class CheckResult:
     name: str
     passed: bool
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DoctorResponse:
-    checks: list[CheckResult] = field(default_factory=list)
+    checks: tuple[CheckResult, ...] = ()
+    all_passed: bool = field(init=False)
 
-    @property
-    def all_passed(self) -> bool:
-        return all(c.passed for c in self.checks)
+    def __post_init__(self) -> None:
+        self.all_passed = all(c.passed for c in self.checks)
 
 
 class DoctorChecks:
@@ -42,61 +92,50 @@ class DoctorChecks:
         self._log = logger
 
     def execute(self) -> DoctorResponse:
-        checks: list[CheckResult] = []
-
-        # 1. Environment variables
-        checks.append(self._check_env_vars())
-
-        # 2. Storage permissions
-        checks.append(self._check_storage())
-
-        # 3. Ollama local LLM
-        checks.append(self._check_ollama())
-
-        # 4. Gemini API key
-        checks.append(self._check_gemini())
-
-        # 5. Search provider
-        checks.append(self._check_search_provider())
-
-        # 6. LLM provider (resolved)
-        checks.append(self._check_llm_provider())
-
-        # 7. Index health
-        checks.append(self._check_index())
-
+        # Read the environment once up front; the checks only see this snapshot.
+        env = {k: os.environ.get(k) for k in _ENV_KEYS}
+        # The checks are independent and mostly I/O-bound (the Ollama probe
+        # can block for seconds), so run them concurrently.  ``map`` keeps
+        # the results in this order.
+        checks_to_run: list[tuple[str, Callable[[], CheckResult]]] = [
+            ("env_vars", functools.partial(self._check_env_vars, env)),
+            ("storage", self._check_storage),
+            ("ollama", functools.partial(self._check_ollama, env)),
+            ("gemini", functools.partial(self._check_gemini, env)),
+            ("search_provider", self._check_search_provider),
+            ("llm_provider", self._check_llm_provider),
+            ("index", self._check_index),
+        ]
+        with ThreadPoolExecutor(max_workers=len(checks_to_run)) as pool:
+            checks = tuple(pool.map(self._run_check, checks_to_run))
         return DoctorResponse(checks=checks)
 
-    def _check_env_vars(self) -> CheckResult:
+    @staticmethod
+    def _run_check(item: tuple[str, Callable[[], CheckResult]]) -> CheckResult:
+        name, check = item
+        try:
+            return check()
+        except Exception as e:
+            return CheckResult(name=name, passed=False, message=f"Check crashed: {e}")
+
+    def _check_env_vars(self, env: Mapping[str, str | None]) -> CheckResult:
         """Check that required env vars are set (without revealing values)."""
-        issues: list[str] = []
-        info: list[str] = []
+        has_search = bool(env.get("BRAVE_API_KEY") or env.get("GOOGLE_API_KEY") or env.get("SERPAPI_KEY"))
+        info = [
+            # OpenAI is optional when Ollama is available
+            "OPENAI_API_KEY set" if env.get("OPENAI_API_KEY") else "OPENAI_API_KEY not set (OK if using Ollama)",
+            "GEMINI_API_KEY set" if env.get("GEMINI_API_KEY") else "GEMINI_API_KEY not set (needed for review command)",
+            f"LLM_PROVIDER={env.get('LLM_PROVIDER') or 'auto'}",
+        ]
+        msg = "; ".join(info)
 
-        # Check for at least one search provider key
-        search_keys = ["BRAVE_API_KEY", "GOOGLE_API_KEY", "SERPAPI_KEY"]
-        has_search = any(os.environ.get(k) for k in search_keys)
+        # At least one search provider key is required
         if not has_search:
-            issues.append("No search API key (need one of: BRAVE_API_KEY, GOOGLE_API_KEY, SERPAPI_KEY)")
-
-        # OpenAI is optional when Ollama is available
-        if os.environ.get("OPENAI_API_KEY"):
-            info.append("OPENAI_API_KEY set")
-        else:
-            info.append("OPENAI_API_KEY not set (OK if using Ollama)")
-
-        # Gemini
-        if os.environ.get("GEMINI_API_KEY"):
-            info.append("GEMINI_API_KEY set")
-        else:
-            info.append("GEMINI_API_KEY not set (needed for review command)")
-
-        # Ollama config
-        provider = os.environ.get("LLM_PROVIDER", "auto")
-        info.append(f"LLM_PROVIDER={provider}")
-
-        msg = "; ".join(info)
-        if issues:
-            return CheckResult(name="env_vars", passed=False, message="; ".join(issues) + " | " + msg)
+            return CheckResult(
+                name="env_vars",
+                passed=False,
+                message=f"No search API key (need one of: BRAVE_API_KEY, GOOGLE_API_KEY, SERPAPI_KEY) | {msg}",
+            )
         return CheckResult(name="env_vars", passed=True, message=msg)
 
     def _check_storage(self) -> CheckResult:
@@ -138,18 +177,19 @@ class DoctorChecks:
             message="LLM provider ready",
         )
 
-    def _check_ollama(self) -> CheckResult:
+    def _check_ollama(self, env: Mapping[str, str | None]) -> CheckResult:
         """Check Ollama daemon reachability and list models."""
         try:
-            import httpx
-            host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
-            resp = httpx.get(f"{host}/api/tags", timeout=3)
+            host = env.get("OLLAMA_HOST") or "http://localhost:11434"
+            if _port_refused(host):
+                raise ConnectionError(host)
+            resp = _ollama_client().get(f"{host}/api/tags")
             if resp.status_code == 200:
-                models = [m["name"] for m in resp.json().get("models", [])]
+                names = ", ".join(m["name"] for m in _json.loads(resp.content).get("models", ())) or "none"
                 return CheckResult(
                     name="ollama",
                     passed=True,
-                    message=f"Ollama running at {host}; models: {', '.join(models) or 'none'}",
+                    message=f"Ollama running at {host}; models: {names}",
                 )
             return CheckResult(name="ollama", passed=False, message=f"Ollama returned status {resp.status_code}")
         except Exception:
@@ -159,10 +199,9 @@ class DoctorChecks:
                 message="Ollama not reachable (is 'ollama serve' running?)",
             )
 
-    def _check_gemini(self) -> CheckResult:
+    def _check_gemini(self, env: Mapping[str, str | None]) -> CheckResult:
         """Check Gemini API key is set (needed for review command)."""
-        key = os.environ.get("GEMINI_API_KEY")
-        if not key:
+        if not env.get("GEMINI_API_KEY"):
             return CheckResult(
                 name="gemini",
                 passed=False,
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 
 from research_toolkit.application.ports import Clock, Indexer, Logger, Snapshotter, Store
 from research_toolkit.domain.entities import Resource
+from research_toolkit.domain.title_extract import extract_title
 from research_toolkit.domain.value_objects import ContentHash, ResourceId, Url
 
 
@@ -41,39 +42,45 @@ class IngestResource:
     def execute(self, request: IngestRequest) -> IngestResponse:
         source = request.path_or_url
         is_url = source.startswith(("http://", "https://"))
+        chash: ContentHash | None = None
 
         if is_url:
             rid = ResourceId.from_url(source)
-            if self._store.resource_exists(rid):
-                existing = self._store.load_resource(rid)
-                if existing:
-                    self._log.info(f"Resource already exists: {rid}")
-                    return IngestResponse(resource=existing, already_existed=True)
+            existing = self._store.load_resource(rid)
+            if existing:
+                self._log.info(f"Resource already exists: {rid}")
+                return IngestResponse(resource=existing, already_existed=True)
 
             text, raw_html = self._snap.capture(source)
             content_md = text or ""
             url = Url(source)
-            title = self._extract_title(content_md, source)
+            title = extract_title(content_md, source)
         else:
             # Local file
             if not os.path.exists(source):
                 raise FileNotFoundError(f"File not found: {source}")
-            with open(source, "r", encoding="utf-8", errors="replace") as f:
-                content_md = f.read()
+            # One bulk read + decode; normalise newlines as text mode would.
+            with open(source, "rb") as f:
+                content_md = f.read().decode("utf-8", errors="replace")
+            if "\r" in content_md:
+                content_md = content_md.replace("\r\n", "\n").replace("\r", "\n")
             raw_html = None
-            rid = ResourceId.from_content(content_md)
-            if self._store.resource_exists(rid):
-                existing = self._store.load_resource(rid)
-                if existing:
-                    return IngestResponse(resource=existing, already_existed=True)
+            # Content-addressed: the id is a prefix of the content hash
+            chash = ContentHash.of(content_md)
+            rid = ResourceId.from_hash(chash)
+            existing = self._store.load_resource(rid)
+            if existing:
+                return IngestResponse(resource=existing, already_existed=True)
             url = Url(f"file://{os.path.abspath(source)}")
             title = os.path.basename(source)
 
-        if not content_md.strip():
+        # isspace() stops at the first non-blank char instead of copying like strip()
+        if not content_md or content_md.isspace():
             raise ValueError("No content could be extracted from the source.")
 
         ts = self._clock.now()
-        chash = ContentHash.of(content_md)
+        if chash is None:
+            chash = ContentHash.of(content_md)
 
         resource = Resource(
             id=rid,
@@ -89,41 +96,3 @@ class IngestResource:
         self._log.info(f"Ingested [{rid}]: {title}")
 
         return IngestResponse(resource=resource)
-
-    @staticmethod
-    def _extract_title(content: str, fallback: str) -> str:
-        lines = content.split("\n")
-
-        # --- Try YAML / TOML frontmatter first ---
-        if lines and lines[0].strip() in ("---", "+++"):
-            delimiter = lines[0].strip()
-            for i, raw in enumerate(lines[1:], start=1):
-                stripped = raw.strip()
-                if stripped == delimiter:
-                    break  # end of frontmatter
-                if stripped.lower().startswith("title:"):
-                    val = stripped.split(":", 1)[1].strip().strip("'\"")
-                    if val:
-                        return val
-            # After frontmatter, search body for heading
-            body_start = 0
-            for i, raw in enumerate(lines[1:], start=1):
-                if raw.strip() == delimiter:
-                    body_start = i + 1
-                    break
-            for raw in lines[body_start:]:
-                stripped = raw.strip()
-                if stripped.startswith("# "):
-                    return stripped[2:].strip()
-                if stripped and not stripped.startswith(("---", "+++")) and len(stripped) < 200:
-                    return stripped
-
-        # --- No frontmatter: first heading or first short line ---
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("# "):
-                return stripped[2:].strip()
-            if stripped and len(stripped) < 200:
-                return stripped
-
-        return fallback
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from research_toolkit.application.ports import (
@@ -34,6 +35,17 @@ class QueryResponse:
 class QueryLibrary:
     """Answer a question using the local library, with optional live fallback."""
 
+    _SYSTEM = (
+        "You are a research assistant. Answer questions using only the provided sources. "
+        "Always cite your sources with their IDs. Be concise and factual."
+    )
+    _SNIPPET_CHARS = 1500
+    _PROMPT_HEADER = (
+        "Answer the following question using ONLY the provided sources.\n"
+        "Cite sources using [source_id] notation.\n"
+        "If the sources don't contain enough information, say so.\n\n"
+    )
+
     def __init__(
         self,
         store: Store,
@@ -51,6 +63,25 @@ class QueryLibrary:
         self._snap = snapshotter
         self._clock = clock
         self._log = logger
+        self._run_search: RunSearch | None = None
+
+    def _load_source(self, rid: ResourceId) -> tuple[Resource | None, str]:
+        resource = self._store.load_resource(rid)
+        if resource is None:
+            return None, ""
+        # Only the prompt snippet is needed, so don't read the whole file
+        return resource, self._store.load_content(rid, max_chars=self._SNIPPET_CHARS) or ""
+
+    @staticmethod
+    def _no_results() -> QueryResponse:
+        return QueryResponse(
+            answer=SummaryOutput(
+                text="No relevant resources found in the local library. "
+                "Try `tool search` first, or use `--live` to search the web.",
+                citations=[],
+            ),
+            sources=[],
+        )
 
     def execute(self, request: QueryRequest) -> QueryResponse:
         self._log.info(f"Query: {request.question!r} (top_k={request.top_k}, live={request.live})")
@@ -58,41 +89,38 @@ class QueryLibrary:
         # If --live, do a fresh search first
         if request.live:
             self._log.info("Live mode: performing fresh web search...")
-            run_search = RunSearch(
-                search_provider=self._search,
-                snapshotter=self._snap,
-                store=self._store,
-                indexer=self._indexer,
-                clock=self._clock,
-                logger=self._log,
-            )
-            run_search.execute(RunSearchRequest(query=request.question, max_results=request.top_k))
+            if self._run_search is None:
+                self._run_search = RunSearch(
+                    search_provider=self._search,
+                    snapshotter=self._snap,
+                    store=self._store,
+                    indexer=self._indexer,
+                    clock=self._clock,
+                    logger=self._log,
+                )
+            self._run_search.execute(RunSearchRequest(query=request.question, max_results=request.top_k))
 
         # Search local index
         resource_ids = self._indexer.search_local(request.question, top_k=request.top_k)
 
         if not resource_ids:
-            return QueryResponse(
-                answer=SummaryOutput(
-                    text="No relevant resources found in the local library. "
-                    "Try `tool search` first, or use `--live` to search the web.",
-                    citations=[],
-                ),
-                sources=[],
-            )
+            return self._no_results()
 
         # Gather context from stored resources
         sources: list[Resource] = []
         context_parts: list[str] = []
         citations: list[Citation] = []
 
-        for rid in resource_ids:
-            resource = self._store.load_resource(rid)
-            if resource is None:
+        # Each hit is two independent file reads; overlap them across hits.
+        # ``map`` keeps the index ranking order.
+        with ThreadPoolExecutor(max_workers=min(len(resource_ids), 8)) as pool:
+            loaded = list(pool.map(self._load_source, resource_ids))
+
+        # load_content already truncated each snippet to keep the prompt
+        # within model limits; empty sources add nothing but prompt tokens.
+        for rid, (resource, snippet) in zip(resource_ids, loaded):
+            if resource is None or not snippet:
                 continue
-            content = self._store.load_content(rid) or ""
-            # Truncate each source to keep prompt within model limits
-            snippet = content[:1500]
             context_parts.append(
                 f"--- Source [{resource.id}]: {resource.title} ---\n"
                 f"URL: {resource.url}\n"
@@ -111,21 +139,12 @@ class QueryLibrary:
                 )
             )
 
-        combined_context = "\n\n".join(context_parts)
+        if not sources:
+            return self._no_results()
 
-        prompt = (
-            f"Answer the following question using ONLY the provided sources.\n"
-            f"Cite sources using [source_id] notation.\n"
-            f"If the sources don't contain enough information, say so.\n\n"
-            f"Question: {request.question}\n\n"
-            f"Sources:\n{combined_context}"
-        )
-        system = (
-            "You are a research assistant. Answer questions using only the provided sources. "
-            "Always cite your sources with their IDs. Be concise and factual."
-        )
+        prompt = f"{self._PROMPT_HEADER}Question: {request.question}\n\nSources:\n" + "\n\n".join(context_parts)
 
-        answer_text = self._llm.complete(prompt, system=system, max_tokens=2000)
+        answer_text = self._llm.complete(prompt, system=self._SYSTEM, max_tokens=2000)
 
         return QueryResponse(
             answer=SummaryOutput(text=answer_text, citations=citations),
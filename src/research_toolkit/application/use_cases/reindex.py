@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterator
 
+from research_toolkit import _json
 from research_toolkit.application.ports import Indexer, Logger, Store
 from research_toolkit.domain.entities import Resource
-from research_toolkit.domain.value_objects import ResourceId
+from research_toolkit.domain.title_extract import EXTRACTOR_VERSION, extract_title
 
 
 @dataclass
@@ -18,6 +20,38 @@ class ReindexResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _read_pair(rdir: str, indexed_chars: int) -> tuple[dict[str, Any] | Exception, str] | None:
+    """Read and parse ``meta.json``, then read ``content.md`` from a resource dir.
+
+    Resources whose title was already derived by the current extractor only
+    need the *indexed_chars* the indexer uses.  Returns None when there is no
+    ``meta.json``; any other failure is returned rather than raised so it can
+    be reported against its resource.
+    """
+    try:
+        with open(os.path.join(rdir, "meta.json"), "rb") as f:
+            data = _json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        return exc, ""
+    if not isinstance(data, dict):
+        return ValueError("meta.json does not hold an object"), ""
+    limit = indexed_chars if data.get("title_extractor_version") == EXTRACTOR_VERSION else -1
+    try:
+        with open(os.path.join(rdir, "content.md"), "r", encoding="utf-8") as f:
+            content = f.read(limit)
+    except FileNotFoundError:
+        content = ""
+    except Exception as exc:
+        return exc, ""
+    return data, content
+
+
+# Resources read, parsed and indexed per streaming step
+_BATCH = 64
+
+
 class Reindex:
     """Rebuild the library index and fix titles using improved extraction logic."""
 
@@ -33,62 +67,17 @@ class Reindex:
         if not os.path.isdir(resources_dir):
             return result
 
-        # Collect all valid resources
-        resources_with_content: list[tuple[Resource, str]] = []
-
-        for rid_dir in sorted(os.listdir(resources_dir)):
-            meta_path = os.path.join(resources_dir, rid_dir, "meta.json")
-            content_path = os.path.join(resources_dir, rid_dir, "content.md")
-            if not os.path.isfile(meta_path):
-                continue
-
-            result.total += 1
-            try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                resource = Resource.from_dict(data)
-
-                content = ""
-                if os.path.isfile(content_path):
-                    with open(content_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-                # Re-extract title
-                new_title = self._extract_title(content, resource.title)
-                if new_title != resource.title:
-                    old = resource.title
-                    resource = Resource(
-                        id=resource.id,
-                        title=new_title,
-                        url=resource.url,
-                        captured_at=resource.captured_at,
-                        content_hash=resource.content_hash,
-                        tags=resource.tags,
-                    )
-                    # Write updated meta.json
-                    with open(meta_path, "w", encoding="utf-8") as f:
-                        json.dump(resource.to_dict(), f, indent=2)
-                    result.titles_fixed += 1
-                    self._log.info(f"Fixed title [{resource.id}]: '{old}' → '{new_title}'")
-
-                resources_with_content.append((resource, content))
-
-            except Exception as exc:
-                result.errors.append(f"{rid_dir}: {exc}")
-                self._log.warning(f"Reindex error for {rid_dir}: {exc}")
-
-        # Rebuild library.jsonl from scratch
-        lib_path = os.path.join(base, "library.jsonl")
-        with open(lib_path, "w", encoding="utf-8") as f:
-            for resource, _ in resources_with_content:
-                f.write(json.dumps(resource.to_dict()) + "\n")
-
-        # Rebuild in-memory index
-        # Reset internal state via a fresh load (the indexer re-reads from disk)
-        self._indexer._index = {}  # type: ignore[attr-defined]
-        self._indexer._resources = {}  # type: ignore[attr-defined]
-        for resource, content in resources_with_content:
-            self._indexer.index_resource(resource, content[:10000])
+        # Reading meta.json/content.md is I/O-bound; overlap the reads and keep
+        # parsing and title extraction on this thread.  scandir's cached
+        # dirent type avoids a stat per entry, and the reads themselves
+        # detect a missing meta.json.
+        with os.scandir(resources_dir) as it:
+            entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+        # The store consumes the refreshed resources as they are produced, so
+        # only _BATCH contents are held at once.
+        self._indexer.clear()
+        self._store.rewrite_library(self._refreshed(entries, result))
 
         self._log.info(
             f"Reindex complete: {result.total} resources, "
@@ -96,41 +85,55 @@ class Reindex:
         )
         return result
 
-    @staticmethod
-    def _extract_title(content: str, fallback: str) -> str:
-        """Same logic as IngestResource._extract_title – DRY candidate."""
-        lines = content.split("\n")
-
-        # --- Try YAML / TOML frontmatter first ---
-        if lines and lines[0].strip() in ("---", "+++"):
-            delimiter = lines[0].strip()
-            for i, raw in enumerate(lines[1:], start=1):
-                stripped = raw.strip()
-                if stripped == delimiter:
-                    break
-                if stripped.lower().startswith("title:"):
-                    val = stripped.split(":", 1)[1].strip().strip("'\"")
-                    if val:
-                        return val
-            # After frontmatter, search body for heading
-            body_start = 0
-            for i, raw in enumerate(lines[1:], start=1):
-                if raw.strip() == delimiter:
-                    body_start = i + 1
-                    break
-            for raw in lines[body_start:]:
-                stripped = raw.strip()
-                if stripped.startswith("# "):
-                    return stripped[2:].strip()
-                if stripped and not stripped.startswith(("---", "+++")) and len(stripped) < 200:
-                    return stripped
-
-        # --- No frontmatter: first heading or first short line ---
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("# "):
-                return stripped[2:].strip()
-            if stripped and len(stripped) < 200:
-                return stripped
-
-        return fallback
+    def _refreshed(self, entries: list[os.DirEntry[str]], result: ReindexResult) -> Iterator[Resource]:
+        """Yield every readable resource with its title fixed, indexing batch by batch."""
+        indexed_chars = self._indexer.indexed_chars()
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            for start in range(0, len(entries), _BATCH):
+                batch = entries[start:start + _BATCH]
+                indexed: list[tuple[Resource, str]] = []
+                for entry, raw in zip(batch, pool.map(lambda e: _read_pair(e.path, indexed_chars), batch)):
+                    if raw is None:
+                        continue
+                    result.total += 1
+                    resource = self._refresh(entry, raw, result)
+                    if resource is None:
+                        continue
+                    indexed.append((resource, raw[1]))
+                    yield resource
+                self._indexer.index_many(indexed)
+
+    def _refresh(
+        self, entry: os.DirEntry[str], raw: tuple[dict[str, Any] | Exception, str], result: ReindexResult
+    ) -> Resource | None:
+        """Parse one resource and fix its title; record errors and return None on failure."""
+        data, content = raw
+        meta_path = os.path.join(entry.path, "meta.json")
+        try:
+            if isinstance(data, Exception):
+                raise data
+            resource = Resource.from_dict(data)
+            if data.get("title_extractor_version") == EXTRACTOR_VERSION:
+                return resource  # title already derived by this extractor
+
+            # Re-extract title
+            new_title = extract_title(content, resource.title)
+            # Whitespace-only differences are not worth a new title
+            if new_title.strip() != resource.title.strip():
+                old = resource.title
+                resource = replace(resource, title=new_title)
+                result.titles_fixed += 1
+                self._log.info(f"Fixed title [{resource.id}]: '{old}' → '{new_title}'")
+
+            # Write meta.json atomically, stamped so later runs skip it: one
+            # write per resource per extractor version, changed title or not
+            tmp_path = meta_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_json.dumps({**resource.to_dict(), "title_extractor_version": EXTRACTOR_VERSION}, indent=True))
+            os.replace(tmp_path, meta_path)
+            return resource
+
+        except Exception as exc:
+            result.errors.append(f"{entry.name}: {exc}")
+            self._log.warn(f"Reindex error for {entry.name}: {exc}")
+            return None
@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import codecs
+import functools
+import hashlib
 import json
 import mimetypes
+import mmap
 import os
 import re
 import shutil
-from dataclasses import dataclass, field
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
-from research_toolkit.application.ports import Clock, Logger, MultimodalLLMProvider, Store
+from research_toolkit import _json
+from research_toolkit.application.ports import (
+    Clock,
+    LLMUsage,
+    Logger,
+    MultimodalLLMProvider,
+    ReviewCache,
+    Store,
+)
 from research_toolkit.domain.review_entities import (
     ArtifactRef,
     ReviewIssue,
@@ -38,13 +52,127 @@ SUPPORTED_MIMES: dict[str, str] = {
 }
 
 
-def detect_mime(path: str) -> str:
-    """Detect MIME type from file extension, falling back to mimetypes stdlib."""
+# Leading bytes of the binary formats above, for files without a usable extension
+_MAGIC: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"%PDF-", "application/pdf"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+_SNIFF_BYTES = 512
+
+# Characters replaced when a filename becomes a review directory slug
+_FILESAFE_RE = re.compile(r"[^a-zA-Z0-9_.-]")
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_ext(ext: str) -> str | None:
+    """``mimetypes`` lookup for a (lowercased) extension, resolved once per process."""
+    guess, _ = mimetypes.guess_type("x" + ext)
+    return guess
+
+
+def _sniff_mime(head: bytes) -> str:
+    """Guess a MIME type from the first bytes of a file."""
+    for magic, mime in _MAGIC:
+        if head.startswith(magic):
+            return mime
+    if b"\0" in head:
+        return "application/octet-stream"
+    try:
+        # Incremental decode tolerates a multi-byte character cut off at the end
+        codecs.getincrementaldecoder("utf-8")().decode(head)
+    except UnicodeDecodeError:
+        return "application/octet-stream"
+    return "text/plain"
+
+
+def detect_mime(path: str, head: bytes | None = None) -> str:
+    """Detect MIME type from the file extension, sniffing content as a last resort.
+
+    Unknown extensions go to the stdlib ``mimetypes`` table; files with no
+    extension (or one it doesn't know) are classified from their first bytes.
+    Pass *head* when the file's leading bytes are already in memory.
+    """
     ext = os.path.splitext(path)[1].lower()
-    if ext in SUPPORTED_MIMES:
-        return SUPPORTED_MIMES[ext]
-    guess, _ = mimetypes.guess_type(path)
-    return guess or "application/octet-stream"
+    mime = SUPPORTED_MIMES.get(ext)
+    if mime is not None:
+        return mime
+    if ext:
+        guess = _guess_ext(ext)
+        if guess:
+            return guess
+    if head is None:
+        try:
+            with open(path, "rb") as f:
+                head = f.read(_SNIFF_BYTES)
+        except OSError:
+            return "application/octet-stream"
+    return _sniff_mime(head[:_SNIFF_BYTES])
+
+
+@functools.lru_cache(maxsize=32)
+def _read_rubric(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parsed rubric file; *mtime_ns* is part of the key so edits are picked up.
+
+    Callers share the returned dict (like ``DEFAULT_RUBRIC``) and must not mutate it.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)  # type: ignore[no-any-return]
+
+
+def review_cache_key(
+    file_bytes: bytes | mmap.mmap, prompt: str, system: str, model: str | None, thinking: str | None
+) -> str:
+    """Hash everything that is sent to the model (plus model and thinking)."""
+    h = hashlib.sha256(file_bytes)
+    for part in (prompt, system, model or "", thinking or ""):
+        h.update(b"\0")
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# JSON helpers
+# ---------------------------------------------------------------------------
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _extract_json_object(text: str) -> Any | None:
+    """Return the first balanced ``{...}`` span in *text* that parses, else None.
+
+    A single forward scan tracks brace depth, ignoring braces inside JSON
+    strings; a span that fails to parse is skipped and scanning resumes after it.
+    """
+    depth = 0
+    start = -1
+    in_str = False
+    escaped = False
+    for i, c in enumerate(text):
+        if in_str:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = depth > 0
+        elif c == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif c == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                try:
+                    return _json.loads(text[start:i + 1])
+                except ValueError:
+                    continue
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -57,6 +185,7 @@ class ReviewRequest:
     output_format: str = "json"  # "json" or "md"
     model: str | None = None
     thinking: str | None = None  # "high" or "low"
+    use_cache: bool = True
 
 
 @dataclass
@@ -82,23 +211,60 @@ DEFAULT_RUBRIC: dict[str, Any] = {
 }
 
 
+# JSON shape the model must answer with; serialised once, not per review
+_OUTPUT_SCHEMA = json.dumps({
+    "overall_score": "number 0-100",
+    "pass": "boolean",
+    "summary": "string (2-4 sentence overview)",
+    "issues": [
+        {
+            "severity": "critical|major|minor|suggestion",
+            "title": "short title",
+            "location": "where in the artifact",
+            "evidence": "what you observed",
+            "fix": "recommended fix",
+        }
+    ],
+    "next_steps": ["actionable next step 1", "..."],
+}, indent=2)
+
+# Fixed text around the one rubric-dependent rule in the prompt
+_SCHEMA_BLOCK = (
+    "### Required JSON output schema\n"
+    "Respond ONLY with valid JSON (no markdown fences, no extra text):\n"
+    f"{_OUTPUT_SCHEMA}\n"
+    "\n"
+    "Rules:"
+)
+_RULES_TAIL = (
+    "- issues: sorted by severity (critical first). Include at least 1 issue or suggestion.\n"
+    "- Be specific: reference exact locations, text, or visual elements.\n"
+    "- next_steps: 2-5 concrete, actionable items."
+)
+
+
 # ---------------------------------------------------------------------------
 # Use case
 # ---------------------------------------------------------------------------
 class ReviewArtifact:
     """Review an artifact file using a multimodal LLM and return structured feedback."""
 
+    # Text artifacts beyond this many characters are truncated in the prompt
+    _MAX_TEXT_CHARS = 30_000
+
     def __init__(
         self,
         llm: MultimodalLLMProvider,
         store: Store,
         clock: Clock,
         logger: Logger,
+        cache: ReviewCache | None = None,
     ) -> None:
         self._llm = llm
         self._store = store
         self._clock = clock
         self._log = logger
+        self._cache = cache
 
     def execute(self, request: ReviewRequest) -> ReviewResponse:
         # 1. Validate artifact exists
@@ -122,57 +288,85 @@ class ReviewArtifact:
         # 2. Load rubric
         rubric = self._load_rubric(request.rubric_path)
 
-        # 3. Read file bytes
-        with open(artifact_path, "rb") as f:
-            file_bytes = f.read()
-
-        # 4. Build attachments
-        attachments: list[dict[str, Any]] = []
-
-        # For text-based files, include as text in the prompt instead
+        # 3. Read the artifact.  Text files are included in the prompt, so
+        # only the part that fits is read; binaries are memory-mapped rather
+        # than copied into a private buffer.
         text_content: str | None = None
+        file_data: bytes | mmap.mmap = b""
         if mime.startswith("text/") or mime in ("application/json", "application/csv"):
-            try:
-                text_content = file_bytes.decode("utf-8", errors="replace")
-            except Exception:
-                pass
-
-        if text_content is None:
-            # Binary attachment (image or PDF)
-            attachments.append({"mime_type": mime, "data": file_bytes})
-
-        # 5. Build prompt
-        prompt = self._build_prompt(filename, mime, rubric, text_content)
-
-        # 6. Call multimodal LLM
-        system = (
-            "You are an expert artifact reviewer. You produce structured, actionable "
-            "feedback in JSON format. Always respond with valid JSON matching the "
-            "requested schema. Be specific about locations, evidence, and fixes."
-        )
+            with open(artifact_path, "r", encoding="utf-8", errors="replace", newline="") as f:
+                text_content = f.read(self._MAX_TEXT_CHARS + 1)
+        else:
+            file_data = self._map_file(artifact_path)
 
-        raw = self._llm.complete_multimodal(
-            prompt=prompt,
-            attachments=attachments,
-            system=system,
-            max_tokens=4096,
-            thinking=request.thinking,
-        )
+        try:
+            # 4. Build attachments
+            attachments: list[dict[str, Any]] = []
+            if text_content is None:
+                # Binary attachment (image or PDF)
+                attachments.append({"mime_type": mime, "data": file_data})
+
+            # 5. Build prompt
+            prompt = self._build_prompt(filename, mime, rubric, text_content)
+
+            # 6. Call multimodal LLM
+            system = (
+                "You are an expert artifact reviewer. You produce structured, actionable "
+                "feedback in JSON format. Always respond with valid JSON matching the "
+                "requested schema. Be specific about locations, evidence, and fixes."
+            )
+
+            cache = self._cache if request.use_cache else None
+            usage: LLMUsage | None = None
+            key = ""
+            cached = None
+            if cache is not None:
+                # Text content is already part of the prompt
+                key = review_cache_key(file_data, prompt, system, request.model, request.thinking)
+                cached = cache.get(key)
+
+            if cached is not None:
+                self._log.info("Using cached review for identical input")
+                report = ReviewReport.from_dict(cached)
+                report.artifact = artifact_ref
+            else:
+                raw = self._llm.complete_multimodal(
+                    prompt=prompt,
+                    attachments=attachments,
+                    system=system,
+                    max_tokens=4096,
+                    thinking=request.thinking,
+                )
+
+                # 7. Parse LLM response into ReviewReport
+                usage = getattr(self._llm, "last_usage", None)
+                if usage is not None:
+                    self._log.info(usage.describe())
+
+                report, parsed = self._parse_response(raw, rubric, artifact_ref)
+                # Parse failures are not cached so a retry asks the model again
+                if cache is not None and parsed:
+                    cache.put(key, report.to_dict())
+        finally:
+            if isinstance(file_data, mmap.mmap):
+                file_data.close()
 
-        # 7. Parse LLM response into ReviewReport
-        report = self._parse_response(raw, rubric, artifact_ref)
         now = self._clock.now()
         report.reviewed_at = now.iso()
         report.model = request.model or "gemini-2.0-flash"
+        # Serialised once; the same dict is written to disk and returned
+        report_json = report.to_dict()
 
         # 8. Store review output
         review_dir = self._store_review(
             report=report,
+            report_json=report_json,
             artifact_path=artifact_path,
             rubric=rubric,
             prompt=prompt,
             model_name=report.model,
             now_iso=now.iso(),
+            usage=usage,
         )
 
         self._log.info(
@@ -184,20 +378,32 @@ class ReviewArtifact:
         return ReviewResponse(
             report=report,
             review_dir=review_dir,
-            report_json=report.to_dict(),
+            report_json=report_json,
         )
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _map_file(path: str) -> bytes | mmap.mmap:
+        """Map *path* read-only, or read it when it cannot be mapped (e.g. empty)."""
+        with open(path, "rb") as f:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                return f.read()
+
     def _load_rubric(self, rubric_path: str | None) -> dict[str, Any]:
         if rubric_path is None:
             return DEFAULT_RUBRIC
         path = os.path.abspath(rubric_path)
-        if not os.path.isfile(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise FileNotFoundError(f"Rubric not found: {rubric_path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)  # type: ignore[no-any-return]
+        return _read_rubric(path, st.st_mtime_ns)
 
     def _build_prompt(
         self,
@@ -206,61 +412,52 @@ class ReviewArtifact:
         rubric: dict[str, Any],
         text_content: str | None,
     ) -> str:
+        # Stable instructions first and artifact-specific data last, so
+        # providers with automatic prefix caching can reuse the shared prefix.
+        return (
+            self._static_prefix(rubric)
+            + "\n\n### Target Artifact\n"
+            + self._dynamic_suffix(filename, mime, text_content)
+        )
+
+    @staticmethod
+    def _static_prefix(rubric: dict[str, Any]) -> str:
+        """Rubric, output schema and rules – identical for every artifact."""
         criteria_text = "\n".join(
             f"  - {c['name']} (weight: {c['weight']}): {c['description']}"
             for c in rubric.get("criteria", [])
         )
         pass_threshold = rubric.get("pass_threshold", 60)
 
-        parts = [
-            f"Review the following artifact: **{filename}** (type: {mime})",
-            "",
-            f"## Rubric: {rubric.get('name', 'general')}",
-            f"{rubric.get('description', '')}",
-            f"Pass threshold: {pass_threshold}/100",
-            "",
-            "### Criteria",
-            criteria_text,
-            "",
-        ]
+        return (
+            f"## Rubric: {rubric.get('name', 'general')}\n"
+            f"{rubric.get('description', '')}\n"
+            f"Pass threshold: {pass_threshold}/100\n"
+            f"\n"
+            f"### Criteria\n"
+            f"{criteria_text}\n"
+            f"\n"
+            f"{_SCHEMA_BLOCK}\n"
+            f"- overall_score: 0-100. Set pass=true if score >= {pass_threshold}.\n"
+            f"{_RULES_TAIL}"
+        )
+
+    @staticmethod
+    def _dynamic_suffix(filename: str, mime: str, text_content: str | None) -> str:
+        """The artifact header and, for text files, its (truncated) content."""
+        parts = [f"Review the following artifact: **{filename}** (type: {mime})"]
 
         if text_content:
             # Truncate very large text content
-            max_chars = 30_000
+            max_chars = ReviewArtifact._MAX_TEXT_CHARS
             tc = text_content[:max_chars]
             if len(text_content) > max_chars:
                 tc += "\n\n[... content truncated ...]"
+            parts.append("")
             parts.append("### Artifact content (text)")
             parts.append("```")
             parts.append(tc)
             parts.append("```")
-            parts.append("")
-
-        parts.extend([
-            "### Required JSON output schema",
-            "Respond ONLY with valid JSON (no markdown fences, no extra text):",
-            json.dumps({
-                "overall_score": "number 0-100",
-                "pass": "boolean",
-                "summary": "string (2-4 sentence overview)",
-                "issues": [
-                    {
-                        "severity": "critical|major|minor|suggestion",
-                        "title": "short title",
-                        "location": "where in the artifact",
-                        "evidence": "what you observed",
-                        "fix": "recommended fix",
-                    }
-                ],
-                "next_steps": ["actionable next step 1", "..."],
-            }, indent=2),
-            "",
-            "Rules:",
-            f"- overall_score: 0-100. Set pass=true if score >= {pass_threshold}.",
-            "- issues: sorted by severity (critical first). Include at least 1 issue or suggestion.",
-            "- Be specific: reference exact locations, text, or visual elements.",
-            "- next_steps: 2-5 concrete, actionable items.",
-        ])
 
         return "\n".join(parts)
 
@@ -269,8 +466,12 @@ class ReviewArtifact:
         raw: str,
         rubric: dict[str, Any],
         artifact: ArtifactRef,
-    ) -> ReviewReport:
-        """Parse LLM JSON response into a ReviewReport, with fallback."""
+    ) -> tuple[ReviewReport, bool]:
+        """Parse LLM JSON response into a ReviewReport, with fallback.
+
+        The flag is False when the response was not JSON and the fallback
+        report was returned.
+        """
         # Strip markdown code fences if present
         cleaned = raw.strip()
         if cleaned.startswith("```"):
@@ -282,17 +483,10 @@ class ReviewArtifact:
             cleaned = cleaned.strip()
 
         try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError:
+            data = _json.loads(cleaned)
+        except ValueError:
             # Try to extract JSON from the response
-            match = re.search(r"\{[\s\S]*\}", cleaned)
-            if match:
-                try:
-                    data = json.loads(match.group())
-                except json.JSONDecodeError:
-                    data = None
-            else:
-                data = None
+            data = _extract_json_object(cleaned)
 
         if data is None:
             # Fallback: create a report from raw text
@@ -311,7 +505,7 @@ class ReviewArtifact:
                 ],
                 next_steps=["Retry the review"],
                 artifact=artifact,
-            )
+            ), False
 
         pass_threshold = rubric.get("pass_threshold", 60)
         score = int(data.get("overall_score", 0))
@@ -324,7 +518,7 @@ class ReviewArtifact:
                 continue
 
         # Sort issues by severity
-        issues.sort(key=lambda i: i.severity)
+        issues.sort(key=lambda i: i.severity.rank)
 
         return ReviewReport(
             overall_score=score,
@@ -333,21 +527,23 @@ class ReviewArtifact:
             issues=issues,
             next_steps=data.get("next_steps", []),
             artifact=artifact,
-        )
+        ), True
 
     def _store_review(
         self,
         report: ReviewReport,
+        report_json: dict[str, Any],
         artifact_path: str,
         rubric: dict[str, Any],
         prompt: str,
         model_name: str,
         now_iso: str,
+        usage: LLMUsage | None = None,
     ) -> str:
         """Persist the review to ./research/reviews/<timestamp>__<slug>/."""
         # Build slug from filename
         filename = os.path.basename(artifact_path)
-        slug = re.sub(r"[^a-zA-Z0-9_.-]", "_", filename).lower()
+        slug = _FILESAFE_RE.sub("_", filename).lower()
         ts = now_iso.replace(":", "-").replace("+", "p")[:19]
         review_name = f"{ts}__{slug}"
 
@@ -356,40 +552,58 @@ class ReviewArtifact:
         input_dir = os.path.join(review_dir, "input")
         traces_dir = os.path.join(review_dir, "traces")
 
-        for d in [review_dir, input_dir, traces_dir]:
+        for d in [input_dir, traces_dir]:
             os.makedirs(d, exist_ok=True)
 
-        # Copy artifact to input/
-        shutil.copy2(artifact_path, os.path.join(input_dir, filename))
-
-        # Save rubric
-        with open(os.path.join(review_dir, "rubric.json"), "w", encoding="utf-8") as f:
-            json.dump(rubric, f, indent=2)
-
-        # Save report.json
-        with open(os.path.join(review_dir, "report.json"), "w", encoding="utf-8") as f:
-            json.dump(report.to_dict(), f, indent=2)
-
-        # Save report.md
-        md = self._report_to_markdown(report)
-        with open(os.path.join(review_dir, "report.md"), "w", encoding="utf-8") as f:
-            f.write(md)
-
-        # Save traces
-        with open(os.path.join(traces_dir, "prompt.txt"), "w", encoding="utf-8") as f:
-            from research_toolkit.infrastructure.config import redact_secrets
-            f.write(redact_secrets(prompt))
-
-        with open(os.path.join(traces_dir, "model_meta.json"), "w", encoding="utf-8") as f:
-            json.dump({
+        from research_toolkit.infrastructure.config import redact_secrets
+
+        # Everything is serialised here; only the writes are handed to the
+        # pool, so on a networked base dir they overlap instead of queueing.
+        outputs = {
+            os.path.join(review_dir, "rubric.json"): _json.dumps(rubric, indent=True),
+            os.path.join(review_dir, "report.json"): _json.dumps(report_json, indent=True),
+            os.path.join(review_dir, "report.md"): self._report_to_markdown(report).encode("utf-8"),
+            os.path.join(traces_dir, "prompt.txt"): redact_secrets(prompt).encode("utf-8"),
+        }
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            jobs = [pool.submit(self._copy_artifact, artifact_path, os.path.join(input_dir, filename))]
+            jobs += [pool.submit(_write_bytes, path, data) for path, data in outputs.items()]
+            jobs.append(pool.submit(_write_bytes, os.path.join(traces_dir, "model_meta.json"), _json.dumps({
                 "model": model_name,
                 "reviewed_at": now_iso,
                 "artifact": os.path.basename(artifact_path),
                 "artifact_mime": report.artifact.mime_type if report.artifact else "unknown",
-            }, f, indent=2)
+                # None when the report came from the review cache or the provider reports no usage
+                "usage": asdict(usage) if usage is not None else None,
+            }, indent=True)))
+            for job in jobs:
+                job.result()  # re-raise the first failure
 
         return review_dir
 
+    @staticmethod
+    def _copy_artifact(src: str, dest: str) -> None:
+        """Copy the artifact into input/, an independent record of what was reviewed.
+
+        ``copy_file_range`` lets copy-on-write filesystems (btrfs, XFS) share
+        extents instead of duplicating bytes; elsewhere it is an in-kernel copy.
+        """
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                shutil.copystat(src, dest)
+                return
+            except OSError:
+                pass  # cross-device on older kernels, unsupported fs: plain copy
+        shutil.copy2(src, dest)
+
     @staticmethod
     def _report_to_markdown(report: ReviewReport) -> str:
         """Render a ReviewReport as human-readable markdown."""
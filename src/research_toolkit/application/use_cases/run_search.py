@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from research_toolkit.application.ports import (
@@ -14,7 +15,13 @@ from research_toolkit.application.ports import (
     Store,
 )
 from research_toolkit.domain.entities import Resource, ResearchSession, SearchResult
-from research_toolkit.domain.value_objects import ContentHash, ResourceId, Url
+from research_toolkit.domain.value_objects import ContentHash, ResourceId, Timestamp, Url
+
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# (session id, resource, content of a newly stored resource) for one result
+_Outcome = tuple[ResourceId | None, Resource | None, str | None]
 
 
 @dataclass
@@ -22,6 +29,7 @@ class RunSearchRequest:
     query: str
     max_results: int = 10
     recency_days: int | None = None
+    concurrency: int = 8  # results snapshotted in parallel
 
 
 @dataclass
@@ -60,54 +68,61 @@ class RunSearch:
         )
 
         ts = self._clock.now()
-        slug = re.sub(r"[^a-z0-9]+", "_", request.query.lower())[:40].strip("_")
+        slug = _SLUG_RE.sub("_", request.query.lower())[:40].strip("_")
         session_id = f"{ts.dt.strftime('%Y%m%dT%H%M%S')}__{slug}"
         session = ResearchSession(session_id=session_id, created_at=ts, queries=[request.query])
 
         resources: list[Resource] = []
         skipped = 0
 
+        # Dedupe before any network work: repeated URLs within this search
+        # share their first occurrence's outcome, and ids already in the
+        # library are looked up in one batch.
+        rids = [ResourceId.from_url(sr.url) for sr in results]
+        first_index: dict[str, int] = {}
         for i, sr in enumerate(results):
-            try:
-                rid = ResourceId.from_url(sr.url)
-
-                # Dedupe
-                if self._store.resource_exists(rid):
+            first_index.setdefault(sr.url, i)
+        unique = sorted(first_index.values())
+        existing = self._store.resources_exist(rids[i] for i in unique)
+
+        outcomes: dict[int, _Outcome] = {}
+        fetch: list[int] = []
+        for i in unique:
+            if rids[i] in existing:
+                self._log.info(f"  skip (exists): {results[i].url}")
+                outcomes[i] = (rids[i], self._store.load_resource(rids[i]), None)
+            else:
+                fetch.append(i)
+
+        # Snapshots are network-bound, so fetch and store new results
+        # concurrently.  Indexing stays on this thread.
+        if fetch:
+            with ThreadPoolExecutor(max_workers=max(1, min(request.concurrency, len(fetch)))) as pool:
+                outcomes.update(zip(fetch, pool.map(lambda i: self._ingest_one(results[i], rids[i], ts), fetch)))
+        for i, sr in enumerate(results):
+            j = first_index[sr.url]
+            if j != i:
+                rid, resource, _ = outcomes[j]
+                if rid is not None:
                     self._log.info(f"  skip (exists): {sr.url}")
-                    session.resource_ids.append(rid)
-                    existing = self._store.load_resource(rid)
-                    if existing:
-                        resources.append(existing)
-                    skipped += 1
-                    continue
+                outcomes[i] = (rid, resource, None)
 
-                # Snapshot
-                text, raw_html = self._snap.capture(sr.url)
-                content_md = text or sr.snippet or ""
-                if not content_md.strip():
-                    self._log.warn(f"  skip (empty): {sr.url}")
+        for i, sr in enumerate(results):
+            rid, resource, content_md = outcomes[i]
+            if content_md is not None and resource is not None:
+                try:
+                    self._indexer.index_resource(resource, content_md)
+                except Exception as exc:
+                    self._log.error(f"  failed for {sr.url}: {exc}")
                     skipped += 1
                     continue
-
-                chash = ContentHash.of(content_md)
-
-                resource = Resource(
-                    id=rid,
-                    title=sr.title,
-                    url=Url(sr.url),
-                    captured_at=ts,
-                    content_hash=chash,
-                    tags=[],
-                )
-
-                self._store.save_resource(resource, content_md, raw_html)
-                self._indexer.index_resource(resource, content_md)
-                session.resource_ids.append(rid)
-                resources.append(resource)
                 self._log.info(f"  stored [{rid}]: {sr.title}")
-            except Exception as exc:
-                self._log.error(f"  failed for {sr.url}: {exc}")
+            else:
                 skipped += 1
+            if rid is not None:
+                session.resource_ids.append(rid)
+            if resource is not None:
+                resources.append(resource)
 
         # Persist session
         self._store.save_session(
@@ -121,3 +136,34 @@ class RunSearch:
         )
 
         return RunSearchResponse(session=session, resources=resources, skipped=skipped)
+
+    def _ingest_one(self, sr: SearchResult, rid: ResourceId, ts: Timestamp) -> _Outcome:
+        """Snapshot and store one new result (no indexing); safe to run on a worker thread.
+
+        Returns ``(rid, resource, content)``: *rid* is set when the result
+        belongs in the session, *content* only when a new resource was stored.
+        """
+        try:
+            # Snapshot
+            text, raw_html = self._snap.capture(sr.url)
+            content_md = text or sr.snippet or ""
+            if not content_md.strip():
+                self._log.warn(f"  skip (empty): {sr.url}")
+                return None, None, None
+
+            chash = ContentHash.of(content_md)
+
+            resource = Resource(
+                id=rid,
+                title=sr.title,
+                url=Url(sr.url),
+                captured_at=ts,
+                content_hash=chash,
+                tags=[],
+            )
+
+            self._store.save_resource(resource, content_md, raw_html)
+            return rid, resource, content_md
+        except Exception as exc:
+            self._log.error(f"  failed for {sr.url}: {exc}")
+            return None, None, None
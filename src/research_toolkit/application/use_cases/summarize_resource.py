@@ -2,17 +2,68 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import re
 from dataclasses import dataclass
+from typing import Any
 
 from research_toolkit.application.ports import Indexer, LLMProvider, Logger, Store
 from research_toolkit.domain.entities import Citation, Resource, SummaryOutput
 from research_toolkit.domain.value_objects import ResourceId
 
 
+# ---------------------------------------------------------------------------
+# Token-budget truncation
+# ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _encoder() -> Any | None:
+    """tiktoken's cl100k_base when the optional package is usable, else None."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:  # not installed, or its BPE file cannot be fetched
+        return None
+
+
+def _estimate_tokens(text: str) -> float:
+    """Rough count: ~4 ASCII characters per token, one token per other character."""
+    non_ascii = len(text) - len(text.encode("ascii", "ignore"))
+    return (len(text) - non_ascii) / 4 + non_ascii
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> tuple[str, bool]:
+    """Return the longest prefix of *text* within *max_tokens*, and whether it was cut."""
+    enc = _encoder()
+    if enc is not None:
+        # No token spans 16 characters on average, so this window always
+        # holds the budget; it saves tokenizing multi-MB documents.
+        window = text[: max_tokens * 16]
+        ids = enc.encode(window, disallowed_special=())
+        if len(ids) <= max_tokens:
+            return window, len(window) < len(text)
+        return enc.decode(ids[:max_tokens]), True
+
+    if _estimate_tokens(text) <= max_tokens:
+        return text, False
+    # Every character costs at least 1/4 token, so the cut is below max_tokens * 4
+    lo, hi = 0, min(len(text), max_tokens * 4)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _estimate_tokens(text[:mid]) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo], True
+
+
 @dataclass
 class SummarizeRequest:
     resource_id: str
     format: str = "md"  # "md" or "json"
+    use_cache: bool = True
+    max_content_tokens: int = 3000  # document budget in the prompt
 
 
 @dataclass
@@ -21,9 +72,44 @@ class SummarizeResponse:
     resource: Resource
 
 
+def summary_response(resource: Resource, raw_summary: str, fmt: str = "md") -> SummarizeResponse:
+    """Wrap model output for *resource* with its citation."""
+    rid = resource.id
+
+    # Build citations
+    citations = [
+        Citation(
+            resource_id=rid,
+            resource_title=resource.title,
+            url=resource.url,
+            captured_at=resource.captured_at,
+            excerpt=raw_summary[:200],
+            local_path=f"research/resources/{rid}/content.md",
+        )
+    ]
+
+    summary = SummaryOutput(
+        text=raw_summary,
+        citations=citations,
+        format=fmt,
+    )
+
+    return SummarizeResponse(summary=summary, resource=resource)
+
+
+def _model_tag(llm: LLMProvider) -> str:
+    """Filename-safe form of the provider's model name ("" if it exposes none)."""
+    return re.sub(r"[^A-Za-z0-9.-]+", "-", str(getattr(llm, "model", "")))
+
+
 class SummarizeResource:
     """Summarize a stored resource with citations."""
 
+    _SYSTEM = (
+        "You are a research assistant. Produce concise, factual summaries. "
+        "Always include verifiable citations from the source text."
+    )
+
     def __init__(
         self,
         store: Store,
@@ -43,16 +129,28 @@ class SummarizeResource:
         if resource is None:
             raise ValueError(f"Resource not found: {request.resource_id}")
 
+        # The summary depends on the stored content, the title and URL quoted in
+        # the prompt, the provider, its model and the token budget; a summary is
+        # reused only while all of them are unchanged.
+        header = hashlib.sha256(f"{resource.title}\n{resource.url}".encode(), usedforsecurity=False)
+        cache_key = (
+            f"{resource.content_hash}_{header.hexdigest()[:12]}_{type(self._llm).__name__.lower()}_"
+            f"{_model_tag(self._llm)}_{request.max_content_tokens}"
+        )
+        cached = self._store.load_cached_summary(cache_key) if request.use_cache else None
+        if cached is not None:
+            self._log.info(f"Using cached summary for [{rid}]")
+            return summary_response(resource, cached["text"], request.format)
+
         content = self._store.load_content(rid)
         if not content:
             raise ValueError(f"No content stored for resource: {request.resource_id}")
 
         self._log.info(f"Summarizing [{rid}]: {resource.title}")
 
-        # Truncate content for LLM context
-        max_chars = 12_000
-        truncated = content[:max_chars]
-        if len(content) > max_chars:
+        # Truncate content to a token budget for LLM context
+        truncated, cut = truncate_to_tokens(content, request.max_content_tokens)
+        if cut:
             truncated += "\n\n[... content truncated ...]"
 
         prompt = (
@@ -64,29 +162,11 @@ class SummarizeResource:
             f"---\n{truncated}\n---"
         )
 
-        system = (
-            "You are a research assistant. Produce concise, factual summaries. "
-            "Always include verifiable citations from the source text."
-        )
-
-        raw_summary = self._llm.complete(prompt, system=system, max_tokens=1500)
-
-        # Build citations
-        citations = [
-            Citation(
-                resource_id=rid,
-                resource_title=resource.title,
-                url=resource.url,
-                captured_at=resource.captured_at,
-                excerpt=raw_summary[:200],
-                local_path=f"research/resources/{rid}/content.md",
-            )
-        ]
-
-        summary = SummaryOutput(
-            text=raw_summary,
-            citations=citations,
-            format=request.format,
-        )
+        raw_summary = self._llm.complete(prompt, system=self._SYSTEM, max_tokens=1500)
+        usage = getattr(self._llm, "last_usage", None)
+        if usage is not None:
+            self._log.info(usage.describe())
+        if request.use_cache:
+            self._store.save_cached_summary(cache_key, {"text": raw_summary})
 
-        return SummarizeResponse(summary=summary, resource=resource)
+        return summary_response(resource, raw_summary, request.format)
@@ -13,7 +13,7 @@ from research_toolkit.domain.value_objects import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """A captured web resource stored in the local library."""
 
@@ -49,7 +49,7 @@ class Resource:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Citation:
     """A citation pointing to a specific resource and location."""
 
@@ -82,7 +82,7 @@ class Citation:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """A single result from a web search (before ingestion)."""
 
@@ -92,7 +92,7 @@ class SearchResult:
     position: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchSession:
     """A research session grouping queries, results, and outputs."""
 
@@ -119,7 +119,7 @@ class ResearchSession:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryOutput:
     """A generated summary with citations."""
 
@@ -15,14 +15,21 @@ class Severity(str, Enum):
     MINOR = "minor"
     SUGGESTION = "suggestion"
 
+    @property
+    def rank(self) -> int:
+        """0 for CRITICAL up to 3 for SUGGESTION; a cheap sort key."""
+        return _SEVERITY_RANK[self]
+
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Severity):
             return NotImplemented
-        order = [Severity.CRITICAL, Severity.MAJOR, Severity.MINOR, Severity.SUGGESTION]
-        return order.index(self) < order.index(other)
+        return _SEVERITY_RANK[self] < _SEVERITY_RANK[other]
+
+
+_SEVERITY_RANK: dict[Severity, int] = {sev: i for i, sev in enumerate(Severity)}
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewIssue:
     """A single issue found during artifact review."""
 
@@ -52,7 +59,7 @@ class ReviewIssue:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArtifactRef:
     """Reference to the artifact being reviewed."""
 
@@ -79,7 +86,7 @@ class ArtifactRef:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewReport:
     """Structured review report produced by the reviewer."""
 
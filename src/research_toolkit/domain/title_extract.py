@@ -0,0 +1,47 @@
+"""Domain service: derive a human-readable title from markdown content."""
+
+from __future__ import annotations
+
+# Titles live in the frontmatter or the first few lines; never split more
+# than this many lines out of a (possibly multi-MB) document.
+MAX_SCAN_LINES = 500
+
+# Bump whenever extract_title's rules change; reindex re-derives titles only
+# for resources stamped with an older version.
+EXTRACTOR_VERSION = 1
+
+
+def extract_title(content: str, fallback: str) -> str:
+    """Return the frontmatter title, first heading, or first short line of *content*."""
+    lines = content.split("\n", MAX_SCAN_LINES)[:MAX_SCAN_LINES]
+
+    # --- Try YAML / TOML frontmatter first ---
+    delimiter = lines[0].strip()
+    if delimiter in ("---", "+++"):
+        body_start = 0
+        for i, raw in enumerate(lines[1:], start=1):
+            stripped = raw.strip()
+            if stripped == delimiter:
+                body_start = i + 1
+                break  # end of frontmatter
+            if stripped[:6].lower() == "title:":
+                val = stripped.split(":", 1)[1].strip().strip("'\"")
+                if val:
+                    return val
+        # After frontmatter, search body for heading
+        for raw in lines[body_start:]:
+            stripped = raw.strip()
+            if stripped.startswith("# "):
+                return stripped[2:].strip()
+            if stripped and not stripped.startswith(("---", "+++")) and len(stripped) < 200:
+                return stripped
+
+    # --- No frontmatter: first heading or first short line ---
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("# "):
+            return stripped[2:].strip()
+        if stripped and len(stripped) < 200:
+            return stripped
+
+    return fallback
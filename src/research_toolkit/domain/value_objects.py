@@ -2,37 +2,54 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 
-@dataclass(frozen=True)
+_RESOURCE_ID_RE = re.compile(r"[a-f0-9]{8,16}")
+
+# The SHA-256 digests below are identifiers, not security checks; saying so
+# keeps them usable on FIPS-restricted OpenSSL builds.
+
+
+@functools.lru_cache(maxsize=8192)
+def _url_digest12(url: str) -> str:
+    return hashlib.sha256(url.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+@dataclass(frozen=True, slots=True)
 class ResourceId:
     """Stable, deterministic identifier for a resource (8-char hex digest of URL)."""
 
     value: str
 
     def __post_init__(self) -> None:
-        if not re.fullmatch(r"[a-f0-9]{8,16}", self.value):
+        if not _RESOURCE_ID_RE.fullmatch(self.value):
             raise ValueError(f"Invalid ResourceId: {self.value!r}")
 
     @classmethod
     def from_url(cls, url: str) -> "ResourceId":
-        digest = hashlib.sha256(url.encode()).hexdigest()[:12]
-        return cls(value=digest)
+        # URLs recur across searches and dedup checks; memoise their digests
+        return cls(value=_url_digest12(url))
 
     @classmethod
     def from_content(cls, content: str) -> "ResourceId":
-        digest = hashlib.sha256(content.encode()).hexdigest()[:12]
+        digest = hashlib.sha256(content.encode(), usedforsecurity=False).hexdigest()[:12]
         return cls(value=digest)
 
+    @classmethod
+    def from_hash(cls, content_hash: "ContentHash") -> "ResourceId":
+        """Same id as ``from_content`` for already-hashed content."""
+        return cls(value=content_hash.value[:12])
+
     def __str__(self) -> str:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Url:
     """Validated URL value object."""
 
@@ -46,7 +63,7 @@ class Url:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Timestamp:
     """UTC timestamp value object."""
 
@@ -67,7 +84,7 @@ class Timestamp:
         return self.iso()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentHash:
     """SHA-256 hash of content for dedup."""
 
@@ -75,7 +92,7 @@ class ContentHash:
 
     @classmethod
     def of(cls, text: str) -> "ContentHash":
-        return cls(value=hashlib.sha256(text.encode()).hexdigest())
+        return cls(value=hashlib.sha256(text.encode(), usedforsecurity=False).hexdigest())
 
     def __str__(self) -> str:
         return self.value
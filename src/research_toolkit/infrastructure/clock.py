@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-from research_toolkit.application.ports import Clock as ClockPort
 from research_toolkit.domain.value_objects import Timestamp
 
 
-class WallClock(ClockPort):
+class WallClock:
     """Real wall-clock time."""
 
     def now(self) -> Timestamp:
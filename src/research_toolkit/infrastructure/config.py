@@ -22,32 +22,68 @@ _SECRET_PATTERNS = [
 ]
 
 
+# All patterns as one alternation, so each message is scanned once.
+_ALL_SECRETS = re.compile("|".join(f"(?:{p.pattern})" for p in _SECRET_PATTERNS))
+
+# Every pattern contains one of these literals; text without any of them
+# (most log lines) cannot match and skips the regex entirely.
+_SECRET_MARKERS = ("sk-", "AIzaSy", "KEY", "key")
+
+
+def _mask(m: re.Match[str]) -> str:
+    return m.group(0)[:6] + "***REDACTED***"
+
+
 def redact_secrets(text: str) -> str:
     """Mask anything that looks like a secret in *text*."""
-    result = text
-    for pat in _SECRET_PATTERNS:
-        result = pat.sub(lambda m: m.group(0)[:6] + "***REDACTED***", result)
-    return result
+    if not any(marker in text for marker in _SECRET_MARKERS):
+        return text
+    return _ALL_SECRETS.sub(_mask, text)
+
+
+# (.env path, mtime) pairs already applied to os.environ, so repeated
+# in-process calls (agent loops, test harnesses) skip the dotenv re-parse.
+_LOADED_ENV_FILES: set[tuple[str, int]] = set()
+
+
+# .env locations found per working directory.  Only hits are kept, so a
+# .env created later in the same process is still picked up.
+_ENV_FILE_CACHE: dict[str, Path] = {}
+
+
+def _find_env_file(cwd: str) -> Path | None:
+    """Walk up from *cwd* and return the first ``.env`` found, if any."""
+    cached = _ENV_FILE_CACHE.get(cwd)
+    if cached is not None and cached.exists():
+        return cached
+    start = Path(cwd)
+    for d in [start, *start.parents]:
+        candidate = d / ".env"
+        if candidate.exists():
+            _ENV_FILE_CACHE[cwd] = candidate
+            return candidate
+    return None
 
 
 def load_config(env_path: str | None = None) -> dict[str, str | None]:
     """Load configuration from .env file and environment variables.
 
     Returns a dict of the config keys this toolkit cares about.
-    Values are never logged or printed.
+    Values are never logged or printed.  A ``.env`` file is parsed once
+    per modification time; the values themselves are read from
+    ``os.environ`` on every call, so in-process changes are seen.
     """
-    if env_path:
-        load_dotenv(env_path)
-    else:
-        # Walk up to find .env
-        cwd = Path.cwd()
-        for d in [cwd, *cwd.parents]:
-            candidate = d / ".env"
-            if candidate.exists():
-                load_dotenv(candidate)
-                break
-
-    return {
+    path = Path(env_path) if env_path else _find_env_file(os.getcwd())
+    if path:
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except OSError:
+            key = None
+        if key is not None and key not in _LOADED_ENV_FILES:
+            load_dotenv(path)
+            _LOADED_ENV_FILES.add(key)
+
+    config: dict[str, str | None] = {
         "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY"),
         "OPENAI_MODEL": os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
         "BRAVE_API_KEY": os.environ.get("BRAVE_API_KEY"),
@@ -63,3 +99,4 @@ def load_config(env_path: str | None = None) -> dict[str, str | None]:
         # Provider preference: "ollama", "openai", "gemini", or "auto" (default)
         "LLM_PROVIDER": os.environ.get("LLM_PROVIDER", "auto"),
     }
+    return config
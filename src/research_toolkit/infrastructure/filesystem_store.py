@@ -4,14 +4,20 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any
+from typing import Any, Iterable
 
-from research_toolkit.application.ports import Store as StorePort
+from research_toolkit import _json
 from research_toolkit.domain.entities import Resource
 from research_toolkit.domain.value_objects import ResourceId
 
 
-class FilesystemStore(StorePort):
+def _write_json(path: str, obj: Any) -> None:
+    """Write *obj* to *path* as 2-space indented JSON in one write."""
+    with open(path, "wb") as f:
+        f.write(_json.dumps(obj, indent=True))
+
+
+class FilesystemStore:
     """Stores resources and sessions on local disk under a base directory."""
 
     def __init__(self, base: str = "research") -> None:
@@ -28,6 +34,9 @@ class FilesystemStore(StorePort):
     def _session_dir(self, session_id: str) -> str:
         return os.path.join(self._base, "sessions", session_id)
 
+    def _summary_cache_path(self, key: str) -> str:
+        return os.path.join(self._base, "cache", "summaries", f"{key}.json")
+
     def _library_path(self) -> str:
         return os.path.join(self._base, "library.jsonl")
 
@@ -39,23 +48,23 @@ class FilesystemStore(StorePort):
 
     def save_resource(self, resource: Resource, content_md: str, raw_html: str | None = None) -> None:
         rdir = self._resource_dir(resource.id)
-        os.makedirs(rdir, exist_ok=True)
         raw_dir = os.path.join(rdir, "raw")
-        os.makedirs(raw_dir, exist_ok=True)
+        # One makedirs; raw/ is only needed when there is a snapshot to keep
+        os.makedirs(raw_dir if raw_html else rdir, exist_ok=True)
 
         # meta.json
-        with open(os.path.join(rdir, "meta.json"), "w", encoding="utf-8") as f:
-            json.dump(resource.to_dict(), f, indent=2)
+        _write_json(os.path.join(rdir, "meta.json"), resource.to_dict())
 
         # content.md
         with open(os.path.join(rdir, "content.md"), "w", encoding="utf-8") as f:
             f.write(content_md)
 
-        # snippets.json (initially empty)
-        snippets_path = os.path.join(rdir, "snippets.json")
-        if not os.path.exists(snippets_path):
-            with open(snippets_path, "w", encoding="utf-8") as f:
-                json.dump([], f)
+        # snippets.json (initially empty; exclusive create keeps existing ones)
+        try:
+            with open(os.path.join(rdir, "snippets.json"), "xb") as f:
+                f.write(b"[]")
+        except FileExistsError:
+            pass
 
         # raw snapshot
         if raw_html:
@@ -67,26 +76,31 @@ class FilesystemStore(StorePort):
 
     def load_resource(self, resource_id: ResourceId) -> Resource | None:
         meta_path = os.path.join(self._resource_dir(resource_id), "meta.json")
-        if not os.path.exists(meta_path):
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return Resource.from_dict(json.load(f))
+        except FileNotFoundError:
             return None
-        with open(meta_path, "r", encoding="utf-8") as f:
-            return Resource.from_dict(json.load(f))
 
-    def load_content(self, resource_id: ResourceId) -> str | None:
+    def load_content(self, resource_id: ResourceId, max_chars: int | None = None) -> str | None:
         content_path = os.path.join(self._resource_dir(resource_id), "content.md")
         if not os.path.exists(content_path):
             return None
         with open(content_path, "r", encoding="utf-8") as f:
-            return f.read()
+            return f.read(-1 if max_chars is None else max_chars)
 
     def resource_exists(self, resource_id: ResourceId) -> bool:
         return os.path.exists(os.path.join(self._resource_dir(resource_id), "meta.json"))
 
+    def resources_exist(self, resource_ids: Iterable[ResourceId]) -> set[ResourceId]:
+        # One stat per id: a search checks a handful of ids against a library
+        # that may hold thousands, so listing resources/ would cost more.
+        return {rid for rid in resource_ids if self.resource_exists(rid)}
+
     def save_snippets(self, resource_id: ResourceId, snippets: list[dict[str, Any]]) -> None:
         rdir = self._resource_dir(resource_id)
         os.makedirs(rdir, exist_ok=True)
-        with open(os.path.join(rdir, "snippets.json"), "w", encoding="utf-8") as f:
-            json.dump(snippets, f, indent=2)
+        _write_json(os.path.join(rdir, "snippets.json"), snippets)
 
     def load_snippets(self, resource_id: ResourceId) -> list[dict[str, Any]]:
         path = os.path.join(self._resource_dir(resource_id), "snippets.json")
@@ -95,13 +109,26 @@ class FilesystemStore(StorePort):
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)  # type: ignore[no-any-return]
 
+    def load_cached_summary(self, key: str) -> dict[str, Any] | None:
+        try:
+            with open(self._summary_cache_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)  # type: ignore[no-any-return]
+        except (OSError, ValueError):
+            return None
+
+    def save_cached_summary(self, key: str, data: dict[str, Any]) -> None:
+        path = self._summary_cache_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        _write_json(tmp_path, data)
+        os.replace(tmp_path, path)
+
     def save_session(self, session_id: str, data: dict[str, Any]) -> None:
         sdir = self._session_dir(session_id)
         os.makedirs(sdir, exist_ok=True)
         os.makedirs(os.path.join(sdir, "outputs"), exist_ok=True)
 
-        with open(os.path.join(sdir, "queries.json"), "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        _write_json(os.path.join(sdir, "queries.json"), data)
 
     def save_session_output(self, session_dir: str, filename: str, content: str) -> None:
         sdir = self._session_dir(session_dir)
@@ -110,10 +137,20 @@ class FilesystemStore(StorePort):
         with open(os.path.join(outdir, filename), "w", encoding="utf-8") as f:
             f.write(content)
 
+    def rewrite_library(self, resources: Iterable[Resource]) -> None:
+        # Built next to the old file and swapped in, so readers never see half of it
+        lib_path = self._library_path()
+        os.makedirs(os.path.dirname(lib_path), exist_ok=True)
+        tmp_path = lib_path + ".tmp"
+        with open(tmp_path, "wb", buffering=1 << 20) as f:
+            for resource in resources:
+                f.write(_json.dumps_line(resource.to_dict()))
+        os.replace(tmp_path, lib_path)
+
     # ---- private ----
 
     def _append_to_library(self, resource: Resource) -> None:
         lib_path = self._library_path()
         os.makedirs(os.path.dirname(lib_path), exist_ok=True)
-        with open(lib_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(resource.to_dict()) + "\n")
+        with open(lib_path, "ab") as f:
+            f.write(_json.dumps_line(resource.to_dict()))
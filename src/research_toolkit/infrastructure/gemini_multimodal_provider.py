@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import base64
+import threading
+import uuid
 from typing import Any
 
 import httpx
 
-from research_toolkit.application.ports import MultimodalLLMProvider
+from research_toolkit import _json
+from research_toolkit.application.ports import LLMUsage
+from research_toolkit.infrastructure.gemini_provider import usage_metadata
+from research_toolkit.infrastructure.http_transport import RetryTransport
 
 
-class GeminiMultimodalProvider(MultimodalLLMProvider):
+class GeminiMultimodalProvider:
     """Multimodal LLM provider using Gemini's generateContent API.
 
     Accepts text prompts plus binary attachments (images, PDFs)
@@ -28,6 +33,24 @@ class GeminiMultimodalProvider(MultimodalLLMProvider):
         self._api_key = api_key
         self._model = model
         self._timeout = timeout
+        self.last_usage: LLMUsage | None = None
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    def _http(self) -> httpx.Client:
+        """One client per provider, so the TLS connection is reused across calls."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.BASE_URL, timeout=self._timeout, transport=RetryTransport()
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     # ------------------------------------------------------------------
     # Port implementation
@@ -41,20 +64,19 @@ class GeminiMultimodalProvider(MultimodalLLMProvider):
         max_tokens: int = 4096,
         thinking: str | None = None,
     ) -> str:
-        url = f"{self.BASE_URL}/models/{self._model}:generateContent"
-
         # Build parts: text + inline file data
         parts: list[dict[str, Any]] = []
 
-        # Add file attachments first (so the model "sees" them before the prompt)
+        # Add file attachments first (so the model "sees" them before the prompt).
+        # Their base64 stays bytes and is spliced into the body at a marker.
+        marker = uuid.uuid4().hex
+        blobs: list[bytes] = []
         for att in attachments:
-            mime_type = att["mime_type"]
-            data_bytes: bytes = att["data"]
-            b64 = base64.standard_b64encode(data_bytes).decode("ascii")
+            blobs.append(base64.standard_b64encode(att["data"]))
             parts.append({
                 "inline_data": {
-                    "mime_type": mime_type,
-                    "data": b64,
+                    "mime_type": att["mime_type"],
+                    "data": marker,
                 }
             })
 
@@ -87,14 +109,15 @@ class GeminiMultimodalProvider(MultimodalLLMProvider):
             payload["generationConfig"]["thinkingConfig"] = {"thinkingBudget": 1024}
 
         try:
-            resp = httpx.post(
-                url,
+            resp = self._http().post(
+                f"/models/{self._model}:generateContent",
                 params={"key": self._api_key},
-                json=payload,
-                timeout=self._timeout,
+                content=_request_body(payload, marker, blobs),
+                headers={"Content-Type": "application/json"},
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = _json.loads(resp.content)
+            self.last_usage = usage_metadata(data)
 
             candidates = data.get("candidates", [])
             if not candidates:
@@ -128,3 +151,16 @@ class GeminiMultimodalProvider(MultimodalLLMProvider):
             return resp.status_code == 200
         except Exception:
             return False
+
+
+def _request_body(payload: dict[str, Any], marker: str, blobs: list[bytes]) -> bytes:
+    """Serialize *payload* with each occurrence of *marker* replaced by the next blob.
+
+    Base64 output is JSON-safe, so splicing the bytes in directly avoids the
+    str copies ``json=`` would make of every (multi-MB) attachment.
+    """
+    pieces = _json.dumps(payload).split(marker.encode())
+    body: list[bytes] = [pieces[0]]
+    for blob, piece in zip(blobs, pieces[1:]):
+        body += (blob, piece)
+    return b"".join(body)
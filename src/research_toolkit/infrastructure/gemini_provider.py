@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import threading
+from typing import Any
+
 import httpx
 
-from research_toolkit.application.ports import LLMProvider
+from research_toolkit import _json
+from research_toolkit.application.ports import LLMUsage
+from research_toolkit.infrastructure.http_transport import RetryTransport
 
 
-class GeminiProvider(LLMProvider):
+class GeminiProvider:
     """LLM provider backed by Google's Gemini API.
 
     Uses the ``v1beta/models/{model}:generateContent`` REST endpoint
@@ -25,13 +30,34 @@ class GeminiProvider(LLMProvider):
         self._api_key = api_key
         self._model = model
         self._timeout = timeout
+        self.last_usage: LLMUsage | None = None
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def model(self) -> str:
+        """The configured model name (part of summary cache keys)."""
+        return self._model
+
+    def _http(self) -> httpx.Client:
+        """One client per provider, so the TLS connection is reused across calls."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.BASE_URL, timeout=self._timeout, transport=RetryTransport()
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     # ------------------------------------------------------------------
     # Port implementation
     # ------------------------------------------------------------------
     def complete(self, prompt: str, *, system: str = "", max_tokens: int = 2048) -> str:
-        url = f"{self.BASE_URL}/models/{self._model}:generateContent"
-
         contents: list[dict] = []
 
         # System instruction goes in a separate top-level field
@@ -52,14 +78,14 @@ class GeminiProvider(LLMProvider):
             payload["systemInstruction"] = system_instruction
 
         try:
-            resp = httpx.post(
-                url,
+            resp = self._http().post(
+                f"/models/{self._model}:generateContent",
                 params={"key": self._api_key},
                 json=payload,
-                timeout=self._timeout,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = _json.loads(resp.content)
+            self.last_usage = usage_metadata(data)
 
             # Extract text from response
             candidates = data.get("candidates", [])
@@ -105,7 +131,7 @@ class GeminiProvider(LLMProvider):
                 timeout=timeout,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = _json.loads(resp.content)
             models = []
             for m in data.get("models", []):
                 name = m.get("name", "").replace("models/", "")
@@ -120,3 +146,16 @@ class GeminiProvider(LLMProvider):
             return models
         except Exception:
             return []
+
+
+def usage_metadata(data: dict[str, Any]) -> LLMUsage:
+    """Token counts from a generateContent response's ``usageMetadata``.
+
+    Shared with ``GeminiMultimodalProvider``, which gets the same response shape.
+    """
+    meta = data.get("usageMetadata") or {}
+    return LLMUsage(
+        prompt_tokens=meta.get("promptTokenCount", 0),
+        cached_tokens=meta.get("cachedContentTokenCount", 0),
+        completion_tokens=meta.get("candidatesTokenCount", 0),
+    )
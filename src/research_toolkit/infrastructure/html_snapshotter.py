@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import threading
+
 import httpx
 from bs4 import BeautifulSoup
-from markdownify import markdownify as md  # type: ignore[import-untyped]
+from markdownify import MarkdownConverter  # type: ignore[import-untyped]
+
+
+try:  # optional "fast" extra: libxml2 parses large pages much faster
+    import lxml  # noqa: F401
 
-from research_toolkit.application.ports import Snapshotter as SnapPort
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
 
 
-class HtmlSnapshotter(SnapPort):
+class HtmlSnapshotter:
     """Fetch a URL, return (extracted_markdown, raw_html)."""
 
     TIMEOUT = 15
@@ -23,13 +31,48 @@ class HtmlSnapshotter(SnapPort):
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
 
+    # Shared by concurrent captures (RunSearch fans out over threads)
+    LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+    def __init__(self) -> None:
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    def _http(self) -> httpx.Client:
+        """One pooled client per snapshotter, so keep-alive connections are reused."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        follow_redirects=True,
+                        timeout=self.TIMEOUT,
+                        headers=self.HEADERS,
+                        limits=self.LIMITS,
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _read_capped(self, resp: httpx.Response) -> str:
+        """Decode at most ``MAX_SIZE`` bytes of a streamed body, then stop downloading."""
+        chunks: list[bytes] = []
+        size = 0
+        for chunk in resp.iter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.MAX_SIZE:
+                break
+        # Same decoding as Response.text; a character cut at the cap is replaced
+        return b"".join(chunks)[: self.MAX_SIZE].decode(resp.encoding or "utf-8", errors="replace")
+
     def capture(self, url: str) -> tuple[str | None, str | None]:
         try:
-            with httpx.Client(follow_redirects=True, timeout=self.TIMEOUT) as client:
-                resp = client.get(url, headers=self.HEADERS)
+            with self._http().stream("GET", url) as resp:
                 resp.raise_for_status()
-
-            raw_text = resp.text[: self.MAX_SIZE]
+                raw_text = self._read_capped(resp)
             content_type = resp.headers.get("content-type", "")
 
             # If the response is plain text or markdown, use it directly
@@ -43,7 +86,7 @@ class HtmlSnapshotter(SnapPort):
                 return (clean if clean else None), raw_text
 
             # Standard HTML processing
-            soup = BeautifulSoup(raw_text, "html.parser")
+            soup = BeautifulSoup(raw_text, _PARSER)
 
             # Remove noise elements
             for tag in soup(["script", "style", "nav", "footer", "header", "aside", "iframe"]):
@@ -51,7 +94,8 @@ class HtmlSnapshotter(SnapPort):
 
             # Try to find article / main content
             main = soup.find("article") or soup.find("main") or soup.find("body") or soup
-            text_md: str = md(str(main), strip=["img"])  # type: ignore[arg-type]
+            # Convert the parsed tree directly; markdownify() would re-serialize and re-parse it
+            text_md: str = MarkdownConverter(strip=["img"]).convert_soup(main)
 
             # Clean up excessive whitespace
             lines = [line.strip() for line in text_md.splitlines()]
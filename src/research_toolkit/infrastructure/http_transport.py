@@ -0,0 +1,50 @@
+"""Infrastructure: httpx transport that retries transient API failures."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+
+
+# Gateway errors from API front-ends; the request usually never reached the backend
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Retry connection failures and 502/503/504 responses with exponential backoff.
+
+    Connection errors are retried by the wrapped ``HTTPTransport`` itself;
+    gateway statuses are retried here, before any body is handed to the
+    caller, so streamed responses are covered too.  Pass the pool *limits*
+    here: ``httpx.Client`` ignores its own ``limits`` when given a transport.
+    """
+
+    def __init__(
+        self,
+        inner: httpx.BaseTransport | None = None,
+        *,
+        limits: httpx.Limits | None = None,
+        attempts: int = 4,
+        backoff: float = 0.5,
+        max_delay: float = 8.0,
+    ) -> None:
+        if inner is None:
+            inner = httpx.HTTPTransport(retries=3, limits=limits or httpx.Limits())
+        self._inner = inner
+        self._attempts = max(1, attempts)
+        self._backoff = backoff
+        self._max_delay = max_delay
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._inner.handle_request(request)
+        attempt = 1
+        while response.status_code in RETRY_STATUSES and attempt < self._attempts:
+            response.close()
+            time.sleep(min(self._max_delay, self._backoff * 2 ** (attempt - 1)))
+            attempt += 1
+            response = self._inner.handle_request(request)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
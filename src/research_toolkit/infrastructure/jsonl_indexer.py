@@ -6,17 +6,45 @@ Can be upgraded to SQLite FTS in a future iteration.
 
 from __future__ import annotations
 
-import json
+import functools
+import heapq
 import os
 import re
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
-from research_toolkit.application.ports import Indexer as IndexerPort
+from research_toolkit import _json
 from research_toolkit.domain.entities import Resource
 from research_toolkit.domain.value_objects import ResourceId
 
 
-class JsonlIndexer(IndexerPort):
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    {"the", "a", "an", "is", "are", "was", "were", "in", "on", "at", "to", "for", "of", "and", "or", "it"}
+)
+
+_QUERY_CACHE_SIZE = 256
+_LOAD_WORKERS = 8  # enough to overlap content.md reads without flooding slow disks
+_INDEXED_CHARS = 10000  # cap on indexed content per resource, to avoid huge memory
+
+
+def _read_indexed(content_path: str) -> str:
+    """The indexed prefix of a resource's content; "" if missing or unreadable."""
+    try:
+        # 16 KB buffer: the capped read usually takes one syscall
+        with open(content_path, "r", encoding="utf-8", buffering=1 << 14) as f:
+            return f.read(_INDEXED_CHARS)
+    except Exception:
+        return ""  # index the title only
+
+
+@functools.lru_cache(maxsize=1024)
+def _query_terms(query: str) -> tuple[str, ...]:
+    """Tokenized search query; queries repeat, documents do not, so only these are cached."""
+    return tuple(JsonlIndexer._tokenize(query))
+
+
+class JsonlIndexer:
     """In-memory keyword index backed by library.jsonl for persistence."""
 
     def __init__(self, library_path: str = "research/library.jsonl") -> None:
@@ -24,8 +52,10 @@ class JsonlIndexer(IndexerPort):
         # Derive resources dir from library path
         self._resources_dir = os.path.join(os.path.dirname(self._library_path), "resources")
         # In-memory inverted index: term -> {resource_id: count}
-        self._index: dict[str, Counter[str]] = {}
+        self._index: dict[str, dict[str, int]] = {}
         self._resources: dict[str, Resource] = {}
+        # (query, top_k) -> ranked ids; cleared whenever the index changes
+        self._query_cache: dict[tuple[str, int], list[ResourceId]] = {}
         self._load()
 
     # ---- public api ----
@@ -33,23 +63,40 @@ class JsonlIndexer(IndexerPort):
     def index_resource(self, resource: Resource, content: str) -> None:
         rid = str(resource.id)
         self._resources[rid] = resource
-        terms = self._tokenize(f"{resource.title} {content}")
-        for term in terms:
-            if term not in self._index:
-                self._index[term] = Counter()
-            self._index[term][rid] += 1
+        self._add_postings(rid, f"{resource.title} {content}")
+        self._changed()
 
-    def search_local(self, query: str, top_k: int = 5) -> list[ResourceId]:
-        terms = self._tokenize(query)
-        scores: Counter[str] = Counter()
-        for term in terms:
-            if term in self._index:
-                for rid, count in self._index[term].items():
-                    scores[rid] += count
+    def index_many(self, items: Iterable[tuple[Resource, str]]) -> None:
+        """Bulk variant of ``index_resource`` used by reindex.
+
+        Content is capped like ``_load`` does.
+        """
+        for resource, content in items:
+            rid = str(resource.id)
+            self._resources[rid] = resource
+            self._add_postings(rid, f"{resource.title} {content[:_INDEXED_CHARS]}")
+        self._changed()
 
-        # Return top-k by score
-        top = scores.most_common(top_k)
-        return [ResourceId(rid) for rid, _ in top]
+    def search_local(self, query: str, top_k: int = 5) -> list[ResourceId]:
+        key = (query, top_k)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        scores: dict[str, int] = {}
+        for term in _query_terms(query):
+            postings = self._index.get(term)
+            if postings:
+                for rid, count in postings.items():
+                    scores[rid] = scores.get(rid, 0) + count
+
+        # Return top-k by score (ties keep first-seen order, like most_common)
+        top = heapq.nlargest(top_k, scores.items(), key=lambda kv: kv[1])
+        ranked = [ResourceId(rid) for rid, _ in top]
+        if len(self._query_cache) >= _QUERY_CACHE_SIZE:
+            del self._query_cache[next(iter(self._query_cache))]  # oldest first
+        self._query_cache[key] = ranked
+        return list(ranked)
 
     def list_all(self) -> list[Resource]:
         return list(self._resources.values())
@@ -57,54 +104,59 @@ class JsonlIndexer(IndexerPort):
     def remove(self, resource_id: ResourceId) -> None:
         rid = str(resource_id)
         self._resources.pop(rid, None)
-        for term_counter in self._index.values():
-            term_counter.pop(rid, None)
+        for postings in self._index.values():
+            postings.pop(rid, None)
+        self._changed()
+
+    def clear(self) -> None:
+        self._index = {}
+        self._resources = {}
+        self._changed()
 
     def healthy(self) -> bool:
         return True  # JSONL indexer is always healthy if we reach this point
 
+    def indexed_chars(self) -> int:
+        return _INDEXED_CHARS
+
     # ---- private ----
 
+    def _changed(self) -> None:
+        self._query_cache.clear()
+
     def _load(self) -> None:
         """Load entries from the JSONL library file and index stored content."""
         if not os.path.exists(self._library_path):
             return
-        seen_ids: set[str] = set()
-        with open(self._library_path, "r", encoding="utf-8") as f:
+        loaded: list[Resource] = []
+        with open(self._library_path, "rb", buffering=1 << 20) as f:
             for line in f:
-                line = line.strip()
-                if not line:
-                    continue
                 try:
-                    data = json.loads(line)
-                    resource = Resource.from_dict(data)
-                    rid = str(resource.id)
-                    if rid in seen_ids:
-                        continue  # dedupe
-                    seen_ids.add(rid)
-                    self._resources[rid] = resource
-
-                    # Try to load stored content for full-text indexing
-                    content = ""
-                    content_path = os.path.join(self._resources_dir, rid, "content.md")
-                    if os.path.exists(content_path):
-                        try:
-                            with open(content_path, "r", encoding="utf-8") as cf:
-                                content = cf.read()[:10000]  # cap to avoid huge memory
-                        except Exception:
-                            pass
-
-                    terms = self._tokenize(f"{resource.title} {content}")
-                    for term in terms:
-                        if term not in self._index:
-                            self._index[term] = Counter()
-                        self._index[term][rid] += 1
-                except (json.JSONDecodeError, KeyError, ValueError):
+                    # Blank lines fail to parse and are skipped like bad ones
+                    resource = Resource.from_dict(_json.loads(line))
+                except (KeyError, ValueError):  # includes JSON decode errors
                     continue
+                rid = str(resource.id)
+                if rid in self._resources:
+                    continue  # dedupe
+                self._resources[rid] = resource
+                loaded.append(resource)
+
+        # Content reads are I/O-bound, so overlap them; indexing stays on this thread
+        paths = [os.path.join(self._resources_dir, str(r.id), "content.md") for r in loaded]
+        with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as pool:
+            for resource, content in zip(loaded, pool.map(_read_indexed, paths)):
+                self._add_postings(str(resource.id), f"{resource.title} {content}")
+
+    def _add_postings(self, rid: str, text: str) -> None:
+        """Add one occurrence of *rid* to the postings of every term in *text*."""
+        index = self._index
+        for term in self._tokenize(text):
+            postings = index.setdefault(term, {})
+            postings[rid] = postings.get(rid, 0) + 1
 
     @staticmethod
     def _tokenize(text: str) -> list[str]:
         """Simple whitespace tokenizer with lowercasing and stopword removal."""
-        stops = {"the", "a", "an", "is", "are", "was", "were", "in", "on", "at", "to", "for", "of", "and", "or", "it"}
-        words = re.findall(r"[a-z0-9]+", text.lower())
-        return [w for w in words if w not in stops and len(w) > 1]
+        # Length first: single characters are common and need no set lookup
+        return [w for w in _WORD_RE.findall(text.lower()) if len(w) > 1 and w not in _STOPWORDS]
@@ -5,15 +5,19 @@ from __future__ import annotations
 import sys
 from typing import Any
 
-from research_toolkit.application.ports import Logger as LoggerPort
 from research_toolkit.infrastructure.config import redact_secrets
 
 
-class ConsoleLogger(LoggerPort):
-    """Simple stderr logger with automatic secret redaction."""
+class ConsoleLogger:
+    """Simple stderr logger with automatic secret redaction.
 
-    def __init__(self, verbose: bool = False) -> None:
+    *quiet* drops info lines (used for ``--json`` runs); warnings and
+    errors are always written.
+    """
+
+    def __init__(self, verbose: bool = False, quiet: bool = False) -> None:
         self._verbose = verbose
+        self._quiet = quiet
 
     def _emit(self, level: str, msg: str, **kw: Any) -> None:
         safe = redact_secrets(msg)
@@ -24,7 +28,8 @@ class ConsoleLogger(LoggerPort):
         print(line, file=sys.stderr)
 
     def info(self, msg: str, **kw: Any) -> None:
-        self._emit("INFO", msg, **kw)
+        if not self._quiet:
+            self._emit("INFO", msg, **kw)
 
     def warn(self, msg: str, **kw: Any) -> None:
         self._emit("WARN", msg, **kw)
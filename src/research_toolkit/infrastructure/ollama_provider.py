@@ -2,12 +2,56 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from typing import Any
+
 import httpx
 
-from research_toolkit.application.ports import LLMProvider
+from research_toolkit import _json
+from research_toolkit.application.ports import LLMUsage
+from research_toolkit.infrastructure.http_transport import RetryTransport
+
+
+# Successful reachability probes are cached in-process per host for
+# PROBE_TTL seconds.  Failures are never cached: auto mode must notice as
+# soon as the local daemon is up instead of sending prompts to a cloud provider.
+PROBE_TTL = 30.0
+_PROBE_CACHE: dict[str, float] = {}
+
+
+# /api/tags listings are kept in-process for MODELS_TTL seconds per host; the
+# installed models rarely change while a command runs.
+MODELS_TTL = 60.0
+_MODELS_CACHE: dict[str, tuple[list[dict[str, Any]], float]] = {}
+
+
+def _cached_models(host: str) -> list[dict[str, Any]] | None:
+    hit = _MODELS_CACHE.get(host)
+    if hit is None or time.time() - hit[1] >= MODELS_TTL:
+        return None
+    return list(hit[0])
+
+
+# Error bodies are short JSON messages; more than this is never needed to classify one
+_ERROR_HEAD_BYTES = 4096
+
+
+def _read_probe_cache(host: str) -> bool:
+    """True if *host* answered a probe less than ``PROBE_TTL`` seconds ago."""
+    ts = _PROBE_CACHE.get(host)
+    return ts is not None and time.time() - ts < PROBE_TTL
+
 
+def _write_probe_cache(host: str, ok: bool) -> None:
+    """Record a probe result; only successes are kept."""
+    if ok:
+        _PROBE_CACHE[host] = time.time()
+    else:
+        _PROBE_CACHE.pop(host, None)
 
-class OllamaProvider(LLMProvider):
+
+class OllamaProvider:
     """LLM provider backed by a local Ollama instance.
 
     Ollama exposes an OpenAI-compatible chat endpoint at
@@ -18,6 +62,9 @@ class OllamaProvider(LLMProvider):
 
     DEFAULT_HOST = "http://localhost:11434"
 
+    # Review and summarize loops call the daemon back to back
+    LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=15.0)
+
     def __init__(
         self,
         model: str = "llama3.1",
@@ -27,12 +74,37 @@ class OllamaProvider(LLMProvider):
         self._model = model
         self._host = (host or self.DEFAULT_HOST).rstrip("/")
         self._timeout = timeout
+        self.last_usage: LLMUsage | None = None
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def model(self) -> str:
+        """The configured model name (part of summary cache keys)."""
+        return self._model
+
+    def _http(self) -> httpx.Client:
+        """One pooled client per provider, so calls reuse the daemon connection."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self._host,
+                        timeout=self._timeout,
+                        transport=RetryTransport(limits=self.LIMITS),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     # ------------------------------------------------------------------
     # Port implementation
     # ------------------------------------------------------------------
     def complete(self, prompt: str, *, system: str = "", max_tokens: int = 2048) -> str:
-        messages: list[dict[str, str]] = []
+        messages: list[dict[str, Any]] = []
         if system:
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
@@ -40,7 +112,7 @@ class OllamaProvider(LLMProvider):
         payload = {
             "model": self._model,
             "messages": messages,
-            "stream": False,
+            "stream": True,
             "options": {
                 "num_predict": max_tokens,
                 "temperature": 0.3,
@@ -48,28 +120,19 @@ class OllamaProvider(LLMProvider):
         }
 
         try:
-            resp = httpx.post(
-                f"{self._host}/api/chat",
-                json=payload,
-                timeout=self._timeout,
-            )
-            # If model is too large, try to fall back to a smaller one
-            if resp.status_code == 500:
-                body = resp.text
-                if "requires more system memory" in body or "out of memory" in body.lower():
+            try:
+                return self._stream_chat(payload)
+            except httpx.HTTPStatusError as exc:
+                # If model is too large, try to fall back to a smaller one
+                body = exc.response.content.lower()
+                if exc.response.status_code == 500 and (
+                    b"requires more system memory" in body or b"out of memory" in body
+                ):
                     fallback = self._find_smaller_model()
                     if fallback and fallback != self._model:
                         payload["model"] = fallback
-                        resp = httpx.post(
-                            f"{self._host}/api/chat",
-                            json=payload,
-                            timeout=self._timeout,
-                        )
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("message", {}).get("content", "")
-        except httpx.HTTPStatusError:
-            raise
+                        return self._stream_chat(payload)
+                raise
         except httpx.TimeoutException:
             raise RuntimeError(
                 f"Ollama timed out after {self._timeout}s. "
@@ -77,45 +140,105 @@ class OllamaProvider(LLMProvider):
                 "Try again or use a smaller model."
             )
 
+    def _stream_chat(self, payload: dict[str, Any]) -> str:
+        """POST a streaming ``/api/chat`` request and join the content deltas.
+
+        Streaming keeps the read timeout per chunk rather than per completion,
+        so long generations are not cut off while tokens are still arriving.
+        """
+        parts: list[str] = []
+        with self._http().stream("POST", "/api/chat", json=payload) as resp:
+            if resp.is_error:
+                # Callers only classify the error (e.g. OOM), so its head is enough
+                head = bytearray()
+                for data in resp.iter_bytes():
+                    head += data
+                    if len(head) >= _ERROR_HEAD_BYTES:
+                        break
+                httpx.Response(
+                    resp.status_code,
+                    headers={"Content-Type": resp.headers.get("Content-Type", "")},
+                    content=bytes(head[:_ERROR_HEAD_BYTES]),
+                    request=resp.request,
+                ).raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = _json.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                parts.append(chunk.get("message", {}).get("content", ""))
+                if chunk.get("done"):
+                    # Ollama reuses its KV cache silently; it reports no cached count
+                    self.last_usage = LLMUsage(
+                        prompt_tokens=chunk.get("prompt_eval_count", 0),
+                        completion_tokens=chunk.get("eval_count", 0),
+                    )
+        return "".join(parts)
+
     def _find_smaller_model(self) -> str | None:
         """Return the name of the smallest available model as a fallback."""
-        models = self.list_models(self._host)
+        models = _cached_models(self._host)
+        if models is None:
+            try:
+                resp = self._http().get("/api/tags", timeout=5)
+                resp.raise_for_status()
+                models = _parse_models(_json.loads(resp.content))
+            except Exception:
+                return None
+            _MODELS_CACHE[self._host] = (list(models), time.time())
         if not models:
             return None
-        # Sort by size string (crude but effective)
-        models.sort(key=lambda m: float(m["size"].replace(" GB", "") or "999"))
-        return models[0]["name"]
+        # "size" is the formatted "<GB> GB" string shown by `tool models`
+        return min(models, key=lambda m: float(m["size"].split()[0]))["name"]
 
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
     @classmethod
-    def list_models(cls, host: str | None = None) -> list[dict[str, str]]:
+    def list_models(cls, host: str | None = None) -> list[dict[str, Any]]:
         """Return a list of models available on the Ollama instance."""
         base = (host or cls.DEFAULT_HOST).rstrip("/")
+        cached = _cached_models(base)
+        if cached is not None:
+            return cached
         try:
             resp = httpx.get(f"{base}/api/tags", timeout=5)
             resp.raise_for_status()
-            data = resp.json()
-            models = []
-            for m in data.get("models", []):
-                models.append({
-                    "name": m["name"],
-                    "size": f"{m.get('size', 0) / 1e9:.1f} GB",
-                    "family": m.get("details", {}).get("family", ""),
-                    "params": m.get("details", {}).get("parameter_size", ""),
-                    "quant": m.get("details", {}).get("quantization_level", ""),
-                })
-            return models
+            models = _parse_models(_json.loads(resp.content))
         except Exception:
             return []
+        _MODELS_CACHE[base] = (list(models), time.time())
+        return models
 
     @classmethod
-    def is_available(cls, host: str | None = None) -> bool:
-        """Check whether the Ollama daemon is reachable."""
+    def is_available(cls, host: str | None = None, *, use_cache: bool = True) -> bool:
+        """Check whether the Ollama daemon is reachable.
+
+        A success younger than ``PROBE_TTL`` seconds is reused unless
+        *use_cache* is false; an unreachable daemon is always re-probed.
+        """
         base = (host or cls.DEFAULT_HOST).rstrip("/")
+        if use_cache and _read_probe_cache(base):
+            return True
         try:
             resp = httpx.get(f"{base}/api/tags", timeout=3)
-            return resp.status_code == 200
+            ok = resp.status_code == 200
         except Exception:
-            return False
+            ok = False
+        _write_probe_cache(base, ok)
+        return ok
+
+
+def _parse_models(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Model summaries from an ``/api/tags`` response."""
+    models = []
+    for m in data.get("models", []):
+        models.append({
+            "name": m["name"],
+            "size": f"{m.get('size', 0) / 1e9:.1f} GB",
+            "family": m.get("details", {}).get("family", ""),
+            "params": m.get("details", {}).get("parameter_size", ""),
+            "quant": m.get("details", {}).get("quantization_level", ""),
+        })
+    return models
@@ -2,17 +2,39 @@
 
 from __future__ import annotations
 
-from research_toolkit.application.ports import LLMProvider
+import threading
+from typing import Any
 
+from research_toolkit.application.ports import LLMUsage
 
-class OpenAIProvider(LLMProvider):
-    """LLM provider backed by the OpenAI API (or compatible endpoint)."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini") -> None:
-        import openai
+class OpenAIProvider:
+    """LLM provider backed by the OpenAI API (or compatible endpoint).
+
+    The ``openai`` SDK is heavy to import, so it is loaded on the first
+    ``complete`` call rather than when the provider is built.
+    """
 
-        self._client = openai.OpenAI(api_key=api_key)
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini") -> None:
+        self._api_key = api_key
         self._model = model
+        self.last_usage: LLMUsage | None = None
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def model(self) -> str:
+        """The configured model name (part of summary cache keys)."""
+        return self._model
+
+    def _openai(self) -> Any:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import openai
+
+                    self._client = openai.OpenAI(api_key=self._api_key)
+        return self._client
 
     def complete(self, prompt: str, *, system: str = "", max_tokens: int = 2048) -> str:
         messages: list[dict[str, str]] = []
@@ -20,10 +42,18 @@ class OpenAIProvider(LLMProvider):
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
 
-        response = self._client.chat.completions.create(
+        response = self._openai().chat.completions.create(
             model=self._model,
             messages=messages,  # type: ignore[arg-type]
             max_tokens=max_tokens,
             temperature=0.3,
         )
+        usage = response.usage
+        if usage is not None:
+            details = getattr(usage, "prompt_tokens_details", None)
+            self.last_usage = LLMUsage(
+                prompt_tokens=usage.prompt_tokens or 0,
+                cached_tokens=getattr(details, "cached_tokens", 0) or 0,
+                completion_tokens=usage.completion_tokens or 0,
+            )
         return response.choices[0].message.content or ""
@@ -0,0 +1,29 @@
+"""Infrastructure: Filesystem review cache – report JSON keyed by input hash."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+
+class FilesystemReviewCache:
+    """Stores review reports under ``<base>/cache/reviews/<key>.json``."""
+
+    def __init__(self, base: str = "research") -> None:
+        self._dir = os.path.join(os.path.abspath(base), "cache", "reviews")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            with open(os.path.join(self._dir, f"{key}.json"), "r", encoding="utf-8") as f:
+                return json.load(f)  # type: ignore[no-any-return]
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, report: dict[str, Any]) -> None:
+        os.makedirs(self._dir, exist_ok=True)
+        path = os.path.join(self._dir, f"{key}.json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, path)
@@ -0,0 +1,78 @@
+"""Infrastructure: Filesystem search cache – result lists keyed by exact query."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict
+
+from research_toolkit.application.ports import SearchProvider
+from research_toolkit.domain.entities import SearchResult
+from research_toolkit.infrastructure import web_search_provider
+
+
+class CachedSearchProvider:
+    """Wrap a search provider, reusing its results for repeated identical searches.
+
+    Results are stored under ``<base>/cache/searches/<key>.json`` and reused
+    for ``ttl`` seconds.  The key covers the wrapped provider's class and
+    ``identity`` (account and engine), the query and ``max_results``.
+    Recency-bounded searches ask for fresh results and are never cached.
+    """
+
+    DEFAULT_TTL = 24 * 3600.0
+
+    def __init__(self, inner: SearchProvider, base: str = "research", ttl: float = DEFAULT_TTL) -> None:
+        self._inner = inner
+        self._dir = os.path.join(os.path.abspath(base), "cache", "searches")
+        self._ttl = ttl
+
+    def search(
+        self, query: str, *, max_results: int = 10, recency_days: int | None = None
+    ) -> list[SearchResult]:
+        if recency_days is not None:
+            return self._inner.search(query, max_results=max_results, recency_days=recency_days)
+
+        identity = getattr(self._inner, "identity", "")
+        key = hashlib.sha256(
+            f"{type(self._inner).__name__}|{identity}|{query}|{max_results}".encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+        path = os.path.join(self._dir, f"{key}.json")
+
+        try:
+            if time.time() - os.path.getmtime(path) < self._ttl:
+                with open(path, "r", encoding="utf-8") as f:
+                    return [SearchResult(**item) for item in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            pass  # missing, stale or unreadable: search again
+
+        results = self._inner.search(query, max_results=max_results, recency_days=recency_days)
+        try:
+            os.makedirs(self._dir, exist_ok=True)
+            # A unique temp name: concurrent writers of one key must not collide
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self._dir, suffix=".tmp", delete=False
+            ) as f:
+                json.dump([asdict(r) for r in results], f)
+            os.replace(f.name, path)
+        except OSError:
+            pass  # cache is best-effort
+        return results
+
+    def search_many(
+        self,
+        queries: list[str],
+        *,
+        max_results: int = 10,
+        recency_days: int | None = None,
+        max_concurrency: int = 10,
+    ) -> list[list[SearchResult]]:
+        """Concurrent ``search`` over *queries*; cached queries skip the network."""
+        return web_search_provider.search_many(
+            self.search, queries,
+            max_results=max_results, recency_days=recency_days, max_concurrency=max_concurrency,
+        )
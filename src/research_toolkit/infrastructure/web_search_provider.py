@@ -2,19 +2,100 @@
 
 from __future__ import annotations
 
+import abc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable
+
 import httpx
 
-from research_toolkit.application.ports import SearchProvider
+from research_toolkit import _json
 from research_toolkit.domain.entities import SearchResult
-
-
-class BraveSearchProvider(SearchProvider):
+from research_toolkit.infrastructure.http_transport import RetryTransport
+
+
+def search_many(
+    search: Callable[..., list[SearchResult]],
+    queries: list[str],
+    *,
+    max_results: int = 10,
+    recency_days: int | None = None,
+    max_concurrency: int = 10,
+) -> list[list[SearchResult]]:
+    """Run *search* for several queries concurrently; one result list per query, in order."""
+    if not queries:
+        return []
+    workers = max(1, min(max_concurrency, len(queries)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            lambda q: search(q, max_results=max_results, recency_days=recency_days),
+            queries,
+        ))
+
+
+class _HttpSearchProvider(abc.ABC):
+    """Shared plumbing: one lazily created ``httpx.Client`` and batched searches.
+
+    Responses are compressed: httpx advertises gzip/deflate, and br too when
+    the ``brotli`` package (``fast`` extra) is installed.
+    """
+
+    TIMEOUT = 15
+    # Agent loops issue many searches in a row; keep the connection warm between them
+    LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=15.0)
+
+    _client: httpx.Client | None = None
+    _client_lock = threading.Lock()
+
+    def _http(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.TIMEOUT, transport=RetryTransport(limits=self.LIMITS)
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    @property
+    def identity(self) -> str:
+        """Account and engine behind the results, so caches keep them apart."""
+        return self._api_key  # type: ignore[attr-defined, no-any-return]
+
+    @abc.abstractmethod
+    def search(
+        self, query: str, *, max_results: int = 10, recency_days: int | None = None
+    ) -> list[SearchResult]:
+        ...
+
+    def search_many(
+        self,
+        queries: list[str],
+        *,
+        max_results: int = 10,
+        recency_days: int | None = None,
+        max_concurrency: int = 10,
+    ) -> list[list[SearchResult]]:
+        """Run several searches concurrently; one result list per query, in order."""
+        return search_many(
+            self.search, queries,
+            max_results=max_results, recency_days=recency_days, max_concurrency=max_concurrency,
+        )
+
+
+class BraveSearchProvider(_HttpSearchProvider):
     """Web search via Brave Search API."""
 
     API_URL = "https://api.search.brave.com/res/v1/web/search"
 
     def __init__(self, api_key: str) -> None:
         self._api_key = api_key
+        self._headers = {"Accept": "application/json", "X-Subscription-Token": api_key}
 
     def search(
         self, query: str, *, max_results: int = 10, recency_days: int | None = None
@@ -31,30 +112,23 @@ class BraveSearchProvider(SearchProvider):
             else:
                 params["freshness"] = "py"
 
-        headers = {
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "X-Subscription-Token": self._api_key,
-        }
-
-        resp = httpx.get(self.API_URL, params=params, headers=headers, timeout=15)
+        resp = self._http().get(self.API_URL, params=params, headers=self._headers)
         resp.raise_for_status()
-        data = resp.json()
-
-        results: list[SearchResult] = []
-        for i, item in enumerate(data.get("web", {}).get("results", [])):
-            results.append(
-                SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    snippet=item.get("description", ""),
-                    position=i + 1,
-                )
+        data = _json.loads(resp.content)
+
+        items = islice(data.get("web", {}).get("results", []), max_results)
+        return [
+            SearchResult(
+                title=item.get("title", ""),
+                url=item.get("url", ""),
+                snippet=item.get("description", ""),
+                position=i,
             )
-        return results[:max_results]
+            for i, item in enumerate(items, 1)
+        ]
 
 
-class GoogleSearchProvider(SearchProvider):
+class GoogleSearchProvider(_HttpSearchProvider):
     """Web search via Google Custom Search JSON API."""
 
     API_URL = "https://www.googleapis.com/customsearch/v1"
@@ -62,68 +136,66 @@ class GoogleSearchProvider(SearchProvider):
     def __init__(self, api_key: str, cx: str) -> None:
         self._api_key = api_key
         self._cx = cx
+        self._base_params: dict[str, str | int] = {"key": api_key, "cx": cx}
+
+    @property
+    def identity(self) -> str:
+        return f"{self._api_key}|{self._cx}"
 
     def search(
         self, query: str, *, max_results: int = 10, recency_days: int | None = None
     ) -> list[SearchResult]:
-        params: dict[str, str | int] = {
-            "key": self._api_key,
-            "cx": self._cx,
-            "q": query,
-            "num": min(max_results, 10),
-        }
+        params = {**self._base_params, "q": query, "num": min(max_results, 10)}
         if recency_days is not None:
             params["dateRestrict"] = f"d{recency_days}"
 
-        resp = httpx.get(self.API_URL, params=params, timeout=15)
+        resp = self._http().get(self.API_URL, params=params)
         resp.raise_for_status()
-        data = resp.json()
-
-        results: list[SearchResult] = []
-        for i, item in enumerate(data.get("items", [])):
-            results.append(
-                SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("link", ""),
-                    snippet=item.get("snippet", ""),
-                    position=i + 1,
-                )
+        data = _json.loads(resp.content)
+
+        items = islice(data.get("items", []), max_results)
+        return [
+            SearchResult(
+                title=item.get("title", ""),
+                url=item.get("link", ""),
+                snippet=item.get("snippet", ""),
+                position=i,
             )
-        return results[:max_results]
+            for i, item in enumerate(items, 1)
+        ]
 
 
-class SerpAPISearchProvider(SearchProvider):
+class SerpAPISearchProvider(_HttpSearchProvider):
     """Web search via SerpAPI."""
 
     API_URL = "https://serpapi.com/search"
 
     def __init__(self, api_key: str) -> None:
         self._api_key = api_key
+        self._base_params: dict[str, str | int] = {"api_key": api_key, "engine": "google"}
+
+    @property
+    def identity(self) -> str:
+        return f"{self._api_key}|{self._base_params['engine']}"
 
     def search(
         self, query: str, *, max_results: int = 10, recency_days: int | None = None
     ) -> list[SearchResult]:
-        params: dict[str, str | int] = {
-            "api_key": self._api_key,
-            "q": query,
-            "num": min(max_results, 10),
-            "engine": "google",
-        }
+        params = {**self._base_params, "q": query, "num": min(max_results, 10)}
         if recency_days is not None:
             params["tbs"] = f"qdr:d{recency_days}"
 
-        resp = httpx.get(self.API_URL, params=params, timeout=15)
+        resp = self._http().get(self.API_URL, params=params)
         resp.raise_for_status()
-        data = resp.json()
-
-        results: list[SearchResult] = []
-        for i, item in enumerate(data.get("organic_results", [])):
-            results.append(
-                SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("link", ""),
-                    snippet=item.get("snippet", ""),
-                    position=i + 1,
-                )
+        data = _json.loads(resp.content)
+
+        items = islice(data.get("organic_results", []), max_results)
+        return [
+            SearchResult(
+                title=item.get("title", ""),
+                url=item.get("link", ""),
+                snippet=item.get("snippet", ""),
+                position=i,
             )
-        return results[:max_results]
+            for i, item in enumerate(items, 1)
+        ]
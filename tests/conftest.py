@@ -3,51 +3,116 @@
 from __future__ import annotations
 
 import json
-import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
 import pytest
 
+from research_toolkit.application.use_cases.ingest_resource import IngestRequest, IngestResource
+from research_toolkit.infrastructure.clock import WallClock
+from research_toolkit.infrastructure.filesystem_store import FilesystemStore
+from research_toolkit.infrastructure.html_snapshotter import HtmlSnapshotter
+from research_toolkit.infrastructure.jsonl_indexer import JsonlIndexer
+from research_toolkit.infrastructure.logger import ConsoleLogger
 
-@pytest.fixture
+
+_TESTS_DIR = Path(__file__).resolve().parent
+_FIXTURES_DIR = _TESTS_DIR / "fixtures"
+_RUBRICS_DIR = _TESTS_DIR.parent / "rubrics"
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Return path to the test fixtures directory."""
-    return os.path.join(os.path.dirname(__file__), "fixtures")
+    return str(_FIXTURES_DIR)
 
 
-@pytest.fixture
-def sample_ui_png(fixtures_dir):
+@pytest.fixture(scope="session")
+def sample_ui_png():
     """Return path to sample UI screenshot PNG."""
-    return os.path.join(fixtures_dir, "sample-ui.png")
+    return str(_FIXTURES_DIR / "sample-ui.png")
 
 
-@pytest.fixture
-def sample_chart_png(fixtures_dir):
+@pytest.fixture(scope="session")
+def sample_chart_png():
     """Return path to sample chart PNG."""
-    return os.path.join(fixtures_dir, "sample-chart.png")
+    return str(_FIXTURES_DIR / "sample-chart.png")
 
 
-@pytest.fixture
-def sample_report_pdf(fixtures_dir):
+@pytest.fixture(scope="session")
+def sample_report_pdf():
     """Return path to sample report PDF."""
-    return os.path.join(fixtures_dir, "sample-report.pdf")
+    return str(_FIXTURES_DIR / "sample-report.pdf")
 
 
-@pytest.fixture
-def sample_report_md(fixtures_dir):
+@pytest.fixture(scope="session")
+def sample_report_md():
     """Return path to sample markdown report."""
-    return os.path.join(fixtures_dir, "sample-report.md")
+    return str(_FIXTURES_DIR / "sample-report.md")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rubric_ui():
     """Return path to UI rubric."""
-    return os.path.join(os.path.dirname(__file__), "..", "rubrics", "ui.json")
+    return str(_RUBRICS_DIR / "ui.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rubric_docs():
     """Return path to docs rubric."""
-    return os.path.join(os.path.dirname(__file__), "..", "rubrics", "docs.json")
+    return str(_RUBRICS_DIR / "docs.json")
+
+
+# ---------------------------------------------------------------------------
+# Local library (store + indexer) and a counting text LLM
+# ---------------------------------------------------------------------------
+@dataclass
+class LocalLibrary:
+    """A fresh store and indexer under ``<tmp>/research``."""
+
+    root: Path
+    store: FilesystemStore
+    indexer: JsonlIndexer
+
+    @property
+    def deps(self) -> dict[str, Any]:
+        """Constructor arguments shared by the library use cases."""
+        return dict(store=self.store, indexer=self.indexer, clock=WallClock(), logger=ConsoleLogger(quiet=True))
+
+    def ingest(self, name: str, text: str) -> str:
+        """Write *text* to ``<tmp>/<name>``, ingest it and return the resource id."""
+        path = self.root / name
+        path.write_text(text, encoding="utf-8")
+        resp = IngestResource(snapshotter=HtmlSnapshotter(), **self.deps).execute(IngestRequest(str(path)))
+        return str(resp.resource.id)
+
+
+@pytest.fixture
+def local_library(tmp_path):
+    """Return an empty ``LocalLibrary`` in the test's tmp dir."""
+    base = tmp_path / "research"
+    store = FilesystemStore(str(base))
+    store.ensure_dirs()
+    return LocalLibrary(tmp_path, store, JsonlIndexer(str(base / "library.jsonl")))
+
+
+class CountingLLM:
+    """LLM stub that records how often it is called; replies ``"<reply> #<n>"``."""
+
+    def __init__(self, reply: str = "answer") -> None:
+        self._reply = reply
+        self.calls = 0
+
+    def complete(self, prompt: str, *, system: str = "", max_tokens: int = 2048) -> str:
+        self.calls += 1
+        return f"{self._reply} #{self.calls}"
+
+
+@pytest.fixture
+def counting_llm():
+    """Return the ``CountingLLM`` class, so tests can build as many as they need."""
+    return CountingLLM
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,53 @@
+"""Unit tests for CLI argument parsing (fast path vs argparse)."""
+
+from __future__ import annotations
+
+import pytest
+
+from research_toolkit.adapters.cli import _fast_parse, _parse_args, build_parser
+
+
+PARITY_ARGV = [
+    ["help"],
+    ["help", "review"],
+    ["spec"],
+    ["spec", "review"],
+    ["doctor", "--json", "--provider", "ollama"],
+    ["models", "--json"],
+    ["search", "quantum computing", "--max", "3", "--recency", "7d"],
+    ["search", "ai", "--recency=30d", "--json"],
+    ["ingest", "https://example.com/a", "--json"],
+    ["summarize", "abc123def456", "--format", "json", "--provider", "gemini"],
+    ["summarize", "abc123def456", "--no-cache"],
+    ["query", "what is x?", "--topk", "2", "--live"],
+    ["show", "abc123def456", "--field", "snippets", "--json"],
+    ["list"],
+    ["reindex", "--json"],
+    ["review", "shot.png", "--rubric", "r.json", "--format", "md", "--thinking", "low", "--model", "m"],
+    ["review", "shot.png", "--no-cache", "--json"],
+]
+
+
+class TestFastParse:
+    @pytest.mark.parametrize("argv", PARITY_ARGV)
+    def test_matches_argparse(self, argv):
+        assert _fast_parse(argv) is not None
+        fast = vars(_parse_args(argv))
+        slow = vars(build_parser().parse_args(argv))
+        assert fast == slow
+
+    @pytest.mark.parametrize("argv", [
+        ["search", "q", "--max", "many"],
+        ["summarize", "abc123def456", "--format", "xml"],
+        ["list", "--js"],
+        ["show", "abc123def456", "extra"],
+        ["search"],
+        ["list", "--help"],
+        ["list", "--json=yes"],
+    ])
+    def test_unusual_argv_falls_back(self, argv):
+        assert _fast_parse(argv) is None
+
+    def test_abbreviated_flag_handled_by_argparse(self):
+        args = _parse_args(["list", "--js"])
+        assert args.json is True
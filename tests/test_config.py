@@ -0,0 +1,35 @@
+"""Unit tests for configuration loading."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from research_toolkit.infrastructure.config import load_config
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # setenv records the original value, so whatever load_dotenv sets is undone too
+    monkeypatch.setenv("GEMINI_MODEL", "")
+    monkeypatch.delenv("GEMINI_MODEL")
+    return tmp_path
+
+
+def test_env_file_created_later_is_picked_up(project):
+    assert load_config()["GEMINI_MODEL"] == "gemini-2.0-flash"
+    (project / ".env").write_text("GEMINI_MODEL=gemini-from-dotenv\n", encoding="utf-8")
+    assert load_config()["GEMINI_MODEL"] == "gemini-from-dotenv"
+
+
+def test_dotenv_values_do_not_leak_between_tests():
+    assert os.environ.get("GEMINI_MODEL") != "gemini-from-dotenv"
+
+
+def test_environment_changes_are_seen_between_calls(project, monkeypatch):
+    (project / ".env").write_text("GEMINI_MODEL=gemini-from-dotenv\n", encoding="utf-8")
+    assert load_config()["GEMINI_MODEL"] == "gemini-from-dotenv"
+    monkeypatch.setenv("GEMINI_MODEL", "gemini-override")
+    assert load_config()["GEMINI_MODEL"] == "gemini-override"
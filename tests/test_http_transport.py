@@ -0,0 +1,39 @@
+"""Unit tests for the retrying httpx transport."""
+
+from __future__ import annotations
+
+import httpx
+
+from research_toolkit.infrastructure.http_transport import RetryTransport
+
+
+def _client(statuses: list[int], **kw) -> tuple[httpx.Client, list[int]]:
+    seen: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses[min(len(seen), len(statuses) - 1)]
+        seen.append(status)
+        return httpx.Response(status, json={"attempt": len(seen)})
+
+    transport = RetryTransport(httpx.MockTransport(handler), backoff=0, **kw)
+    return httpx.Client(transport=transport), seen
+
+
+def test_gateway_errors_are_retried_until_success():
+    client, seen = _client([503, 502, 200])
+    resp = client.post("https://api.example.com/chat", json={"q": 1})
+    assert resp.status_code == 200
+    assert resp.json() == {"attempt": 3}
+    assert seen == [503, 502, 200]
+
+
+def test_last_failure_is_returned_after_all_attempts():
+    client, seen = _client([504], attempts=2)
+    assert client.get("https://api.example.com/").status_code == 504
+    assert len(seen) == 2
+
+
+def test_other_errors_are_not_retried():
+    client, seen = _client([500, 200])
+    assert client.get("https://api.example.com/").status_code == 500
+    assert seen == [500]
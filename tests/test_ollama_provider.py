@@ -0,0 +1,84 @@
+"""Unit tests for the Ollama provider against a mocked daemon."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from research_toolkit.infrastructure import ollama_provider
+from research_toolkit.infrastructure.ollama_provider import OllamaProvider
+
+
+def _provider(handler) -> OllamaProvider:
+    provider = OllamaProvider(model="big", host="http://ollama.test")
+    provider._client = httpx.Client(base_url="http://ollama.test", transport=httpx.MockTransport(handler))
+    return provider
+
+
+def _done(content: str) -> bytes:
+    return json.dumps({"message": {"content": content}, "done": True, "eval_count": 1}).encode() + b"\n"
+
+
+@pytest.fixture(autouse=True)
+def no_model_cache(monkeypatch):
+    monkeypatch.setattr(ollama_provider, "_MODELS_CACHE", {})
+
+
+def test_out_of_memory_falls_back_to_smallest_model():
+    chats: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": [{"name": "big", "size": 9e9}, {"name": "small", "size": 2e9}]})
+        model = json.loads(request.content)["model"]
+        chats.append(model)
+        if model == "big":
+            # A long error body: only its head is read
+            error = {"error": "model requires more system memory (9 GiB) than is available"}
+            return httpx.Response(500, content=json.dumps(error).encode() + b" " * 100_000)
+        return httpx.Response(200, content=_done("hello"))
+
+    assert _provider(handler).complete("hi") == "hello"
+    assert chats == ["big", "small"]
+
+
+def test_other_server_errors_are_raised():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={"error": "model not found"})
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        _provider(handler).complete("hi")
+    assert b"model not found" in exc_info.value.response.content
+
+
+def test_only_successful_probes_are_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(ollama_provider, "_PROBE_CACHE", {})
+    up = False
+
+    def fake_get(url, timeout):
+        if not up:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(200, json={"models": []})
+
+    monkeypatch.setattr(ollama_provider.httpx, "get", fake_get)
+    assert OllamaProvider.is_available("http://ollama.test") is False
+    up = True  # the daemon comes up: noticed on the very next probe
+    assert OllamaProvider.is_available("http://ollama.test") is True
+    up = False  # a fresh success is reused for PROBE_TTL seconds
+    assert OllamaProvider.is_available("http://ollama.test") is True
+    assert list(tmp_path.iterdir()) == []  # nothing written outside the process
+
+
+def test_listed_models_keep_the_public_fields(monkeypatch):
+    tags = {"models": [{"name": "small", "size": 2e9, "details": {"family": "llama"}}]}
+
+    def fake_get(url, timeout):
+        return httpx.Response(200, json=tags, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(ollama_provider.httpx, "get", fake_get)
+    [model] = OllamaProvider.list_models("http://ollama.test")
+    assert set(model) == {"name", "size", "family", "params", "quant"}
+    assert model["size"] == "2.0 GB"
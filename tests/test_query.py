@@ -0,0 +1,29 @@
+"""Unit tests for the local search that QueryLibrary ranks sources with."""
+
+from __future__ import annotations
+
+import pytest
+
+
+MORE_QUBITS = "# More qubits\n\nError correction for qubits.\n"
+
+
+@pytest.fixture
+def library(local_library):
+    local_library.ingest("quantum.md", "# Quantum computing\n\nQubits decohere quickly.\n")
+    return local_library
+
+
+class TestLocalSearchCache:
+    def test_ingest_invalidates_cached_ranking(self, library):
+        indexer = library.indexer
+        first = indexer.search_local("qubits")
+        assert indexer.search_local("qubits") == first
+        assert len(first) == 1
+
+        library.ingest("more.md", MORE_QUBITS)
+        assert len(indexer.search_local("qubits")) == 2
+
+    def test_returned_list_is_a_copy(self, library):
+        library.indexer.search_local("qubits").clear()
+        assert len(library.indexer.search_local("qubits")) == 1
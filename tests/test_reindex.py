@@ -0,0 +1,106 @@
+"""Unit tests for the Reindex use case."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from research_toolkit.application.use_cases import reindex as reindex_mod
+from research_toolkit.application.use_cases.reindex import Reindex
+from research_toolkit.domain.title_extract import EXTRACTOR_VERSION
+from research_toolkit.domain.value_objects import ResourceId
+from research_toolkit.infrastructure.jsonl_indexer import JsonlIndexer
+from research_toolkit.infrastructure.logger import ConsoleLogger
+
+
+@pytest.fixture
+def library(local_library, monkeypatch):
+    # One resource per batch exercises the streaming path
+    monkeypatch.setattr(reindex_mod, "_BATCH", 1)
+    ids = [
+        local_library.ingest("a.md", "# Alpha heading\n\nqubits"),
+        local_library.ingest("b.md", "# Beta heading\n\nphotons"),
+    ]
+    return local_library.root / "research", local_library.store, local_library.indexer, ids
+
+
+def test_reindex_fixes_titles_and_rebuilds_library(library):
+    base, store, indexer, ids = library
+    result = Reindex(store, indexer, ConsoleLogger(quiet=True)).execute()
+
+    assert result.total == 2
+    assert result.titles_fixed == 2  # ingest titled them by file name
+    assert result.errors == []
+    with open(base / "library.jsonl", encoding="utf-8") as f:
+        titles = sorted(json.loads(line)["title"] for line in f)
+    assert titles == ["Alpha heading", "Beta heading"]
+    assert not os.path.exists(base / "library.jsonl.tmp")
+    assert [str(r) for r in indexer.search_local("photons")] == [ids[1]]
+
+
+def test_reindex_records_broken_meta(library):
+    base, store, indexer, _ = library
+    broken = base / "resources" / "broken"
+    broken.mkdir()
+    (broken / "meta.json").write_text("{bad", encoding="utf-8")
+    (base / "resources" / "no-meta").mkdir()
+
+    result = Reindex(store, indexer, ConsoleLogger(quiet=True)).execute()
+
+    assert result.total == 3
+    assert len(result.errors) == 1 and result.errors[0].startswith("broken:")
+    assert len(indexer.list_all()) == 2
+
+
+def test_reindex_skips_meta_that_is_not_an_object(library):
+    base, store, indexer, _ = library
+    listed = base / "resources" / "listed"
+    listed.mkdir()
+    (listed / "meta.json").write_text("[1, 2]", encoding="utf-8")
+
+    result = Reindex(store, indexer, ConsoleLogger(quiet=True)).execute()
+
+    assert result.total == 3
+    assert len(result.errors) == 1 and result.errors[0].startswith("listed:")
+    assert len(indexer.list_all()) == 2
+
+
+def test_second_reindex_skips_stamped_titles(library):
+    base, store, indexer, ids = library
+    Reindex(store, indexer, ConsoleLogger(quiet=True)).execute()
+    meta_path = base / "resources" / ids[0] / "meta.json"
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    assert meta["title_extractor_version"] == EXTRACTOR_VERSION
+
+    # A stamped title is trusted and not re-derived from content
+    meta["title"] = "Curated title"
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    result = Reindex(store, indexer, ConsoleLogger(quiet=True)).execute()
+
+    assert result.titles_fixed == 0
+    assert store.load_resource(ResourceId(ids[0])).title == "Curated title"
+    assert [str(r) for r in indexer.search_local("qubits")] == [ids[0]]
+
+
+def test_unchanged_title_is_stamped_once(local_library):
+    rid = local_library.ingest("plain.md", "plain.md\n\nFirst line matches the file name.")
+    meta_path = local_library.root / "research" / "resources" / rid / "meta.json"
+    reindex = Reindex(local_library.store, local_library.indexer, ConsoleLogger(quiet=True))
+
+    assert reindex.execute().titles_fixed == 0
+    stamped = meta_path.read_bytes()
+    assert json.loads(stamped)["title_extractor_version"] == EXTRACTOR_VERSION
+
+    reindex.execute()
+    assert meta_path.read_bytes() == stamped
+
+
+def test_fresh_indexer_sees_edited_content(library):
+    base, _, _, ids = library
+    content = base / "resources" / ids[1] / "content.md"
+    content.write_text("# Beta heading\n\nneutrinos", encoding="utf-8")
+    fresh = JsonlIndexer(str(base / "library.jsonl"))
+    assert [str(r) for r in fresh.search_local("neutrinos")] == [ids[1]]
+    assert fresh.search_local("photons") == []
@@ -15,6 +15,7 @@ from research_toolkit.application.use_cases.review_artifact import (
     detect_mime,
     DEFAULT_RUBRIC,
 )
+from research_toolkit.application.ports import LLMUsage
 from research_toolkit.domain.review_entities import (
     ReviewReport,
     ReviewIssue,
@@ -24,6 +25,7 @@ from research_toolkit.domain.review_entities import (
 from research_toolkit.infrastructure.filesystem_store import FilesystemStore
 from research_toolkit.infrastructure.clock import WallClock
 from research_toolkit.infrastructure.logger import ConsoleLogger
+from research_toolkit.infrastructure.review_cache import FilesystemReviewCache
 
 # conftest.py is auto-loaded by pytest but not directly importable;
 # import via the tests package instead.
@@ -67,6 +69,20 @@ class TestMimeDetection:
         result = detect_mime("file.xyz")
         assert isinstance(result, str)
 
+    def test_sniffs_files_without_extension(self, tmp_path):
+        notes = tmp_path / "NOTES"
+        notes.write_text("plain text notes\n", encoding="utf-8")
+        shot = tmp_path / "screenshot"
+        shot.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\0" * 16)
+        blob = tmp_path / "blob"
+        blob.write_bytes(b"\x00\x01\x02\xff")
+        assert detect_mime(str(notes)) == "text/plain"
+        assert detect_mime(str(shot)) == "image/png"
+        assert detect_mime(str(blob)) == "application/octet-stream"
+
+    def test_head_is_used_instead_of_reading(self):
+        assert detect_mime("/nonexistent/upload", head=b"%PDF-1.7") == "application/pdf"
+
 
 # ---------------------------------------------------------------------------
 # Domain entity tests
@@ -176,6 +192,22 @@ class TestReviewArtifactUseCase:
         assert "Visual Hierarchy" in prompt
         assert "Accessibility" in prompt
 
+    def test_edited_rubric_is_reloaded(self, sample_ui_png, tmp_path):
+        uc, mock_llm = self._make_uc(tmp_path)
+        rubric_path = tmp_path / "rubric.json"
+        rubric = {"name": "r", "criteria": [{"id": "c1", "name": "First pass", "weight": 1.0, "description": "d"}]}
+        rubric_path.write_text(json.dumps(rubric), encoding="utf-8")
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png, rubric_path=str(rubric_path), use_cache=False))
+
+        rubric["criteria"][0]["name"] = "Second pass"
+        rubric_path.write_text(json.dumps(rubric), encoding="utf-8")
+        st = os.stat(rubric_path)
+        os.utime(rubric_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png, rubric_path=str(rubric_path), use_cache=False))
+
+        assert "First pass" in mock_llm.calls[0]["prompt"]
+        assert "Second pass" in mock_llm.calls[1]["prompt"]
+
     def test_review_stores_output(self, sample_ui_png, tmp_path):
         uc, _ = self._make_uc(tmp_path)
         req = ReviewRequest(artifact_path=sample_ui_png)
@@ -197,6 +229,41 @@ class TestReviewArtifactUseCase:
         assert data["overall_score"] == 72
         assert data["pass"] is True
 
+    def test_large_text_is_truncated_in_prompt(self, tmp_path):
+        doc = tmp_path / "big.md"
+        doc.write_text("x" * 40_000, encoding="utf-8")
+        uc, mock_llm = self._make_uc(tmp_path)
+        uc.execute(ReviewRequest(artifact_path=str(doc)))
+
+        prompt = mock_llm.calls[0]["prompt"]
+        assert "x" * 30_000 in prompt
+        assert "x" * 30_001 not in prompt
+        assert "[... content truncated ...]" in prompt
+
+    def test_archived_input_survives_edits_to_the_original(self, sample_report_pdf, tmp_path):
+        artifact = tmp_path / "report.pdf"  # same device as the review dir
+        with open(sample_report_pdf, "rb") as f:
+            original = f.read()
+        artifact.write_bytes(original)
+        uc, _ = self._make_uc(tmp_path)
+        resp = uc.execute(ReviewRequest(artifact_path=str(artifact)))
+
+        with open(artifact, "r+b") as f:  # edited in place, same inode
+            f.write(b"changed")
+        stored = os.path.join(resp.review_dir, "input", "report.pdf")
+        with open(stored, "rb") as f:
+            assert f.read() == original
+
+    def test_token_usage_is_recorded_in_model_meta(self, sample_ui_png, tmp_path):
+        uc, mock_llm = self._make_uc(tmp_path)
+        mock_llm.last_usage = LLMUsage(prompt_tokens=1000, cached_tokens=750, completion_tokens=200)
+        resp = uc.execute(ReviewRequest(artifact_path=sample_ui_png))
+
+        with open(os.path.join(resp.review_dir, "traces", "model_meta.json")) as f:
+            meta = json.load(f)
+        assert meta["usage"] == {"prompt_tokens": 1000, "cached_tokens": 750, "completion_tokens": 200}
+        assert mock_llm.last_usage.describe().startswith("tokens: prompt=1000 cached=750 (75% hit)")
+
     def test_review_nonexistent_file(self, tmp_path):
         uc, _ = self._make_uc(tmp_path)
         req = ReviewRequest(artifact_path="/nonexistent/file.png")
@@ -219,6 +286,13 @@ class TestReviewArtifactUseCase:
         assert resp.report.passed is False
         assert "parse failure" in resp.report.issues[0].title.lower()
 
+    def test_json_embedded_in_prose_is_extracted(self, sample_ui_png, tmp_path):
+        wrapped = "Here is my {review}:\n" + MOCK_REVIEW_JSON + "\nHope this helps }"
+        uc, _ = self._make_uc(tmp_path, mock_response=wrapped)
+        resp = uc.execute(ReviewRequest(artifact_path=sample_ui_png))
+        assert resp.report.overall_score == 72
+        assert len(resp.report.issues) == 3
+
     def test_report_json_has_correct_schema(self, sample_ui_png, tmp_path):
         """Verify the JSON output matches required schema fields."""
         uc, _ = self._make_uc(tmp_path)
@@ -248,3 +322,49 @@ class TestReviewArtifactUseCase:
         req = ReviewRequest(artifact_path=sample_ui_png, thinking="high")
         uc.execute(req)
         assert mock_llm.calls[0]["thinking"] == "high"
+
+
+# ---------------------------------------------------------------------------
+# Review cache tests
+# ---------------------------------------------------------------------------
+class TestReviewCache:
+    def _make_uc(self, tmpdir, mock_response=MOCK_REVIEW_JSON):
+        store = FilesystemStore(str(tmpdir))
+        store.ensure_dirs()
+        mock_llm = MockMultimodalProvider(response=mock_response)
+        uc = ReviewArtifact(
+            llm=mock_llm,
+            store=store,
+            clock=WallClock(),
+            logger=ConsoleLogger(),
+            cache=FilesystemReviewCache(str(tmpdir)),
+        )
+        return uc, mock_llm
+
+    def test_identical_review_is_served_from_cache(self, sample_ui_png, tmp_path):
+        uc, mock_llm = self._make_uc(tmp_path)
+        first = uc.execute(ReviewRequest(artifact_path=sample_ui_png))
+        second = uc.execute(ReviewRequest(artifact_path=sample_ui_png))
+
+        assert len(mock_llm.calls) == 1
+        assert second.report.overall_score == first.report.overall_score
+        assert second.report.artifact.path == first.report.artifact.path
+
+    def test_changed_inputs_miss_cache(self, sample_ui_png, rubric_ui, tmp_path):
+        uc, mock_llm = self._make_uc(tmp_path)
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png))
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png, rubric_path=rubric_ui))
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png, thinking="high"))
+        assert len(mock_llm.calls) == 3
+
+    def test_use_cache_false_bypasses_cache(self, sample_ui_png, tmp_path):
+        uc, mock_llm = self._make_uc(tmp_path)
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png))
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png, use_cache=False))
+        assert len(mock_llm.calls) == 2
+
+    def test_parse_failure_is_not_cached(self, sample_ui_png, tmp_path):
+        uc, mock_llm = self._make_uc(tmp_path, mock_response="not json at all")
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png))
+        uc.execute(ReviewRequest(artifact_path=sample_ui_png))
+        assert len(mock_llm.calls) == 2
@@ -0,0 +1,203 @@
+"""Unit tests for the RunSearch use case with stubbed search and snapshots."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+from research_toolkit.application.use_cases.run_search import RunSearch, RunSearchRequest
+from research_toolkit.domain.entities import SearchResult
+from research_toolkit.infrastructure.clock import WallClock
+from research_toolkit.infrastructure.filesystem_store import FilesystemStore
+from research_toolkit.infrastructure.jsonl_indexer import JsonlIndexer
+from research_toolkit.infrastructure.logger import ConsoleLogger
+from research_toolkit.infrastructure.search_cache import CachedSearchProvider
+from research_toolkit.infrastructure.web_search_provider import BraveSearchProvider, GoogleSearchProvider
+
+
+class StubSearch:
+    def __init__(self, urls: list[str]) -> None:
+        self._urls = urls
+
+    def search(self, query, *, max_results=10, recency_days=None):
+        return [
+            SearchResult(title=f"Result {i}", url=url, snippet=f"snippet {i}", position=i)
+            for i, url in enumerate(self._urls)
+        ]
+
+
+class SlowSnapshotter:
+    """Sleeps per capture and records the peak number of concurrent captures."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._active = 0
+        self.peak = 0
+        self.captured: list[str] = []
+
+    def capture(self, url):
+        with self._lock:
+            self.captured.append(url)
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        time.sleep(self._delay)
+        with self._lock:
+            self._active -= 1
+        if url.endswith("/empty"):
+            return "", None
+        return f"# Page {url}\n\nBody of {url}.\n", "<html></html>"
+
+
+def _run(tmp_path, urls, snap, **kw):
+    """Run one search against the library under *tmp_path* (reused across calls)."""
+    base = tmp_path / "research"
+    store = FilesystemStore(str(base))
+    store.ensure_dirs()
+    indexer = JsonlIndexer(os.path.join(str(base), "library.jsonl"))
+    uc = RunSearch(
+        search_provider=StubSearch(urls),
+        snapshotter=snap,
+        store=store,
+        indexer=indexer,
+        clock=WallClock(),
+        logger=ConsoleLogger(quiet=True),
+    )
+    return uc.execute(RunSearchRequest(query="q", **kw)), indexer
+
+
+class TestRunSearch:
+    def test_results_keep_search_order(self, tmp_path):
+        urls = [f"https://example.com/{i}" for i in range(6)]
+        snap = SlowSnapshotter()
+        resp, indexer = _run(tmp_path, urls, snap)
+
+        assert [str(r.url) for r in resp.resources] == urls
+        assert len(indexer.list_all()) == 6
+        assert snap.peak > 1
+
+    def test_concurrency_one_is_serial(self, tmp_path):
+        snap = SlowSnapshotter(delay=0.01)
+        _run(tmp_path, [f"https://example.com/{i}" for i in range(3)], snap, concurrency=1)
+        assert snap.peak == 1
+
+    def test_repeated_url_is_stored_once(self, tmp_path):
+        urls = ["https://example.com/a", "https://example.com/b", "https://example.com/a"]
+        resp, indexer = _run(tmp_path, urls, SlowSnapshotter())
+
+        assert [str(r.url) for r in resp.resources] == urls
+        assert resp.skipped == 1
+        assert len(indexer.list_all()) == 2
+
+    def test_empty_snapshot_falls_back_to_snippet(self, tmp_path):
+        resp, _ = _run(tmp_path, ["https://example.com/empty"], SlowSnapshotter(delay=0))
+        assert resp.skipped == 0
+        assert len(resp.resources) == 1
+
+    def test_stored_urls_are_not_fetched_again(self, tmp_path):
+        urls = [f"https://example.com/{i}" for i in range(3)]
+        _run(tmp_path, urls, SlowSnapshotter(delay=0))
+        snap = SlowSnapshotter(delay=0)
+        resp, _ = _run(tmp_path, urls + ["https://example.com/new"], snap)
+
+        assert snap.captured == ["https://example.com/new"]
+        assert resp.skipped == 3
+        assert [str(r.url) for r in resp.resources] == urls + ["https://example.com/new"]
+
+    def test_library_has_a_line_per_stored_result(self, tmp_path):
+        base = tmp_path / "research"
+        store = FilesystemStore(str(base))
+        uc = RunSearch(
+            search_provider=StubSearch([f"https://example.com/{i}" for i in range(3)]),
+            snapshotter=SlowSnapshotter(delay=0),
+            store=store,
+            indexer=JsonlIndexer(os.path.join(str(base), "library.jsonl")),
+            clock=WallClock(),
+            logger=ConsoleLogger(quiet=True),
+        )
+        uc.execute(RunSearchRequest(query="q"))
+
+        lines = (base / "library.jsonl").read_bytes().splitlines()
+        assert len(lines) == 3
+
+
+class CannedBrave(BraveSearchProvider):
+    """Brave provider answering from a dict instead of the API."""
+
+    def __init__(self, answers: dict[str, list[str]]) -> None:
+        super().__init__(api_key="test")
+        self._answers = answers
+
+    def search(self, query, *, max_results=10, recency_days=None):
+        time.sleep(0.01)
+        return StubSearch(self._answers[query]).search(query)
+
+
+class TestSearchMany:
+    ANSWERS = {
+        "a": ["https://example.com/1", "https://example.com/2"],
+        "b": ["https://example.com/2", "https://example.com/3"],
+    }
+
+    def test_results_follow_query_order(self):
+        provider = CannedBrave(self.ANSWERS)
+        batches = provider.search_many(["a", "b"])
+
+        # Each query keeps its own results, even where they overlap
+        assert [[r.url for r in batch] for batch in batches] == [self.ANSWERS["a"], self.ANSWERS["b"]]
+        assert provider.search_many([]) == []
+
+    def test_cached_provider_searches_many(self, tmp_path):
+        inner = CountingSearch(["https://example.com/1"])
+        provider = CachedSearchProvider(inner, str(tmp_path))
+        first = provider.search_many(["a", "b"])
+        assert provider.search_many(["b", "a"]) == first[::-1]
+        assert inner.calls == 2
+
+
+class CountingSearch(StubSearch):
+    def __init__(self, urls: list[str]) -> None:
+        super().__init__(urls)
+        self.calls = 0
+
+    def search(self, query, *, max_results=10, recency_days=None):
+        self.calls += 1
+        return super().search(query, max_results=max_results, recency_days=recency_days)
+
+
+class TestSearchCache:
+    def test_identical_search_is_served_from_disk(self, tmp_path):
+        inner = CountingSearch(["https://example.com/1"])
+        first = CachedSearchProvider(inner, str(tmp_path)).search("q")
+        again = CachedSearchProvider(inner, str(tmp_path)).search("q")
+
+        assert inner.calls == 1
+        assert again == first
+        CachedSearchProvider(inner, str(tmp_path)).search("q", max_results=3)
+        assert inner.calls == 2
+
+    def test_recency_bounded_search_is_not_cached(self, tmp_path):
+        inner = CountingSearch(["https://example.com/1"])
+        cached = CachedSearchProvider(inner, str(tmp_path))
+        cached.search("q", recency_days=1)
+        cached.search("q", recency_days=1)
+        assert inner.calls == 2
+
+    def test_engines_do_not_share_entries(self, tmp_path):
+        assert GoogleSearchProvider("key", "engine-a").identity != GoogleSearchProvider("key", "engine-b").identity
+        first = CountingSearch(["https://example.com/a"])
+        second = CountingSearch(["https://example.com/b"])
+        first.identity, second.identity = "key|engine-a", "key|engine-b"
+        CachedSearchProvider(first, str(tmp_path)).search("q")
+        results = CachedSearchProvider(second, str(tmp_path)).search("q")
+        assert second.calls == 1
+        assert [r.url for r in results] == ["https://example.com/b"]
+        assert [p.suffix for p in (tmp_path / "cache" / "searches").iterdir()] == [".json", ".json"]
+
+    def test_expired_entry_searches_again(self, tmp_path):
+        inner = CountingSearch(["https://example.com/1"])
+        cached = CachedSearchProvider(inner, str(tmp_path), ttl=0)
+        cached.search("q")
+        cached.search("q")
+        assert inner.calls == 2
@@ -0,0 +1,84 @@
+"""Unit tests for the SummarizeResource use case and its summary cache."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from research_toolkit.application.use_cases import summarize_resource
+from research_toolkit.application.use_cases.summarize_resource import (
+    SummarizeRequest,
+    SummarizeResource,
+    truncate_to_tokens,
+)
+from research_toolkit.domain.value_objects import ResourceId
+from research_toolkit.infrastructure.logger import ConsoleLogger
+
+
+@pytest.fixture
+def stored(local_library):
+    rid = local_library.ingest("notes.md", "# Notes\n\nSome findings worth summarizing.\n")
+    return local_library, rid
+
+
+def _summarize(stored, llm, **kw):
+    library, rid = stored
+    uc = SummarizeResource(store=library.store, indexer=library.indexer, llm=llm, logger=ConsoleLogger(quiet=True))
+    return uc.execute(SummarizeRequest(resource_id=rid, **kw))
+
+
+class TestSummaryCache:
+    def test_unchanged_content_reuses_summary(self, stored, counting_llm):
+        llm = counting_llm("summary")
+        first = _summarize(stored, llm)
+        second = _summarize(stored, llm, format="json")
+        assert llm.calls == 1
+        assert second.summary.text == first.summary.text
+        assert second.summary.format == "json"
+        assert second.summary.citations[0].excerpt == "summary #1"
+
+    def test_model_change_misses_cache(self, stored, counting_llm):
+        llm = counting_llm("summary")
+        llm.model = "qwen2.5:3b"
+        _summarize(stored, llm)
+        llm.model = "llama3.1"
+        resp = _summarize(stored, llm)
+        assert llm.calls == 2
+        assert resp.summary.text == "summary #2"
+
+    def test_title_change_misses_cache(self, stored, counting_llm):
+        library, rid = stored
+        llm = counting_llm("summary")
+        _summarize(stored, llm)
+        resource = library.store.load_resource(ResourceId(rid))
+        library.store.save_resource(replace(resource, title="Fixed title"), library.store.load_content(resource.id))
+        resp = _summarize(stored, llm)
+        assert llm.calls == 2
+        assert resp.summary.text == "summary #2"
+
+    def test_use_cache_false_calls_model(self, stored, counting_llm):
+        llm = counting_llm("summary")
+        _summarize(stored, llm)
+        resp = _summarize(stored, llm, use_cache=False)
+        assert llm.calls == 2
+        assert resp.summary.text == "summary #2"
+
+
+class TestTruncateToTokens:
+    @pytest.fixture(autouse=True)
+    def _heuristic(self, monkeypatch):
+        monkeypatch.setattr(summarize_resource, "_encoder", lambda: None)
+
+    def test_short_text_is_untouched(self):
+        assert truncate_to_tokens("a short note", 100) == ("a short note", False)
+
+    def test_ascii_gets_four_chars_per_token(self):
+        text, cut = truncate_to_tokens("a" * 1000, 100)
+        assert cut
+        assert len(text) == 400
+
+    def test_non_ascii_counts_a_token_per_char(self):
+        text, cut = truncate_to_tokens("漢" * 1000, 100)
+        assert cut
+        assert len(text) == 100
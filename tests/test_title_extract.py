@@ -0,0 +1,27 @@
+"""Unit tests for markdown title extraction."""
+
+from __future__ import annotations
+
+import pytest
+
+from research_toolkit.domain.title_extract import MAX_SCAN_LINES, extract_title
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("---\ntitle: 'Quoted'\n---\n# Heading\n", "Quoted"),
+        ("---\nauthor: x\n---\n\n# Heading\n", "Heading"),
+        ("+++\ntitle:\n+++\nFirst line\n", "First line"),
+        ("\n\n# Heading\nbody", "Heading"),
+        ("x" * 250 + "\nShort line", "Short line"),
+        ("", "fallback"),
+    ],
+)
+def test_extract_title(content, expected):
+    assert extract_title(content, "fallback") == expected
+
+
+def test_scan_is_bounded():
+    content = "\n" * MAX_SCAN_LINES + "# Too late\n"
+    assert extract_title(content, "fallback") == "fallback"